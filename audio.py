@@ -1,47 +1,53 @@
-import pygame
+from classes.som import GerenciadorAudio
+
+# Trilha de fundo (tocada em streaming, sem decodificar o arquivo todo)
+TRILHA = "sons/sons/trilha.mp3"
+
+# Categorias de efeitos: (canais reservados, intervalo mínimo em s entre
+# dois disparos do mesmo efeito). O passo da raposa toca a cada tecla e
+# fica limitado a 2 vozes; troca de fase e game over têm canais próprios.
+CATEGORIAS = {
+    "movimento": (2, 0.08),
+    "eventos": (2, 0.0),
+    "alertas": (1, 0.0),
+}
+
+# Efeitos sonoros: (chave, arquivo, volume, categoria)
+EFEITOS = [
+    ("som_start", "sons/sons/start.mp3", 0.8, "eventos"),
+    ("som_movimento", "sons/sons/raposa.mp3", 0.3, "movimento"),
+    ("som_troca_fase", "sons/sons/fases.mp3", 0.8, "eventos"),
+    ("som_game_over", "sons/sons/game_over.mp3", 1.0, "alertas"),
+]
+
+
+def init_audio(base_dir, efeitos=True):
+    """
+    Inicializa o áudio e começa a tocar a música de fundo.
+    Retorna o `GerenciadorAudio` (classes/som.py) usado para tocar os sons.
+
+    Com efeitos=False os efeitos sonoros ainda não estão prontos e devem ser
+    carregados depois com `carregar_efeitos` (por exemplo, em uma thread de
+    fundo, para não atrasar o primeiro quadro do menu).
+    """
+
+    audio = GerenciadorAudio(CATEGORIAS)
+    audio.abrir(base_dir + "/" + TRILHA, volume_musica=0.5)
+
+    if efeitos:
+        carregar_efeitos(audio, base_dir)
+    return audio
+
 
-def init_audio(base_dir):
+def carregar_efeitos(audio, base_dir):
     """
-    Inicializa o áudio e carrega todos os sons e música.
-    Retorna um dicionário com os objetos carregados.
+    Decodifica os efeitos sonoros no gerenciador `audio`.
+    Cada efeito passa a tocar assim que fica pronto; até lá, `audio.tocar`
+    simplesmente o ignora.
     """
 
-    pygame.mixer.init()
-    pygame.mixer.set_num_channels(16)
-
-    audio = {
-        "musica_loaded": False,
-        "som_movimento": None,
-        "som_start": None,
-        "som_troca_fase": None,
-        "som_game_over": None
-    }
-
-    def p(caminho):
-        return base_dir + "/" + caminho  # Substituição simples para os.path.join
-
-    # Música de fundo
-    trilha_path = p("sons/sons/trilha.mp3")
-    pygame.mixer.music.load(trilha_path)
-    pygame.mixer.music.set_volume(0.5)
-    pygame.mixer.music.play(-1)
-    audio["musica_loaded"] = True
-
-    # Efeitos sonoros
-    som_movimento = pygame.mixer.Sound(p("sons/sons/raposa.mp3"))
-    som_start = pygame.mixer.Sound(p("sons/sons/start.mp3"))
-    som_troca_fase = pygame.mixer.Sound(p("sons/sons/fases.mp3"))
-    som_game_over = pygame.mixer.Sound(p("sons/sons/game_over.mp3"))
-
-    som_movimento.set_volume(0.3)
-    som_start.set_volume(0.8)
-    som_troca_fase.set_volume(0.8)
-    som_game_over.set_volume(1.0)
-
-    audio["som_movimento"] = som_movimento
-    audio["som_start"] = som_start
-    audio["som_troca_fase"] = som_troca_fase
-    audio["som_game_over"] = som_game_over
+    for chave, arquivo, volume, categoria in EFEITOS:
+        audio.carregar(chave, base_dir + "/" + arquivo, volume, categoria)
 
     print("Áudio carregado com sucesso!")
-    return audio
\ No newline at end of file
+    return audio
@@ -0,0 +1,133 @@
+"""
+Gera o atlas de sprites e o cache de sons do jogo Running Fox (passo de
+build, offline).
+
+Instancia as classes que carregam sprites (Inimigos, Raposa, HUD e a tela
+Start) com o driver de vídeo "dummy", de modo que cada sprite passa pelo
+cache de `classes/assets.py` exatamente no tamanho usado em jogo (as
+constantes TAMANHO_* de cada módulo). Em seguida empacota todas essas
+superfícies com alpha em uma única imagem e grava um índice JSON:
+
+- imagens_pygame/atlas.png: todos os sprites já escalados
+- imagens_pygame/atlas.json: retângulo de cada sprite, tamanho original e
+  assinatura (tamanho, mtime e hash do conteúdo) de cada PNG de origem
+
+Em tempo de execução `carregar_imagem` recorta os sprites do atlas e só
+volta aos PNGs originais para arquivos alterados depois do bake. Fundos
+opacos (950x880) não entram no atlas.
+
+Os efeitos sonoros (`audio.EFEITOS`) são decodificados uma vez e gravados
+em sons/cache/ como WAV no formato do mixer (ver `classes/cache_sons.py`);
+o jogo passa a abri-los sem decodificar os MP3.
+
+Uso: python bake_assets.py
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes import assets, cache_sons
+
+
+LARGURA_ATLAS = 1024
+ESPACAMENTO = 1  # pixels vazios entre sprites
+
+
+def coletar_sprites(janela):
+    """Carrega os sprites do jogo via cache e retorna as entradas com alpha."""
+    from classes.enemies import Inimigos
+    from classes.player import Raposa
+    from classes.hud import HUD
+    from screens import GameStateManager, Start
+
+    Inimigos()
+    Raposa()
+    HUD(janela, None)
+    Start(janela, GameStateManager("start"))
+
+    sprites = {}
+    for (caminho, tamanho, alpha, suave), img in assets.entradas_cache().items():
+        if alpha:
+            sprites[(caminho, tamanho, suave)] = img
+    return sprites
+
+
+def empacotar(sprites):
+    """Distribui os sprites em prateleiras (shelf packing) por altura.
+
+    Retorna (posicoes, altura_total), com posicoes[chave] = (x, y, w, h).
+    """
+    ordem = sorted(sprites, key=lambda chave: sprites[chave].get_height(), reverse=True)
+    posicoes = {}
+    x = y = altura_prateleira = 0
+    for chave in ordem:
+        w, h = sprites[chave].get_size()
+        if x + w > LARGURA_ATLAS:
+            # Prateleira cheia: começa outra abaixo
+            x = 0
+            y += altura_prateleira + ESPACAMENTO
+            altura_prateleira = 0
+        posicoes[chave] = (x, y, w, h)
+        x += w + ESPACAMENTO
+        altura_prateleira = max(altura_prateleira, h)
+    return posicoes, y + altura_prateleira
+
+
+def converter_sons():
+    """Grava a cópia PCM de cada efeito sonoro; retorna quantos converteu."""
+    from audio import EFEITOS
+
+    # Mesmo formato padrão do mixer aberto pelo jogo (`GerenciadorAudio.abrir`)
+    pygame.mixer.init()
+    convertidos = 0
+    for _, arquivo, _, _ in EFEITOS:
+        try:
+            destino = cache_sons.converter(arquivo)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"⚠️ Som {arquivo} não convertido: {e}")
+            continue
+        print(f"🔊 {arquivo} -> {destino}")
+        convertidos += 1
+    return convertidos
+
+
+def main():
+    pygame.init()
+    janela = pygame.display.set_mode((950, 880))
+
+    # Remove o atlas antigo para que os sprites venham dos PNGs originais
+    for caminho in (assets.ATLAS_IMAGEM, assets.ATLAS_INDICE):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    assets.invalidar()
+
+    sprites = coletar_sprites(janela)
+    posicoes, altura = empacotar(sprites)
+
+    atlas = pygame.Surface((LARGURA_ATLAS, altura), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    indice = {"sprites": {}, "originais": {}, "fontes": {}}
+    for (caminho, tamanho, suave), (x, y, w, h) in posicoes.items():
+        # BLEND_RGBA_MAX sobre fundo zerado copia os pixels sem misturar o alpha
+        atlas.blit(sprites[(caminho, tamanho, suave)], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        indice["sprites"][assets.chave_atlas(caminho, tamanho, suave)] = [x, y, w, h]
+        if caminho not in indice["fontes"]:
+            indice["originais"][caminho] = list(assets.tamanho_original(caminho))
+            indice["fontes"][caminho] = assets.assinatura_arquivo(caminho)
+
+    pygame.image.save(atlas, assets.ATLAS_IMAGEM)
+    with open(assets.ATLAS_INDICE, "w", encoding="utf-8") as arquivo:
+        json.dump(indice, arquivo, ensure_ascii=False, indent=1, sort_keys=True)
+
+    print(f"✅ Atlas gerado: {len(posicoes)} sprites em {LARGURA_ATLAS}x{altura} -> {assets.ATLAS_IMAGEM}")
+    print(f"✅ Cache de sons: {converter_sons()} efeito(s) em {cache_sons.PASTA_CACHE}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Benchmarks dos caminhos quentes do Running Fox (simulação e desenho).
+
+Roda sem janela (driver de vídeo "dummy") e mede:
+- pistas_faseN: ticks/s de `MundoFazenda.atualizar_plataformas` na fase N
+- colisao_faseN: ticks/s de `raposa_colidiu_com_objeto` na fase N, com a
+  raposa sobre uma pista (o teste percorre os obstáculos próximos)
+- desenho_N: quadros/s de `CruzamentoFazenda.desenhar_plataformas` com N
+  obstáculos na tela (a fase 1 tem 18; as demais são pistas mais densas)
+- frio_inimigos / frio_raposa / frio_hud: ms para construir `Inimigos()`,
+  `Raposa()` e `HUD()` com o cache de imagens vazio (decodificar e escalar)
+- reinicio: ms de um reinício de partida (tecla R: `CruzamentoFazenda()` +
+  `HUD()` com o cache já cheio)
+
+Cada medida é repetida e fica a melhor repetição (menos ruído de agenda do
+sistema). O resultado é um JSON com valor, unidade e se maior é melhor;
+com uma base salva (benchmark_base.json), cada medida é comparada com a
+base e o script termina com código 1 se alguma piorou mais que a
+tolerância.
+
+Uso: python benchmark.py [--rapido] [--saida ARQUIVO.json]
+                         [--base ARQUIVO.json] [--salvar-base] [--tolerancia 0.25]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from classes import assets
+from classes.simulacao import MundoFazenda
+
+
+BASE_PADRAO = "benchmark_base.json"
+
+# Quantidades de obstáculos desenhados em `desenho_N`
+OBSTACULOS_DESENHO = (18, 60, 150, 300)
+
+
+def _melhor(funcao, repeticoes):
+    """Executa `funcao()` `repeticoes` vezes e retorna o menor tempo (s).
+
+    Uma execução de aquecimento (caches, alocações do NumPy) não é contada.
+    """
+    funcao()
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _mundo_na_fase(numero):
+    """Retorna um `MundoFazenda` que já entrou na fase `numero`."""
+    mundo = MundoFazenda()
+    while mundo.fases.fase < numero:
+        area = mundo.fases.area_fazenda
+        mundo.pos_raposa[:] = [area.centerx, area.centery]
+        mundo.avancar()
+    return mundo
+
+
+def _adensar(mundo, total):
+    """Troca as pistas do mundo por `total` obstáculos espalhados pelas pistas."""
+    n_pistas = len(mundo.fases.pistas)
+    linhas = []
+    for i in range(n_pistas):
+        n = total // n_pistas + (i < total % n_pistas)
+        linhas.append(list(np.linspace(-100, 900, n, endpoint=False)))
+    mundo.fases.linhas_das_plataformas = linhas
+    mundo._montar_motor()
+
+
+# -------------------------------------------------------------
+def medir_simulacao(ticks, repeticoes):
+    """Ticks/s da atualização das pistas e da colisão nas fases 1 e 2."""
+    resultados = {}
+    for numero in (1, 2):
+        mundo = _mundo_na_fase(numero)
+
+        def pistas():
+            for _ in range(ticks):
+                mundo.atualizar_plataformas()
+
+        resultados[f"pistas_fase{numero}"] = (ticks / _melhor(pistas, repeticoes), "ticks/s", True)
+
+        # Raposa na altura de uma pista do meio, onde a busca tem trabalho
+        pista = mundo.fases.pistas[len(mundo.fases.pistas) // 2]
+        mundo.pos_raposa[:] = [400, pista.y]
+
+        def colisao():
+            for _ in range(ticks):
+                mundo.raposa_colidiu_com_objeto()
+
+        resultados[f"colisao_fase{numero}"] = (ticks / _melhor(colisao, repeticoes), "ticks/s", True)
+    return resultados
+
+
+def medir_desenho(quadros, repeticoes):
+    """Quadros/s de `desenhar_plataformas` com quantidades crescentes de obstáculos."""
+    from classes.game import CruzamentoFazenda
+
+    jogo = CruzamentoFazenda()
+    resultados = {}
+    for total in OBSTACULOS_DESENHO:
+        _adensar(jogo.mundo, total)
+
+        def desenhar():
+            for i in range(quadros):
+                jogo.mundo.tick = i
+                jogo.desenhar_plataformas(0.5)
+
+        resultados[f"desenho_{total}"] = (quadros / _melhor(desenhar, repeticoes), "quadros/s", True)
+    return resultados
+
+
+def medir_inicializacao(repeticoes):
+    """Ms para criar os objetos com cache vazio e para reiniciar a partida."""
+    from classes.enemies import Inimigos
+    from classes.game import CruzamentoFazenda
+    from classes.hud import HUD
+    from classes.player import Raposa
+
+    janela = assets.obter_janela((950, 880))
+
+    def frio(construtor):
+        def medir():
+            assets.invalidar()
+            inicio = time.perf_counter()
+            construtor()
+            return time.perf_counter() - inicio
+        return min(medir() for _ in range(repeticoes)) * 1000.0
+
+    resultados = {
+        "frio_inimigos": (frio(Inimigos), "ms", False),
+        "frio_raposa": (frio(Raposa), "ms", False),
+        "frio_hud": (frio(lambda: HUD(janela, None)), "ms", False),
+    }
+
+    def reiniciar():
+        jogo = CruzamentoFazenda()
+        HUD(jogo.janela, jogo)
+
+    reiniciar()  # enche o cache, como após a primeira partida
+    resultados["reinicio"] = (_melhor(reiniciar, repeticoes) * 1000.0, "ms", False)
+    return resultados
+
+
+# -------------------------------------------------------------
+def executar(rapido=False):
+    """Roda todos os benchmarks e retorna o dicionário de resultados (JSON)."""
+    pygame.init()
+    assets.obter_janela((950, 880))
+    # --rapido só diminui as repetições: o tamanho de cada medida é o mesmo,
+    # para que o resultado continue comparável com a base
+    repeticoes = 3 if rapido else 7
+    # Aquecimento geral: tira a CPU do modo econômico antes da primeira medida
+    medir_simulacao(20000, 1)
+    medidas = {}
+    medidas.update(medir_simulacao(20000, repeticoes))
+    medidas.update(medir_desenho(300, repeticoes))
+    medidas.update(medir_inicializacao(repeticoes))
+    return {
+        "ambiente": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "sistema": platform.platform(),
+            "video": os.environ["SDL_VIDEODRIVER"],
+        },
+        "medidas": {
+            nome: {"valor": round(valor, 4), "unidade": unidade, "maior_melhor": maior_melhor}
+            for nome, (valor, unidade, maior_melhor) in medidas.items()
+        },
+    }
+
+
+def comparar(resultado, base, tolerancia):
+    """Compara com a base; retorna as linhas do relatório e os nomes que pioraram.
+
+    A variação é positiva quando melhorou. Uma medida piorou quando a
+    variação é menor que -tolerância.
+    """
+    linhas, pioraram = [], []
+    for nome, medida in resultado["medidas"].items():
+        anterior = base.get("medidas", {}).get(nome)
+        texto = f"{nome:<16}{medida['valor']:>14.2f} {medida['unidade']:<10}"
+        if anterior is None or not anterior["valor"]:
+            linhas.append(texto + "   (sem base)")
+            continue
+        razao = medida["valor"] / anterior["valor"]
+        variacao = razao - 1 if medida["maior_melhor"] else 1 / razao - 1
+        marca = ""
+        if variacao < -tolerancia:
+            marca = "  <- PIOROU"
+            pioraram.append(nome)
+        linhas.append(texto + f"{anterior['valor']:>14.2f}  {variacao:+7.1%}{marca}")
+        medida["variacao"] = round(variacao, 4)
+    return linhas, pioraram
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rapido", action="store_true", help="menos repetições por medida")
+    parser.add_argument("--saida", metavar="ARQUIVO.json", help="salva os resultados em JSON")
+    parser.add_argument("--base", metavar="ARQUIVO.json", default=BASE_PADRAO,
+                        help=f"base de comparação (padrão {BASE_PADRAO})")
+    parser.add_argument("--salvar-base", action="store_true",
+                        help="grava os resultados como a nova base")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="piora máxima aceita por medida (padrão 0.25)")
+    args = parser.parse_args(argv)
+    caminho_base = args.base
+    tolerancia = args.tolerancia
+
+    resultado = executar(rapido=args.rapido)
+
+    base = None
+    if os.path.exists(caminho_base) and not args.salvar_base:
+        with open(caminho_base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+    linhas, pioraram = comparar(resultado, base or {}, tolerancia)
+    print(f"{'medida':<16}{'valor':>14} {'':<10}{'base':>14}  variação")
+    print("\n".join(linhas))
+
+    caminho_saida = caminho_base if args.salvar_base else args.saida
+    if caminho_saida:
+        with open(caminho_saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        print(f"Resultados salvos em {caminho_saida}")
+
+    if pioraram:
+        print(f"❌ {len(pioraram)} medida(s) pioraram mais de {tolerancia:.0%}: {', '.join(pioraram)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
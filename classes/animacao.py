@@ -0,0 +1,74 @@
+"""
+Animação dos obstáculos das pistas, dirigida pelo tick da simulação.
+
+O quadro de cada obstáculo depende só do tick do mundo, do ritmo da sua
+pista (`DescritorPista.vel_animacao`, que vem do "vel_animacao" da fase ou
+da própria pista) e, opcionalmente, de uma defasagem entre obstáculos
+vizinhos (`DescritorPista.defasagem`). Cada tipo anima com os seus próprios
+quadros: a cobra percorre os 7 dela e o jacaré os 3 dele.
+
+Ao entrar em uma fase, `AnimacaoPistas` monta para cada pista a tabela do
+ciclo completo da animação, com o quadro mostrado em cada tick; desenhar
+um obstáculo vira uma consulta à tabela e um blit. A mesma classe serve
+às máscaras de colisão (`classes/mascaras.py`), com máscaras no lugar das
+superfícies, então o quadro testado é sempre o que está na tela.
+"""
+
+
+def periodo_animacao(vel_animacao):
+    """Quantos ticks cada quadro fica na tela com `vel_animacao` quadros/tick.
+
+    Repete a soma em ponto flutuante do antigo acumulador da visão, que
+    voltava a zero a cada troca de quadro (0.20 -> 5 ticks, 0.15 -> 7).
+    """
+    acumulado, ticks = 0.0, 0
+    while acumulado < 1:
+        acumulado += vel_animacao
+        ticks += 1
+    return ticks
+
+
+def tabela_quadros(quadros, vel_animacao):
+    """Lista com o quadro mostrado em cada tick de um ciclo da animação."""
+    periodo = periodo_animacao(vel_animacao)
+    return [quadro for quadro in quadros for _ in range(periodo)]
+
+
+class AnimacaoPistas:
+    """Tabelas de animação das pistas de uma fase.
+
+    Parâmetros:
+    - pistas: descritores da fase (`Fases.pistas`)
+    - quadros_por_tipo: {tipo: [quadros]} (superfícies ou máscaras)
+
+    `tabelas[linha][t % len]` é o quadro da pista `linha` no tick `t`
+    (lista vazia para tipos sem quadros).
+    """
+
+    def __init__(self, pistas, quadros_por_tipo):
+        self.pistas = pistas
+        self.tabelas = [tabela_quadros(quadros_por_tipo.get(p.tipo, ()), p.vel_animacao) for p in pistas]
+
+    # -------------------------------------------------------------
+    def quadros(self, linha, tick, n, rotacao=0):
+        """Quadro de cada um dos `n` obstáculos da pista `linha`, na ordem de X.
+
+        `rotacao` é a de `MotorPistas.rotacao` para a pista: identifica qual
+        obstáculo está em cada posição, para que a defasagem acompanhe o
+        obstáculo quando ele reaparece do outro lado da tela.
+        """
+        tabela = self.tabelas[linha]
+        if not tabela:
+            return []
+        tamanho = len(tabela)
+        defasagem = self.pistas[linha].defasagem
+        if not defasagem:
+            return [tabela[tick % tamanho]] * n
+        return [tabela[(tick + ((j - rotacao) % n) * defasagem) % tamanho] for j in range(n)]
+
+    def quadro(self, linha, tick, j, n, rotacao=0):
+        """Quadro do obstáculo na posição `j` (de `n`) da pista `linha`, ou None."""
+        tabela = self.tabelas[linha]
+        if not tabela:
+            return None
+        return tabela[(tick + ((j - rotacao) % n) * self.pistas[linha].defasagem) % len(tabela)]
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import struct
+import threading
+
+import pygame as pg
+
+
+"""
+Cache de imagens compartilhado por todo o processo.
+
+Carregar e redimensionar os PNGs de `imagens_pygame/` é caro (alguns têm
+mais de 1 MB e viram sprites de 50x50). Este módulo guarda cada superfície
+já convertida e escalada, indexada por (caminho, tamanho, alpha), para que
+reinícios de partida e telas reaproveitem o que já foi carregado.
+
+As superfícies devolvidas são compartilhadas: quem precisar alterá-las
+(por exemplo, escurecer um botão) deve trabalhar sobre uma `copy()`.
+
+Se existir um atlas gerado por `bake_assets.py` (ATLAS_IMAGEM/ATLAS_INDICE),
+os sprites com alpha saem dele como subsuperfícies já no tamanho final,
+sem decodificar nem escalar os PNGs originais. Entradas cujo arquivo de
+origem mudou depois do bake são ignoradas e carregadas do disco.
+
+`precarregar` decodifica e escala imagens em uma thread de fundo (por
+exemplo, enquanto o menu anima); a thread principal só faz a conversão
+para o formato do display, em `converter_prontos` ou na primeira chamada a
+`carregar_imagem` daquela imagem.
+"""
+
+
+ATLAS_IMAGEM = "imagens_pygame/atlas.png"
+ATLAS_INDICE = "imagens_pygame/atlas.json"
+
+_cache = {}
+_tamanhos_originais = {}
+_hashes = {}
+_fontes = {}
+_mascaras = {}
+
+# Pré-carregamento: chave -> superfície decodificada/escalada (ainda sem
+# convert) e chave -> Event sinalizado quando a thread termina aquela imagem
+_prontos = {}
+_pendentes = {}
+_trava = threading.Lock()
+
+# Atlas carregado sob demanda: None = ainda não tentou; {} = sem atlas
+_atlas = None
+_atlas_surface = None
+
+
+def chave_atlas(caminho, tamanho, suave):
+    """Texto usado como chave de um sprite no índice do atlas."""
+    medida = f"{tamanho[0]}x{tamanho[1]}" if tamanho else "original"
+    return f"{caminho}|{medida}|{'suave' if suave else 'scale'}"
+
+
+def assinatura_arquivo(caminho):
+    """Retorna {"tamanho", "mtime_ns", "sha256"} do arquivo (gravado pelo bake).
+
+    Ver `_fonte_inalterada`: o tamanho e o mtime resolvem o caso comum sem
+    ler o arquivo; o hash do conteúdo mantém o atlas válido depois de uma
+    cópia ou de um checkout novo, que mudam o mtime.
+    """
+    info = os.stat(caminho)
+    return {"tamanho": info.st_size, "mtime_ns": info.st_mtime_ns, "sha256": _hash_arquivo(caminho)}
+
+
+def _hash_arquivo(caminho):
+    """SHA-256 (truncado) do conteúdo do arquivo, calculado uma vez por processo."""
+    valor = _hashes.get(caminho)
+    if valor is None:
+        with open(caminho, "rb") as arquivo:
+            valor = _hashes[caminho] = hashlib.sha256(arquivo.read()).hexdigest()[:16]
+    return valor
+
+
+def _fonte_inalterada(caminho, assinatura):
+    """O arquivo ainda é o que o bake registrou em `assinatura`?
+
+    Tamanho diferente já basta para dizer que mudou; com tamanho e mtime
+    iguais não há o que ler. Só com o mtime diferente o conteúdo é lido e
+    comparado pelo hash.
+    """
+    info = os.stat(caminho)
+    if info.st_size != assinatura["tamanho"]:
+        return False
+    if info.st_mtime_ns == assinatura["mtime_ns"]:
+        return True
+    return _hash_arquivo(caminho) == assinatura["sha256"]
+
+
+def _carregar_atlas():
+    """Lê o índice e a imagem do atlas uma única vez por processo."""
+    global _atlas, _atlas_surface
+    if _atlas is not None:
+        return _atlas
+    _atlas = {}
+    if not (os.path.exists(ATLAS_INDICE) and os.path.exists(ATLAS_IMAGEM)):
+        return _atlas
+    try:
+        with open(ATLAS_INDICE, encoding="utf-8") as arquivo:
+            indice = json.load(arquivo)
+        _atlas_surface = pg.image.load(ATLAS_IMAGEM).convert_alpha()
+        _atlas = indice
+    except Exception as e:
+        # Atlas corrompido não impede o jogo: cai para os PNGs originais
+        print("⚠️ Atlas de sprites ignorado:", e)
+    return _atlas
+
+
+def _do_atlas(caminho, tamanho, suave):
+    """Retorna a subsuperfície do sprite no atlas, ou None se não houver."""
+    atlas = _carregar_atlas()
+    rect = atlas.get("sprites", {}).get(chave_atlas(caminho, tamanho, suave))
+    if rect is None:
+        return None
+    try:
+        if not _fonte_inalterada(caminho, atlas["fontes"][caminho]):
+            return None
+    except (KeyError, TypeError, OSError):
+        # Sem registro da origem (ou índice de um bake antigo): usa o PNG
+        return None
+    return _atlas_surface.subsurface(pg.Rect(rect))
+
+
+def carregar_imagem(caminho, tamanho=None, alpha=True, suave=False):
+    """Retorna a imagem `caminho` convertida e (opcionalmente) redimensionada.
+
+    Parâmetros:
+    - caminho: caminho do arquivo de imagem
+    - tamanho: (largura, altura) final, ou None para manter o original
+    - alpha: usa `convert_alpha()` (sprites) em vez de `convert()` (fundos)
+    - suave: usa `smoothscale` em vez de `scale` ao redimensionar
+
+    Na primeira chamada o arquivo é lido do disco; as seguintes devolvem a
+    mesma superfície do cache. Erros de leitura são propagados (os
+    chamadores já tratam assets ausentes com try/except).
+    """
+    chave = (caminho, tuple(tamanho) if tamanho else None, alpha, suave)
+    img = _cache.get(chave)
+    if img is None and alpha:
+        # O atlas vem antes da pré-carga: não há por que esperar a thread
+        # decodificar um PNG que o atlas já tem no tamanho final
+        img = _do_atlas(caminho, chave[1], suave)
+        if img is not None:
+            _cache[chave] = img
+    evento = _pendentes.get(chave)
+    if img is None and evento is not None:
+        # Já está sendo decodificada em segundo plano: espera só por ela
+        evento.wait()
+        img = _converter_pronto(chave)
+    if img is None:
+        img = pg.image.load(caminho)
+        img = img.convert_alpha() if alpha else img.convert()
+        img = _escalar(img, chave)
+        _cache[chave] = img
+    return img
+
+
+def _escalar(img, chave):
+    """Aplica o redimensionamento descrito na chave do cache."""
+    tamanho, suave = chave[1], chave[3]
+    if tamanho:
+        escala = pg.transform.smoothscale if suave else pg.transform.scale
+        img = escala(img, tamanho)
+    return img
+
+
+def _converter_pronto(chave):
+    """Converte para o formato do display uma imagem pré-carregada e a põe no cache.
+
+    Retorna None se a thread de fundo não conseguiu carregá-la (o chamador
+    então tenta o caminho normal, que propaga o erro).
+    """
+    with _trava:
+        img = _prontos.pop(chave, None)
+        _pendentes.pop(chave, None)
+    if img is None:
+        return None
+    img = img.convert_alpha() if chave[2] else img.convert()
+    _cache[chave] = img
+    return img
+
+
+def _trabalho_precarregar(tarefas):
+    """Corpo da thread de fundo: decodifica e escala cada imagem da lista."""
+    for chave, evento in tarefas:
+        try:
+            img = _escalar(pg.image.load(chave[0]), chave)
+            with _trava:
+                # `invalidar` pode ter descartado a chave durante a decodificação
+                if _pendentes.get(chave) is evento:
+                    _prontos[chave] = img
+        except Exception as e:
+            print(f"⚠️ Pré-carregamento falhou para {chave[0]}: {e}")
+        finally:
+            evento.set()
+
+
+def precarregar(imagens):
+    """Inicia a decodificação em segundo plano de uma lista de imagens.
+
+    `imagens` é uma lista de tuplas (caminho, tamanho, alpha) com os mesmos
+    significados de `carregar_imagem`. Imagens já em cache ou já pendentes
+    são ignoradas, e as que o atlas cobre vão direto para o cache, sem
+    decodificar o PNG. Retorna a thread criada (ou None se não havia
+    trabalho).
+    """
+    tarefas = []
+    for caminho, tamanho, alpha in imagens:
+        chave = (caminho, tuple(tamanho) if tamanho else None, alpha, False)
+        if chave in _cache or chave in _pendentes:
+            continue
+        if alpha:
+            img = _do_atlas(caminho, chave[1], False)
+            if img is not None:
+                _cache[chave] = img
+                continue
+        _pendentes[chave] = threading.Event()
+        tarefas.append((chave, _pendentes[chave]))
+    if not tarefas:
+        return None
+    thread = threading.Thread(target=_trabalho_precarregar, args=(tarefas,), daemon=True)
+    thread.start()
+    return thread
+
+
+def converter_prontos(maximo=1):
+    """Converte até `maximo` imagens já decodificadas pela thread de fundo.
+
+    Pensado para ser chamado uma vez por quadro em telas ociosas (menu),
+    distribuindo o custo de `convert()` sem travar nenhum quadro.
+    """
+    with _trava:
+        chaves = list(_prontos)[:maximo]
+    for chave in chaves:
+        _converter_pronto(chave)
+
+
+def tamanho_original(caminho):
+    """Retorna (largura, altura) do arquivo de imagem, sem guardar os pixels.
+
+    Usa o índice do atlas quando disponível, evitando decodificar o PNG
+    só para descobrir a proporção (ex.: botão START).
+    """
+    tamanho = _carregar_atlas().get("originais", {}).get(caminho)
+    if tamanho is not None:
+        return tuple(tamanho)
+    if caminho not in _tamanhos_originais:
+        _tamanhos_originais[caminho] = _tamanho_png(caminho) or pg.image.load(caminho).get_size()
+    return _tamanhos_originais[caminho]
+
+
+def _tamanho_png(caminho):
+    """Lê (largura, altura) do cabeçalho IHDR de um PNG; None se não for PNG."""
+    with open(caminho, "rb") as arquivo:
+        cabecalho = arquivo.read(24)
+    if len(cabecalho) < 24 or cabecalho[:8] != b"\x89PNG\r\n\x1a\n" or cabecalho[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", cabecalho[16:24])
+
+
+def carregar_fonte(tamanho, nome=None):
+    """Retorna a `pg.font.Font(nome, tamanho)` do processo, criando-a uma vez.
+
+    Construir uma fonte lê e prepara o arquivo TTF; HUDs recriados a cada
+    partida (e chamadas por quadro) passam a reaproveitar o mesmo objeto.
+    """
+    chave = (nome, tamanho)
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        fonte = _fontes[chave] = pg.font.Font(nome, tamanho)
+    return fonte
+
+
+def mascara_de(superficie):
+    """Retorna a `pg.mask.Mask` dos pixels opacos de `superficie`, calculada uma vez.
+
+    As superfícies do cache são compartilhadas, então a máscara de cada
+    sprite é montada só na primeira partida (ver `classes/mascaras.py`).
+    """
+    mascara = _mascaras.get(superficie)
+    if mascara is None:
+        mascara = _mascaras[superficie] = pg.mask.from_surface(superficie)
+    return mascara
+
+
+def entradas_cache():
+    """Retorna um dicionário com as entradas atuais do cache (usado pelo bake)."""
+    return dict(_cache)
+
+
+def invalidar(caminho=None):
+    """Descarta entradas do cache.
+
+    Sem argumentos limpa tudo (por exemplo, após trocar o modo de vídeo),
+    inclusive o atlas, que é relido na próxima carga; com `caminho` remove
+    apenas as versões daquele arquivo. Imagens pré-carregadas (prontas ou
+    ainda na thread de fundo) também são descartadas, para que a versão
+    antiga não volte ao cache.
+    """
+    global _atlas, _atlas_surface
+    with _trava:
+        for chave in [c for c in _pendentes if caminho is None or c[0] == caminho]:
+            _prontos.pop(chave, None)
+            del _pendentes[chave]
+    if caminho is None:
+        _cache.clear()
+        _tamanhos_originais.clear()
+        _hashes.clear()
+        _mascaras.clear()
+        _atlas = None
+        _atlas_surface = None
+        return
+    _hashes.pop(caminho, None)
+    for chave in [c for c in _cache if c[0] == caminho]:
+        _mascaras.pop(_cache.pop(chave), None)
+
+
+def obter_janela(tamanho, titulo=None):
+    """Retorna a janela atual se já tiver `tamanho`, senão cria uma nova.
+
+    Evita recriar o modo de vídeo a cada reinício de partida, o que também
+    invalidaria o formato de pixel das superfícies em cache.
+    """
+    janela = pg.display.get_surface()
+    if janela is None or janela.get_size() != tuple(tamanho):
+        janela = pg.display.set_mode(tamanho)
+        invalidar()
+    if titulo:
+        pg.display.set_caption(titulo)
+    return janela
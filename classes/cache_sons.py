@@ -0,0 +1,113 @@
+import hashlib
+import mmap
+import os
+import struct
+import wave
+
+import pygame as pg
+
+
+"""
+Cache de efeitos sonoros já decodificados (PCM no formato do mixer).
+
+Decodificar os MP3 de `sons/sons/` a cada inicialização custa CPU em toda
+abertura do jogo. `converter` (rodado uma vez por `bake_assets.py`) grava
+cada efeito em PASTA_CACHE como WAV com as amostras exatamente no formato
+do mixer (frequência, bits, canais); `carregar_som` prefere essa cópia:
+mapeia o arquivo na memória (mmap) e entrega as amostras direto ao mixer,
+sem decodificar nem converter nada.
+
+O nome do arquivo em cache leva um hash do conteúdo do MP3 de origem e do
+formato do mixer: um som alterado (ou um mixer aberto em outro formato)
+simplesmente não acha sua cópia e volta a ser decodificado do MP3.
+
+A trilha de fundo não passa pelo cache: ela já toca em streaming
+(`pg.mixer.music`), que decodifica só o trecho que está tocando.
+"""
+
+
+PASTA_CACHE = "sons/cache"
+
+# Cabeçalho de um WAV PCM simples, como o que `wave` grava:
+# RIFF, tamanho, WAVE, "fmt ", 16, formato (1 = PCM), canais, frequência,
+# bytes/s, bytes por quadro, bits por amostra, "data", tamanho dos dados
+_CABECALHO_WAV = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def formato_mixer():
+    """Retorna (frequência, bits com sinal, canais) do mixer aberto."""
+    formato = pg.mixer.get_init()
+    if formato is None:
+        raise pg.error("mixer não inicializado")
+    return formato
+
+
+def caminho_cache(origem, formato=None):
+    """Caminho da cópia PCM de `origem` para o formato do mixer.
+
+    O nome é "<arquivo>-<hash>.wav", com o hash do conteúdo da origem e do
+    formato; o MP3 é lido, mas não decodificado.
+    """
+    formato = formato or formato_mixer()
+    h = hashlib.sha256(repr(formato).encode())
+    with open(origem, "rb") as arquivo:
+        h.update(arquivo.read())
+    nome = os.path.splitext(os.path.basename(origem))[0]
+    return os.path.join(PASTA_CACHE, f"{nome}-{h.hexdigest()[:16]}.wav")
+
+
+def converter(origem):
+    """Decodifica `origem` no formato do mixer e grava a cópia em cache.
+
+    Retorna o caminho gravado. Só formatos inteiros (8 ou 16 bits) cabem
+    em um WAV PCM; com outro formato de mixer levanta ValueError.
+    """
+    frequencia, bits, canais = formato = formato_mixer()
+    if bits not in (8, -16):
+        raise ValueError(f"formato do mixer sem WAV PCM equivalente: {bits} bits")
+    destino = caminho_cache(origem, formato)
+    amostras = pg.mixer.Sound(origem).get_raw()
+
+    os.makedirs(PASTA_CACHE, exist_ok=True)
+    temporario = destino + ".tmp"
+    with wave.open(temporario, "wb") as saida:
+        saida.setnchannels(canais)
+        saida.setsampwidth(abs(bits) // 8)
+        saida.setframerate(frequencia)
+        saida.writeframes(amostras)
+    os.replace(temporario, destino)
+    return destino
+
+
+def carregar_som(origem):
+    """Retorna o `pg.mixer.Sound` de `origem`, pela cópia em cache se houver.
+
+    A cópia é mapeada na memória e suas amostras vão direto para o mixer;
+    sem cópia válida, decodifica a origem normalmente.
+    """
+    try:
+        destino = caminho_cache(origem)
+        with open(destino, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+            if _amostras_validas(dados):
+                with memoryview(dados) as amostras:
+                    # O Sound copia as amostras; o mapeamento pode ser fechado
+                    return pg.mixer.Sound(buffer=amostras[_CABECALHO_WAV.size:])
+    except (OSError, ValueError, pg.error):
+        pass
+    return pg.mixer.Sound(origem)
+
+
+def _amostras_validas(dados):
+    """O WAV mapeado é o que `converter` grava para o formato atual do mixer?"""
+    if len(dados) < _CABECALHO_WAV.size:
+        return False
+    riff, _, wave_, fmt, tamanho_fmt, tipo, canais, frequencia, _, _, bits, data, tamanho = (
+        _CABECALHO_WAV.unpack_from(dados)
+    )
+    freq_mixer, bits_mixer, canais_mixer = formato_mixer()
+    return (
+        (riff, wave_, fmt, data) == (b"RIFF", b"WAVE", b"fmt ", b"data")
+        and (tamanho_fmt, tipo) == (16, 1)
+        and (frequencia, bits, canais) == (freq_mixer, abs(bits_mixer), canais_mixer)
+        and tamanho == len(dados) - _CABECALHO_WAV.size
+    )
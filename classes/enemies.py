@@ -1,6 +1,4 @@
-import pygame as pg
-
-import pygame as pg
+from classes.assets import carregar_imagem, mascara_de
 
 
 """
@@ -10,10 +8,56 @@ Este módulo define a classe `Inimigos` que carrega e armazena os frames
 (superfícies Pygame) usados para renderizar inimigos e obstáculos no jogo.
 
 Os sprites são carregados da pasta `imagens_pygame/` e redimensionados para
-valores fixos por tipo. A classe apenas prepara as listas de frames e guarda
+valores fixos por tipo, via o cache de `classes/assets.py` (reinícios de
+partida não voltam ao disco). A classe apenas prepara as listas de frames e guarda
 os tamanhos usados como referência — não realiza lógica de movimento/colisão.
+
+Os tamanhos ficam em constantes de módulo (TAMANHO_*) para que a simulação
+headless (`classes/simulacao.py`) possa montar hitboxes sem carregar imagens.
 """
 
+# Tamanhos (largura, altura) de cada tipo de inimigo/obstáculo
+TAMANHO_JACARE = (60, 50)
+TAMANHO_RATAZANA = (90, 50)
+TAMANHO_FENO = (60, 60)
+TAMANHO_ESC = (60, 50)
+TAMANHO_COBRA = (110, 50)
+
+
+# Arquivos dos frames de cada tipo, na ordem da animação (a cobra não tem
+# o quadro 4); as chaves são as de `Inimigos.frames_por_tipo`
+ARQUIVOS_POR_TIPO = {
+    "jacare": [f"imagens_pygame/jac{i}.png" for i in range(1, 4)],
+    "ratazana": [f"imagens_pygame/rat{i}.png" for i in range(1, 5)],
+    "feno": [f"imagens_pygame/feno{i}.png" for i in range(1, 10)],
+    "esc": [f"imagens_pygame/esc{i}.png" for i in range(1, 5)],
+    "cobra": [f"imagens_pygame/cob{i}.png" for i in range(1, 9) if i != 4],
+}
+
+# Tamanho do sprite de cada tipo de obstáculo (a chave é usada pela visão
+# para escolher a lista de frames em `Inimigos.frames_por_tipo` e pelas
+# pistas de `classes/levels.py`)
+TAMANHOS_POR_TIPO = {
+    "jacare": TAMANHO_JACARE,
+    "ratazana": TAMANHO_RATAZANA,
+    "feno": TAMANHO_FENO,
+    "esc": TAMANHO_ESC,
+    "cobra": TAMANHO_COBRA,
+}
+
+
+def imagens_inimigos():
+    """Lista (caminho, tamanho, alpha) dos sprites carregados por `Inimigos`.
+
+    Usada para decodificá-los em segundo plano (`assets.precarregar`) antes
+    da primeira partida; são os mesmos arquivos de `Inimigos.__init__`.
+    """
+    return [
+        (caminho, TAMANHOS_POR_TIPO[tipo], True)
+        for tipo, arquivos in ARQUIVOS_POR_TIPO.items()
+        for caminho in arquivos
+    ]
+
 
 class Inimigos:
     """Carrega sprites (frames) para diferentes inimigos/obstáculos.
@@ -25,75 +69,30 @@ class Inimigos:
     """
 
     def __init__(self):
-        # --- JACARÉS (usados apenas na fase 1) ---
-        # Definimos uma tupla (largura, altura) que será usada para escalar
-        # todas as imagens dos jacarés. Usamos list comprehension para
-        # carregar e escalar os frames de forma compacta.
-        TAMANHO_JACARE = (60, 50)
-        self.jacare_frames = [
-            pg.transform.scale(
-                pg.image.load(f"imagens_pygame/jac{i}.png").convert_alpha(),
-                TAMANHO_JACARE,
-            )
-            for i in range(1, 4)
-        ]
-
-        # --- RATAZANAS (substituem os jacarés na fase 2) ---
-        # Aqui usamos um loop com try/except para capturar erros de I/O
-        # (por exemplo, arquivo não encontrado). Em caso de erro, é
-        # impresso um aviso e o frame é ignorado — isso evita quebrar o jogo
-        # se faltar alguma imagem.
-        TAMANHO_RATAZANA = (90, 50)
-        self.ratazana_frames = []
-        for i in range(1, 5):
-            caminho = f"imagens_pygame/rat{i}.png"
-            try:
-                img = pg.image.load(caminho).convert_alpha()
-                img = pg.transform.scale(img, TAMANHO_RATAZANA)
-                self.ratazana_frames.append(img)
-            except Exception as e:
-                # Mensagem de erro específica ajuda na depuração de assets
-                print(f"❌ Erro ao carregar {caminho}: {e}")
-
-        # --- FENOS (fase 1) ---
-        # Outro exemplo de uso de list comprehension para carregar frames.
-        TAMANHO_FENO = (60, 60)
-        self.feno_frames = [
-            pg.transform.scale(
-                pg.image.load(f"imagens_pygame/feno{i}.png").convert_alpha(),
-                TAMANHO_FENO,
-            )
-            for i in range(1, 10)
-        ]
-
-        # --- ESCORPIÕES (fase 2) ---
-        TAMANHO_ESC = (60, 50)
-        self.esc_frames = [
-            pg.transform.scale(
-                pg.image.load(f"imagens_pygame/esc{i}.png").convert_alpha(),
-                TAMANHO_ESC,
-            )
-            for i in range(1, 5)
-        ]
-
-        # --- COBRAS (iguais nas duas fases) ---
-        # Observação: o loop pula quando i == 4 — isso provavelmente ocorre
-        # porque a imagem de índice 4 não existe ou é indesejada.
-        TAMANHO_COBRA = (110, 50)
-        self.cobra_frames = []
-        for i in range(1, 9):
-            if i == 4:
-                # Pula o índice 4 intencionalmente
-                continue
-            caminho = f"imagens_pygame/cob{i}.png"
-            try:
-                img = pg.transform.scale(
-                    pg.image.load(caminho).convert_alpha(), TAMANHO_COBRA
-                )
-                self.cobra_frames.append(img)
-            except Exception:
-                # Mensagem menos verbosa quando a imagem não é essencial
-                print(f"⚠️ Não encontrei {caminho}, pulando...")
+        # --- Frames por tipo ---
+        # Montados de ARQUIVOS_POR_TIPO/TAMANHOS_POR_TIPO, as mesmas tabelas
+        # de `imagens_inimigos` e de `MascarasColisao.carregar`: sprites e
+        # máscaras saem sempre dos mesmos arquivos. Chaves iguais às de
+        # `TAMANHOS_POR_TIPO`, usadas pelos descritores de pista para
+        # escolher os sprites de cada linha. Um frame que falha ao carregar
+        # (arquivo ausente, por exemplo) é pulado com um aviso, sem quebrar
+        # o jogo.
+        self.frames_por_tipo = {}
+        for tipo, arquivos in ARQUIVOS_POR_TIPO.items():
+            self.frames_por_tipo[tipo] = []
+            for caminho in arquivos:
+                try:
+                    self.frames_por_tipo[tipo].append(carregar_imagem(caminho, TAMANHOS_POR_TIPO[tipo]))
+                except Exception as e:
+                    # Mensagem de erro específica ajuda na depuração de assets
+                    print(f"❌ Erro ao carregar {caminho}: {e}")
+
+        # Listas de frames de cada tipo, como atributos
+        self.jacare_frames = self.frames_por_tipo["jacare"]
+        self.ratazana_frames = self.frames_por_tipo["ratazana"]
+        self.feno_frames = self.frames_por_tipo["feno"]
+        self.esc_frames = self.frames_por_tipo["esc"]
+        self.cobra_frames = self.frames_por_tipo["cobra"]
 
         # --- Guardar tamanhos para referência ---
         # Esses atributos podem ser usados por outros módulos para criar
@@ -103,3 +102,11 @@ class Inimigos:
         self.tamanho_feno = TAMANHO_FENO
         self.tamanho_cobra = TAMANHO_COBRA
         self.tamanho_esc = TAMANHO_ESC
+
+        # --- Máscaras de colisão por tipo ---
+        # Uma `pg.mask.Mask` por frame, para a colisão exata opcional
+        # (`classes/mascaras.py`); calculadas uma vez por sprite do cache.
+        self.mascaras_por_tipo = {
+            tipo: [mascara_de(frame) for frame in frames]
+            for tipo, frames in self.frames_por_tipo.items()
+        }
@@ -2,7 +2,9 @@ import pygame as pg
 from sys import exit
 from classes.player import Raposa
 from classes.enemies import Inimigos
-from classes.levels import Fases
+from classes.simulacao import MundoFazenda
+from classes.animacao import AnimacaoPistas
+from classes.assets import carregar_imagem, obter_janela
 
 
 """
@@ -10,8 +12,10 @@ Módulo de gerenciamento do jogo - Cruzamento da Fazenda.
 
 Contém a classe `CruzamentoFazenda` que inicializa a janela do Pygame,
 carrega recursos (fundo, sprites via outras classes) e contém métodos
-para desenhar e atualizar plataformas, detectar colisões e reagir aos
-eventos do jogo (por exemplo, chegada à fazenda ou aos ovos).
+para desenhar a partida. Toda a lógica (pistas, colisões, vidas, fases)
+fica em `classes/simulacao.py::MundoFazenda`; esta classe é uma visão fina
+sobre esse mundo e apenas repassa as chamadas e reage aos eventos dele
+(por exemplo, trocar o fundo ao chegar na fazenda).
 
 Comentários em português explicam a finalidade de cada método e os
 trechos de lógica mais importantes.
@@ -21,24 +25,23 @@ trechos de lógica mais importantes.
 class CruzamentoFazenda:
     """Classe principal que gerencia a tela e a lógica básica do jogo.
 
-    A classe agrega objetos das classes `Raposa`, `Inimigos` e `Fases`.
-    Ela não é um loop principal completo por si só (presumivelmente existe
-    em `main.py`), mas fornece utilitários para desenhar, atualizar e
-    verificar colisões.
+    A classe agrega um `MundoFazenda` (estado lógico) e os objetos visuais
+    `Raposa` e `Inimigos`. Ela não é um loop principal completo por si só
+    (presumivelmente existe em `main.py`), mas fornece utilitários para
+    desenhar, atualizar e verificar colisões.
     """
 
-    def __init__(self):
+    def __init__(self, semente=None):
         # Inicialização do Pygame e janela principal
+        # (reaproveita a janela existente em reinícios, sem recriar o modo de vídeo)
         pg.init()
-        self.janela = pg.display.set_mode((950, 880))
-        pg.display.set_caption("Cruzamento da Fazenda")
+        self.janela = obter_janela((950, 880), "Cruzamento da Fazenda")
         self.relogio = pg.time.Clock()
 
         # Carrega imagem de fundo; em caso de erro encerra o jogo
         try:
             # --- Fundo inicial ---
-            self.fundo_imagem = pg.image.load("imagens_pygame/fundo_fazenda.png").convert()
-            self.fundo_imagem = pg.transform.scale(self.fundo_imagem, (950, 880))
+            self.fundo_imagem = carregar_imagem("imagens_pygame/fundo_fazenda.png", (950, 880), alpha=False)
         except Exception as e:
             # Falha ao carregar assets é crítica aqui — imprimimos o erro
             # e saímos para evitar estados inconsistentes.
@@ -47,19 +50,37 @@ class CruzamentoFazenda:
             exit()
 
         # --- Componentes principais ---
-        # Instanciamos os objetos que gerenciam jogador, inimigos e fases
+        # O mundo guarda o estado lógico; raposa e inimigos guardam sprites.
+        # A raposa desenha na mesma lista de posição usada pelo mundo.
+        self.mundo = MundoFazenda(semente)
         self.raposa = Raposa()
+        self.raposa.pos_raposa = self.mundo.pos_raposa
+        self.raposa.mundo = self.mundo
         self.inimigos = Inimigos()
-        self.fases = Fases()
 
-        # --- parâmetros gerais ---
-        # Contadores e flags usados por vários métodos
-        self.vidas = 3
-        self.game_over = False
-        self.indice_animacao = 0
-        self.tempo_animacao = 0.0
-        self.vel_animacao = 0.20
-        self.reached_ovos = False
+        # --- Animação e desenho das pistas ---
+        # Tabelas de quadros por tick e destinos por pista da fase atual
+        # (ver `animacao_pistas`)
+        self._animacao = None
+        self._destinos_pistas = []
+
+    # -------------------------------------------------------------
+    # Atalhos para o estado do mundo (mantêm a interface usada em main.py)
+    @property
+    def fases(self):
+        return self.mundo.fases
+
+    @property
+    def vidas(self):
+        return self.mundo.vidas
+
+    @property
+    def game_over(self):
+        return self.mundo.game_over
+
+    @property
+    def reached_ovos(self):
+        return self.mundo.reached_ovos
 
     # -------------------------------------------------------------
     def limpar_janela(self):
@@ -71,171 +92,123 @@ class CruzamentoFazenda:
         self.janela.blit(self.fundo_imagem, (0, 0))
 
     # -------------------------------------------------------------
-    def desenhar_plataformas(self):
-        """Desenha plataformas/inimigos móveis conforme a fase atual.
-
-        - Seleciona as posições Y corretas dependendo da fase (1 ou 2).
-        - Atualiza o índice de animação com base em `tempo_animacao`.
-        - Para cada plataforma (cada x em cada linha) escolhe qual
-          sprite desenhar (jacaré, ratazana, feno, escorpião, cobra)
-          de acordo com a linha e a fase.
+    def desenho_plataformas(self, alfa=1.0, lista=None):
+        """Monta os pares (sprite, destino) das plataformas/inimigos móveis.
+
+        - Para cada pista usa o destino pré-calculado na entrada da fase
+          (deslocamento do sprite e Y, ver `animacao_pistas`), sem precisar
+          decidir linha a linha qual inimigo desenhar.
+        - `alfa` (0..1) é a fração do próximo tick de simulação já decorrida
+          (ver `classes/tempo.py`). As posições do mundo são as do último
+          tick; desenhamos cada obstáculo `velocidade * (1 - alfa)` atrás
+          delas, interpolando entre o tick anterior e o atual. Com alfa=1 o
+          desenho é exatamente o estado do mundo.
+        - O quadro de cada obstáculo sai da tabela de `animacao_pistas`
+          para o tick atual do mundo.
+
+        Os pares são acrescentados a `lista` (ou a uma lista nova), que é
+        retornada pronta para um único `Surface.blits`.
         """
-        y_posicoes = self.fases.y_posicoes_fase1 if self.fases.fase == 1 else self.fases.y_posicoes_fase2
-
-        # Avança o temporizador de animação e atualiza o índice quando chega a 1
-        self.tempo_animacao += self.vel_animacao
-        if self.tempo_animacao >= 1:
-            # Uso de max(1, ...) para evitar divisão por zero caso não hajam frames
-            self.indice_animacao = (self.indice_animacao + 1) % max(1, len(self.inimigos.cobra_frames))
-            self.tempo_animacao = 0
-
-        # Percorre cada linha de plataformas (linhas_das_plataformas é uma lista de listas de Xs)
-        for linha, xs in enumerate(self.fases.linhas_das_plataformas):
-            if linha >= len(y_posicoes):
-                # Se não houver uma posição Y definida para esta linha, paramos
-                break
-            y = y_posicoes[linha]
-            for x in xs:
-                # Determina e desenha a imagem apropriada para a linha/fase
-                # Jacarés (fase 1) / Ratazanas (fase 2)
-                if (self.fases.fase == 1 and linha in (2, 5)):
-                    img = self.inimigos.jacare_frames[self.indice_animacao % len(self.inimigos.jacare_frames)]
-                    rect = img.get_rect(center=(x + self.inimigos.tamanho_jacare[0] // 2, y))
-                    self.janela.blit(img, rect)
-                elif (self.fases.fase == 2 and linha == 0):
-                    img = self.inimigos.ratazana_frames[self.indice_animacao % len(self.inimigos.ratazana_frames)]
-                    rect = img.get_rect(center=(x + self.inimigos.tamanho_ratazana[0] // 2, y))
-                    self.janela.blit(img, rect)
-
-                # Fenos (fase 1) / Escorpiões (fase 2)
-                elif (self.fases.fase == 1 and linha in (0, 3)):
-                    img = self.inimigos.feno_frames[self.indice_animacao % len(self.inimigos.feno_frames)]
-                    rect = img.get_rect(center=(x + self.inimigos.tamanho_feno[0] // 2, y))
-                    self.janela.blit(img, rect)
-                elif (self.fases.fase == 2 and linha == 1):
-                    img = self.inimigos.esc_frames[self.indice_animacao % len(self.inimigos.esc_frames)]
-                    rect = img.get_rect(center=(x + self.inimigos.tamanho_esc[0] // 2, y))
-                    self.janela.blit(img, rect)
-
-                # Cobras (ambas fases)
-                elif (self.fases.fase == 1 and linha in (1, 4)) or (self.fases.fase == 2 and linha == 2):
-                    img = self.inimigos.cobra_frames[self.indice_animacao % len(self.inimigos.cobra_frames)]
-                    rect = img.get_rect(center=(x + self.inimigos.tamanho_cobra[0] // 2, y))
-                    self.janela.blit(img, rect)
+        if lista is None:
+            lista = []
+        animacao = self.animacao_pistas()
+        tick = self.mundo.tick
+        rotacao = self.mundo.motor.rotacao
+        atraso = 1.0 - alfa
+        # Percorre cada pista junto com as posições X dos seus obstáculos
+        pistas = zip(self._destinos_pistas, self.fases.linhas_das_plataformas)
+        for linha, ((dx, y, velocidade), xs) in enumerate(pistas):
+            imgs = animacao.quadros(linha, tick, len(xs), rotacao[linha])
+            if imgs:
+                xs_tela = (xs + (dx - velocidade * atraso)).tolist()
+                lista.extend(zip(imgs, [(x, y) for x in xs_tela]))
+        return lista
+
+    def desenhar_plataformas(self, alfa=1.0):
+        """Desenha plataformas/inimigos móveis conforme a fase atual (um `blits`)."""
+        self.janela.blits(self.desenho_plataformas(alfa), 0)
 
     # -------------------------------------------------------------
-    def atualizar_plataformas(self):
-        """Atualiza as posições X das plataformas/inimigos móveis.
+    def animacao_pistas(self):
+        """`AnimacaoPistas` com os sprites da fase atual (remontada ao trocar de fase).
 
-        Lógica por linha:
-        - Linhas 2 e 5: jacarés/ratazanas se movem para a direita.
-        - Linhas 0 e 3: fenos/escorpiões se movem para a esquerda.
-        - Linhas 1 e 4: cobras se movem para a direita com velocidade diferente.
+        Junto com ela guarda, por pista, (dx, y, velocidade): o
+        deslocamento X e o Y do canto do sprite e a velocidade usada na
+        interpolação.
+        """
+        if self._animacao is None or self._animacao.pistas is not self.fases.pistas:
+            self._animacao = AnimacaoPistas(self.fases.pistas, self.inimigos.frames_por_tipo)
+            self._destinos_pistas = [
+                (p.deslocamento_sprite[0], p.y + p.deslocamento_sprite[1], p.velocidade)
+                for p in self.fases.pistas
+            ]
+        return self._animacao
+
+    # -------------------------------------------------------------
+    def mover_raposa(self, tecla):
+        """Move a raposa no mundo e orienta o sprite conforme a tecla."""
+        self.raposa.mover_raposa(tecla)
+
+    # -------------------------------------------------------------
+    def avancar(self):
+        """Avança um tick de simulação completo e reage aos eventos.
 
-        Quando uma plataforma sai da tela, ela é reposicionada no lado
-        oposto (efeito loop), usando valores limites adequados a cada tipo.
+        Equivale a `atualizar_plataformas()` + `checar_colisoes_e_reagir()`,
+        mas também conta o tick no mundo (referência para gravação/replay).
         """
-        for y in range(len(self.fases.linhas_das_plataformas)):
-            for i in range(len(self.fases.linhas_das_plataformas[y])):
-                if y in (2, 5):  # jacarés / ratazanas
-                    self.fases.linhas_das_plataformas[y][i] += 1 + self.fases.v_dif
-                    if self.fases.linhas_das_plataformas[y][i] > 880:
-                        self.fases.linhas_das_plataformas[y][i] = -100
-                elif y in (0, 3):  # fenos / escorpiões
-                    self.fases.linhas_das_plataformas[y][i] -= 2 + self.fases.v_dif
-                    if self.fases.linhas_das_plataformas[y][i] < -120:
-                        self.fases.linhas_das_plataformas[y][i] = 880
-                elif y in (1, 4):  # cobras
-                    self.fases.linhas_das_plataformas[y][i] += 1.5 + self.fases.v_dif
-                    if self.fases.linhas_das_plataformas[y][i] > 950:
-                        self.fases.linhas_das_plataformas[y][i] = -300
+        eventos = self.mundo.avancar()
+        self._reagir(eventos)
+        return eventos
 
     # -------------------------------------------------------------
-    def raposa_colidiu_com_objeto(self):
-        """Verifica se a raposa colidiu com alguma plataforma/inimigo.
+    def atualizar_plataformas(self):
+        """Atualiza as posições X das plataformas (no mundo).
 
-        - Constrói um Rect da raposa usando posição e ajuste vertical.
-        - Para cada plataforma visível, constrói um rect correspondente
-          com base no tipo (usa os tamanhos em `self.inimigos`).
-        - Se houver interseção (`colliderect`) retorna True, caso contrário False.
+        A animação segue o tick do mundo, contado por `avancar`.
         """
-        raposa_rect = pg.Rect(int(self.raposa.pos_raposa[0]), int(self.raposa.pos_raposa[1] + self.raposa.ajuste_y_raposa),
-                              int(self.raposa.tamanho_raposa[0]), int(self.raposa.tamanho_raposa[1]))
-        y_posicoes = self.fases.y_posicoes_fase1 if self.fases.fase == 1 else self.fases.y_posicoes_fase2
-        for linha, xs in enumerate(self.fases.linhas_das_plataformas):
-            if linha >= len(y_posicoes):
-                break
-            y_plat = y_posicoes[linha]
-            for x in xs:
-                # Cria rects diferentes dependendo do tipo de plataforma
-                if (self.fases.fase == 1 and linha in (2, 5)):
-                    plat_rect = pg.Rect(int(x), int(y_plat - self.inimigos.tamanho_jacare[1] // 2), *self.inimigos.tamanho_jacare)
-                elif (self.fases.fase == 2 and linha == 0):
-                    plat_rect = pg.Rect(int(x), int(y_plat - self.inimigos.tamanho_ratazana[1] // 2), *self.inimigos.tamanho_ratazana)
-                elif (self.fases.fase == 1 and linha in (0, 3)) or (self.fases.fase == 2 and linha == 1):
-                    plat_rect = pg.Rect(int(x), int(y_plat - self.inimigos.tamanho_feno[1] // 2), *self.inimigos.tamanho_feno)
-                elif (self.fases.fase == 1 and linha in (1, 4)) or (self.fases.fase == 2 and linha == 2):
-                    plat_rect = pg.Rect(int(x), int(y_plat - self.inimigos.tamanho_cobra[1] // 2), *self.inimigos.tamanho_cobra)
-                else:
-                    # Linha não mapeada para plataformas relevantes
-                    continue
-                if raposa_rect.colliderect(plat_rect):
-                    return True
-        return False
+        self.mundo.atualizar_plataformas()
+
+    # -------------------------------------------------------------
+    def raposa_colidiu_com_objeto(self):
+        """Verifica se a raposa colidiu com alguma plataforma (delegado ao mundo)."""
+        return self.mundo.raposa_colidiu_com_objeto()
 
     # -------------------------------------------------------------
     def resetar_posicao_raposa(self, colisao=False):
-        """Reseta a posição da raposa para o ponto inicial.
+        """Reseta a posição da raposa no mundo e volta ao sprite frontal."""
+        self.mundo.resetar_posicao_raposa(colisao)
+        self._raposa_no_inicio(colisao)
 
-        Se `colisao` for True, decrementa vidas, checa game over e imprime
-        um log simples. Depois reposiciona a raposa e seu sprite frontal.
-        """
+    def _raposa_no_inicio(self, colisao=False):
+        """Reação visual à raposa de volta ao início: sprite frontal (e log da colisão)."""
         if colisao:
-            self.vidas -= 1
-            if self.vidas < 0:
-                self.vidas = 0
             print(f"💥 Colidiu! Vidas restantes: {self.vidas}")
-            if self.vidas == 0:
-                self.game_over = True
-        # Posição inicial definida por coord x,y
-        self.raposa.pos_raposa = [370, 760]
         self.raposa.sprite_raposa_atual = self.raposa.sprite_frente
 
     # -------------------------------------------------------------
     def checar_colisoes_e_reagir(self):
-        """Verifica colisões e reage: transfere para próxima fase ou finaliza jogo.
+        """Verifica colisões no mundo e reage visualmente aos eventos.
 
-        - Se `game_over` estiver ativo, retorna imediatamente.
-        - Chama `raposa_colidiu_com_objeto` e reseta posição caso haja colisão.
-        - Se a raposa colide com `area_fazenda`, avança para próxima fase e
-          troca o fundo (carrega `fundo_fazenda_2.png`).
-        - Se a raposa atinge `area_ovos`, ativa `reached_ovos` e marca `game_over`.
-        """
-        if self.game_over:
-            return
+        - Colisão: loga as vidas restantes e volta ao sprite frontal.
+        - Chegada na fazenda: troca o fundo (carrega `fundo_fazenda_2.png`).
+        - Chegada nos ovos: apenas loga; o mundo já marca `game_over`.
 
-        if self.raposa_colidiu_com_objeto():
-            self.resetar_posicao_raposa(colisao=True)
+        Retorna o dicionário de eventos produzido pelo mundo.
+        """
+        return self._reagir(self.mundo.checar_colisoes_e_reagir())
 
-        raposa_rect = pg.Rect(
-            int(self.raposa.pos_raposa[0]),
-            int(self.raposa.pos_raposa[1] + self.raposa.ajuste_y_raposa),
-            int(self.raposa.tamanho_raposa[0]),
-            int(self.raposa.tamanho_raposa[1]),
-        )
+    def _reagir(self, eventos):
+        """Aplica as reações visuais ao dicionário de eventos do mundo."""
+        if eventos["colidiu"]:
+            self._raposa_no_inicio(colisao=True)
 
-        # Checa se chegou na fazenda (área de chegada) e avança de fase
-        if raposa_rect.colliderect(self.fases.area_fazenda):
+        if eventos["mudou_fase"]:
             print("🐾 A raposa chegou na fazenda!")
-            self.fases.proxima_fase()
             # Troca o fundo para o segundo (fase 2) e escala
-            self.fundo_imagem = pg.image.load("imagens_pygame/fundo_fazenda_2.png").convert()
-            self.fundo_imagem = pg.transform.scale(self.fundo_imagem, (950, 880))
-            self.resetar_posicao_raposa()
-
-        # Checa área dos ovos (condição adicional: area_ovos.width > 1 evita áreas vazias)
-        if self.fases.area_ovos and self.fases.area_ovos.width > 1 and raposa_rect.colliderect(self.fases.area_ovos):
-            if not self.reached_ovos:
-                print("🐾 A raposa chegou nos ovos!")
-                self.reached_ovos = True
-                self.game_over = True
+            self.fundo_imagem = carregar_imagem("imagens_pygame/fundo_fazenda_2.png", (950, 880), alpha=False)
+            self._raposa_no_inicio()
+
+        if eventos["chegou_ovos"]:
+            print("🐾 A raposa chegou nos ovos!")
+
+        return eventos
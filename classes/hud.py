@@ -1,4 +1,7 @@
+from collections import OrderedDict
+
 import pygame as pg
+from classes.assets import carregar_imagem, carregar_fonte
 
 
 """
@@ -8,8 +11,33 @@ Define a classe `HUD` responsável por desenhar informações na tela, como
 vidas (corações), mensagem de game over, instrução para reiniciar e um
 timer. Os métodos aqui não gerenciam o estado do jogo, apenas o exibem
 com base nos atributos do objeto `jogo` passado na inicialização.
+
+Textos renderizados (e suas sombras) ficam em um cache LRU do módulo,
+indexado por (tamanho da fonte, texto, cor): o timer só renderiza
+de novo quando o segundo exibido muda, e as mensagens fixas uma única vez.
 """
 
+# Quantidade máxima de textos renderizados guardados (o timer gera um novo
+# a cada segundo; os mais antigos são descartados primeiro)
+LIMITE_TEXTOS = 64
+
+_textos = OrderedDict()
+
+
+def renderizar_texto(tamanho, texto, cor):
+    """Retorna a superfície de `texto` na fonte padrão de `tamanho`, via cache."""
+    chave = (tamanho, texto, cor)
+    surf = _textos.get(chave)
+    if surf is not None:
+        _textos.move_to_end(chave)
+        return surf
+
+    surf = carregar_fonte(tamanho).render(texto, True, cor)
+    _textos[chave] = surf
+    if len(_textos) > LIMITE_TEXTOS:
+        _textos.popitem(last=False)
+    return surf
+
 
 class HUD:
     """Gerencia elementos de interface (vidas, textos, timer).
@@ -26,85 +54,83 @@ class HUD:
         # Carrega ícones de coração (cheio/vazio). Em caso de falha, definimos
         # como None para evitar exceções posteriormente — os métodos checam isso.
         try:
-            self.coracao_cheio = pg.image.load("imagens_pygame/cora.png").convert_alpha()
-            self.coracao_vazio = pg.image.load("imagens_pygame/vazio.png").convert_alpha()
-
             TAMANHO = (45, 45)  # redimensiona para caber no HUD da janela 950x880
-            self.coracao_cheio = pg.transform.scale(self.coracao_cheio, TAMANHO)
-            self.coracao_vazio = pg.transform.scale(self.coracao_vazio, TAMANHO)
+            self.coracao_cheio = carregar_imagem("imagens_pygame/cora.png", TAMANHO)
+            self.coracao_vazio = carregar_imagem("imagens_pygame/vazio.png", TAMANHO)
         except Exception as e:
             # Log simples e fallback para None; evita travar se arquivos de asset faltarem
             print("❌ Erro ao carregar ícones de coração:", e)
             self.coracao_cheio = None
             self.coracao_vazio = None
 
-        # Fontes e cores usadas pelo HUD
-        self.fonte_gameover = pg.font.Font(None, 84)
-        self.fonte_instrucao = pg.font.Font(None, 36)
+        # Fontes e cores usadas pelo HUD (fontes compartilhadas pelo processo)
+        self.fonte_gameover = carregar_fonte(84)
+        self.fonte_instrucao = carregar_fonte(36)
         self.cor_gameover = (255, 50, 50)
         self.cor_instrucao = (255, 255, 255)
         self.sombra = (0, 0, 0)
 
-    def desenhar_vidas(self):
-        """Desenha os ícones de vida no topo da tela.
+        # Posições fixas dos 3 corações no topo (o jogo usa 3 vidas por padrão):
+        # 25 px da borda esquerda, 55 px entre corações, 20 px do topo
+        self._posicoes_coracoes = [(25 + i * 55, 20) for i in range(3)]
+
+        # Último valor exibido pelo timer e sua superfície/posição
+        self._timer = (None, None, None)
 
-        Usa `self.jogo.vidas` para decidir quantos corações cheios desenhar.
-        Se os ícones não estiverem disponíveis (None), o método retorna
-        imediatamente sem desenhar nada.
+    def desenho_vidas(self, lista):
+        """Acrescenta a `lista` os pares (ícone, posição) dos corações, para `Surface.blits`.
+
+        Usa `self.jogo.vidas` para decidir quantos corações cheios desenhar
+        (os demais ficam vazios). Se os ícones não estiverem disponíveis
+        (None), não acrescenta nada. Retorna a própria lista.
         """
         if not self.coracao_cheio or not self.coracao_vazio:
-            return
-
-        # posição fixa no topo
-        x_inicial = 25   # distância da borda esquerda
-        y = 20           # distância do topo da tela
-
-        # Desenha até 3 corações (o jogo usa 3 vidas por padrão)
-        for i in range(3):
-            x = x_inicial + i * 55  # espaçamento horizontal entre corações
-            if i < self.jogo.vidas:
-                # Coração cheio para vidas restantes
-                self.janela.blit(self.coracao_cheio, (x, y))
-            else:
-                # Coração vazio para vidas perdidas
-                self.janela.blit(self.coracao_vazio, (x, y))
+            return lista
+        vidas = self.jogo.vidas
+        for i, posicao in enumerate(self._posicoes_coracoes):
+            lista.append((self.coracao_cheio if i < vidas else self.coracao_vazio, posicao))
+        return lista
+
+    def desenhar_vidas(self):
+        """Desenha os ícones de vida no topo da tela (ver `desenho_vidas`)."""
+        self.janela.blits(self.desenho_vidas([]), 0)
 
     def desenhar_gameover(self):
         """Desenha o texto centralizado 'GAME OVER' com sombra.
 
-        Usamos duas renderizações (sombra + texto) para melhorar visibilidade.
+        Usamos duas renderizações (sombra + texto) para melhorar visibilidade;
+        ambas saem do cache depois da primeira chamada.
         """
-        texto = "GAME OVER"
-        surf = self.fonte_gameover.render(texto, True, self.cor_gameover)
-        rect = surf.get_rect(center=(self.janela.get_width() // 2, self.janela.get_height() // 2 - 40))
-        sombra_surf = self.fonte_gameover.render(texto, True, self.sombra)
-        sombra_rect = sombra_surf.get_rect(center=(rect.centerx + 3, rect.centery + 3))
-        self.janela.blit(sombra_surf, sombra_rect)
-        self.janela.blit(surf, rect)
+        centro = (self.janela.get_width() // 2, self.janela.get_height() // 2 - 40)
+        self._blit_com_sombra(84, "GAME OVER", self.cor_gameover, centro, 3)
 
     def desenhar_reiniciar_instrucao(self):
         """Desenha instrução para reiniciar abaixo do texto de game over.
 
         Também desenha a sombra do texto para contraste sobre o fundo.
         """
-        texto = "Pressione R para reiniciar"
-        surf = self.fonte_instrucao.render(texto, True, self.cor_instrucao)
-        rect = surf.get_rect(center=(self.janela.get_width() // 2, self.janela.get_height() // 2 + 40))
-        sombra_surf = self.fonte_instrucao.render(texto, True, self.sombra)
-        sombra_rect = sombra_surf.get_rect(center=(rect.centerx + 2, rect.centery + 2))
-        self.janela.blit(sombra_surf, sombra_rect)
+        centro = (self.janela.get_width() // 2, self.janela.get_height() // 2 + 40)
+        self._blit_com_sombra(36, "Pressione R para reiniciar", self.cor_instrucao, centro, 2)
+
+    def _blit_com_sombra(self, tamanho, texto, cor, centro, deslocamento):
+        """Desenha `texto` centrado em `centro` com a sombra deslocada por baixo."""
+        surf = renderizar_texto(tamanho, texto, cor)
+        sombra_surf = renderizar_texto(tamanho, texto, self.sombra)
+        rect = surf.get_rect(center=centro)
+        self.janela.blit(sombra_surf, rect.move(deslocamento, deslocamento))
         self.janela.blit(surf, rect)
 
     def desenhar_timer(self, segundos):
         """Desenha o cronômetro no canto superior direito.
 
-        Recebe os segundos totais e formata em MM:SS para exibição.
+        Recebe os segundos totais e formata em MM:SS para exibição. Só
+        formata e renderiza de novo quando o valor muda (uma vez por segundo).
         """
-        minutos = segundos // 60
-        segundos = segundos % 60
-        tempo_str = f" {minutos:02}:{segundos:02}"
-
-        fonte_timer = pg.font.Font(None, 40)
-        surf = fonte_timer.render(tempo_str, True, (255, 255, 255))
-        rect = surf.get_rect(topright=(self.janela.get_width() - 30, 20))
+        valor, surf, rect = self._timer
+        if valor != segundos:
+            minutos, resto = divmod(segundos, 60)
+            tempo_str = f" {minutos:02}:{resto:02}"
+            surf = renderizar_texto(40, tempo_str, (255, 255, 255))
+            rect = surf.get_rect(topright=(self.janela.get_width() - 30, 20))
+            self._timer = (segundos, surf, rect)
         self.janela.blit(surf, rect)
@@ -1,98 +1,168 @@
+from collections import namedtuple
+
 import pygame as pg
+from classes.enemies import TAMANHOS_POR_TIPO, TAMANHO_FENO
 
 
 """
 Módulo de gerenciamento de fases/níveis.
 
-Define a classe `Fases` que armazena configurações específicas de cada fase
-(mapa de plataformas, posições Y, áreas de chegada, dificuldade) e fornece
-um método para transicionar para a próxima fase.
+Define a tabela `CONFIG_FASES` com os dados de cada fase (pistas, posições
+Y, áreas de chegada, dificuldade) e a classe `Fases`, que ao entrar em uma
+fase monta uma vez a lista de descritores de pista (`DescritorPista`)
+consumida pelo desenho, pelo movimento e pela colisão. Adicionar uma fase
+nova é só acrescentar uma entrada em `CONFIG_FASES`.
 """
 
 
+# Padrões de movimento: (velocidade base, direção, limite de saída, reentrada)
+# - ESQUERDA: anda para a esquerda, sai em -120 e volta em 880
+# - DIREITA_MEDIA: anda para a direita, sai em 950 e volta em -300
+# - DIREITA_LENTA: anda para a direita, sai em 880 e volta em -100
+ESQUERDA = (2, -1, -120, 880)
+DIREITA_MEDIA = (1.5, 1, 950, -300)
+DIREITA_LENTA = (1, 1, 880, -100)
+
+# Dados de cada fase. Cada pista é um dicionário com:
+# - tipo: chave de TAMANHOS_POR_TIPO (sprite desenhado)
+# - y: posição vertical do centro da pista
+# - movimento: um dos padrões acima
+# - xs: posições X iniciais dos obstáculos
+# - hitbox (opcional): tamanho da hitbox, se diferente do sprite
+# - vel_animacao (opcional): quadros de animação por tick, se diferente
+#   do "vel_animacao" da fase
+# - defasagem (opcional): ticks de diferença na animação entre obstáculos
+#   vizinhos da pista (0 = todos no mesmo quadro)
+# A chave opcional "mensagem" é impressa ao entrar na fase.
+CONFIG_FASES = {
+    1: {
+        "v_dif": 0,
+        "vel_animacao": 0.20,
+        "area_fazenda": (120, 50, 100, 40),
+        "area_ovos": (0, 0, 1, 1),
+        "pistas": [
+            {"tipo": "feno", "y": 195, "movimento": ESQUERDA, "xs": [60, 420, 660]},
+            {"tipo": "cobra", "y": 295, "movimento": DIREITA_MEDIA, "xs": [50, 650]},
+            {"tipo": "jacare", "y": 395, "movimento": DIREITA_LENTA, "xs": [50, 250, 450, 800]},
+            {"tipo": "feno", "y": 495, "movimento": ESQUERDA, "xs": [120, 360, 720]},
+            {"tipo": "cobra", "y": 595, "movimento": DIREITA_MEDIA, "xs": [0, 700]},
+            {"tipo": "jacare", "y": 695, "movimento": DIREITA_LENTA, "xs": [100, 250, 700, 800]},
+        ],
+    },
+    2: {
+        "v_dif": 1.8,
+        "vel_animacao": 0.15,
+        "area_fazenda": (0, 0, 1, 1),
+        "area_ovos": (475, 100, 100, 50),
+        "mensagem": "🐔 Entrou na fazenda — Fase 2 iniciada!",
+        "pistas": [
+            {"tipo": "ratazana", "y": 330, "movimento": ESQUERDA, "xs": [50, 250, 450, 800]},
+            # Escorpiões usam a hitbox dos fenos (mesmo comportamento do jogo original)
+            {"tipo": "esc", "y": 470, "movimento": DIREITA_MEDIA, "xs": [120, 360, 720],
+             "hitbox": TAMANHO_FENO},
+            {"tipo": "cobra", "y": 610, "movimento": DIREITA_LENTA, "xs": [120, 360, 720]},
+        ],
+    },
+}
+
+
+# Descritor de uma pista, montado uma vez ao entrar na fase:
+# - tipo: chave do tipo de obstáculo (frames na visão)
+# - y: centro vertical da pista
+# - tamanho: tamanho do sprite (largura, altura)
+# - hitbox: (dx, dy, largura, altura) da hitbox relativa ao ponto (x, y)
+# - deslocamento_sprite: (dx, dy) do canto superior esquerdo do sprite relativo a (x, y)
+# - velocidade: pixels por quadro com sinal (já somada a v_dif)
+# - limite, reinicio: limites de saída da tela e posição de reentrada
+# - vel_animacao, defasagem: ritmo da animação e defasagem entre obstáculos
+#   (ver `classes/animacao.py`)
+DescritorPista = namedtuple(
+    "DescritorPista",
+    ["tipo", "y", "tamanho", "hitbox", "deslocamento_sprite", "velocidade", "limite", "reinicio",
+     "vel_animacao", "defasagem"],
+)
+
+
+def montar_descritores(config):
+    """Cria a lista de `DescritorPista` de uma entrada de `CONFIG_FASES`."""
+    descritores = []
+    for pista in config["pistas"]:
+        tamanho = TAMANHOS_POR_TIPO[pista["tipo"]]
+        largura_hit, altura_hit = pista.get("hitbox", tamanho)
+        base, direcao, limite, reinicio = pista["movimento"]
+        descritores.append(DescritorPista(
+            tipo=pista["tipo"],
+            y=pista["y"],
+            tamanho=tamanho,
+            hitbox=(0, -(altura_hit // 2), largura_hit, altura_hit),
+            # O sprite é centralizado em (x + largura // 2, y)
+            deslocamento_sprite=(0, -(tamanho[1] // 2)),
+            velocidade=direcao * (base + config["v_dif"]),
+            limite=limite,
+            reinicio=reinicio,
+            vel_animacao=pista.get("vel_animacao", config["vel_animacao"]),
+            defasagem=pista.get("defasagem", 0),
+        ))
+    return descritores
+
+
 class Fases:
     """Gerencia dados de níveis e transição de fases.
 
-    Cada instância armazena as plataformas (linhas_das_plataformas), posições
-    verticais (y_posicoes_*), áreas de colisão (area_fazenda, area_ovos) e
-    dificuldade (v_dif) para a fase atual. O método `proxima_fase()` atualiza
-    esses valores de acordo com o nível.
+    Cada instância armazena as plataformas (linhas_das_plataformas), os
+    descritores de pista da fase atual (pistas), posições verticais
+    (y_posicoes_*), áreas de colisão (area_fazenda, area_ovos) e
+    dificuldade (v_dif). O método `proxima_fase()` atualiza esses valores
+    de acordo com o nível.
     """
 
     def __init__(self):
         # --- parâmetros gerais ---
-        # Fase começa em 1; v_dif é um multiplicador de velocidade
+        # Fase começa em 1; v_dif e as demais configurações vêm de
+        # CONFIG_FASES (ver `_entrar_fase`)
         self.fase = 1
-        self.v_dif = 0
 
-        # --- Áreas e posições ---
-        # area_fazenda: zona de chegada (destino de vitória da fase 1)
-        # area_ovos: zona dos ovos (meta final da fase 2, inicialmente "vazia")
-        self.area_fazenda = pg.Rect(120, 50, 100, 40)
-        self.area_ovos = pg.Rect(0, 0, 1, 1)
         # y_posicoes_fase1: posições Y (verticais) das 6 linhas de plataformas na fase 1
         # y_posicoes_fase2: posições Y das 3 linhas de plataformas na fase 2
-        self.y_posicoes_fase1 = [195, 295, 395, 495, 595, 695]
-        self.y_posicoes_fase2 = [330, 470, 610]
-
-        # --- Plataformas iniciais (Fase 1) ---
-        # lista de 6 linhas, cada uma contendo as posições X dos objetos naquela linha
-        # Ordem das linhas: [fenos (cima), cobras (cima), jacarés (meio),
-        #                    fenos (baixo), cobras (baixo), jacarés (fundo)]
-        self.linhas_das_plataformas = [
-            [60, 420, 660],        # fenos (cima)
-            [50, 650],             # cobras (cima)
-            [50, 250, 450, 800],   # jacarés (meio)
-            [120, 360, 720],       # fenos (baixo)
-            [0, 700],              # cobras (baixo)
-            [100, 250, 700, 800],  # jacarés (fundo)
-        ]
+        self.y_posicoes_fase1 = [pista["y"] for pista in CONFIG_FASES[1]["pistas"]]
+        self.y_posicoes_fase2 = [pista["y"] for pista in CONFIG_FASES[2]["pistas"]]
+
+        # --- Plataformas, áreas e dificuldade da fase 1 ---
+        # linhas_das_plataformas: lista de linhas, cada uma com as posições X
+        # dos objetos naquela linha (ordem de CONFIG_FASES[1]["pistas"])
+        self._entrar_fase(CONFIG_FASES[1])
+
+    # -------------------------------------------------------------
+    def _entrar_fase(self, config):
+        """Aplica uma entrada de `CONFIG_FASES` e monta os descritores de pista."""
+        self.v_dif = config["v_dif"]
+        self.vel_animacao = config["vel_animacao"]
+        # area_fazenda: zona de chegada (destino da fase 1; 1x1 = desativada)
+        # area_ovos: zona dos ovos (meta final; 1x1 = "vazia")
+        self.area_fazenda = pg.Rect(*config["area_fazenda"])
+        self.area_ovos = pg.Rect(*config["area_ovos"])
+        self.linhas_das_plataformas = [list(pista["xs"]) for pista in config["pistas"]]
+        self.pistas = montar_descritores(config)
 
     # -------------------------------------------------------------
     def proxima_fase(self):
         """Avança para a próxima fase e atualiza configurações.
 
         - Incrementa `self.fase` e imprime mensagem.
-        - Se fase == 2: troca a área de chegada pela área de ovos, aumenta
-          dificuldade (v_dif = 1.8), redefine plataformas e tenta carregar
-          novo fundo (fundo_fazenda_2.png).
-        - Se fase == 3: prepara para fase 3 (aumenta v_dif e aviso).
-        - Casos posteriores: marca como "zerou o jogo".
+        - Se a fase existe em `CONFIG_FASES`: aplica áreas, dificuldade e
+          pistas dela (na fase 2 a área de chegada vira a área dos ovos).
+        - Passando da última fase de `CONFIG_FASES`: marca como "zerou o jogo"
+          (`game_over`).
         """
         self.fase += 1
         print(f"🌾 Indo para a fase {self.fase}!")
 
-        if self.fase == 2:
-            # Define nova meta (área dos ovos) na parte superior central
-            self.area_ovos = pg.Rect(475, 100, 100, 50)
-            # Aumenta dificuldade multiplicando velocidades das plataformas
-            self.v_dif = 1.8
-            try:
-                # Desativa a área da fazenda (redimensiona para 1x1 invisível)
-                self.area_fazenda = pg.Rect(0, 0, 1, 1)
-                # Carrega novo fundo (fase 2 ocorre dentro da fazenda)
-                self.fundo_imagem = pg.image.load("imagens_pygame/fundo_fazenda_2.png").convert()
-                self.fundo_imagem = pg.transform.scale(self.fundo_imagem, (950, 880))
-                print("🐔 Entrou na fazenda — Fase 2 iniciada!")
-            except Exception:
-                # Se fundo não existir, apenas avisa mas continua
-                print("⚠️ Fundo da Fase 2 não encontrado!")
-
-            # Redefine as plataformas para fase 2 (3 linhas: ratazanas, escorpiões, cobras)
-            self.linhas_das_plataformas = [
-                [50, 250, 450, 800],   # Ratazanas
-                [120, 360, 720],       # Escorpiões
-                [120, 360, 720],       # Cobras
-            ]
-            print("⚙️ Fase 2: Ratazanas, Escorpiões e Cobras.")
-            # Diminui velocidade de animação (frames passam mais lento)
-            self.vel_animacao = 0.15
-
-        elif self.fase == 3:
-            print("🚜 Fase 3 iniciada! (ainda sem cenário)")
-            # Aumenta mais ainda a velocidade de animação
-            self.vel_animacao = 0.3
+        if self.fase in CONFIG_FASES:
+            self._entrar_fase(CONFIG_FASES[self.fase])
+            if "mensagem" in CONFIG_FASES[self.fase]:
+                print(CONFIG_FASES[self.fase]["mensagem"])
+            print(f"⚙️ Fase {self.fase}: " + ", ".join(p.tipo for p in self.pistas) + ".")
         else:
-            # Qualquer fase > 3 é considerada vitória
+            # Qualquer fase além da tabela é considerada vitória
             print("🎉 Você zerou o jogo!")
             self.game_over = True
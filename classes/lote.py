@@ -0,0 +1,217 @@
+import random
+
+import numpy as np
+from classes.levels import Fases
+from classes.pistas import MotorPistas
+from classes.simulacao import ACOES
+from classes.player import (
+    TAMANHO_RAPOSA,
+    POSICAO_INICIAL_RAPOSA,
+    VELOCIDADE_RAPOSA,
+    AJUSTE_Y_RAPOSA,
+)
+
+
+"""
+Simulação em lote de várias partidas independentes.
+
+Define a classe `LoteMundos`, que avança N partidas (sementes e posições
+da raposa diferentes) com uma única chamada a `step`. Todo o estado fica
+em arrays NumPy — posições da raposa (N, 2), vidas, fase, e as pistas de
+cada fase em um `MotorPistas` com dimensão de lote — e as colisões são
+calculadas para todas as partidas de uma vez, devolvidas como array bool.
+
+Cada partida i de um lote criado com `sementes[i]` evolui exatamente como
+`MundoFazenda(sementes[i])` com as mesmas ações. O lote cobre as fases 1 e
+2 (as que têm cenário); ao chegar nos ovos a partida termina.
+"""
+
+
+# Códigos inteiros das ações: 0 = parado, 1.. = ACOES na mesma ordem
+CODIGOS_ACAO = {None: 0}
+CODIGOS_ACAO.update({acao: i + 1 for i, acao in enumerate(ACOES)})
+
+# Deslocamento (dx, dy) da raposa para cada código de ação
+DESLOCAMENTOS = np.array(
+    [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)], dtype=np.float64
+) * VELOCIDADE_RAPOSA
+
+
+def _fases_na(numero):
+    """Retorna um `Fases` já avançado até a fase `numero`."""
+    fases = Fases()
+    while fases.fase < numero:
+        fases.proxima_fase()
+    return fases
+
+
+class _PistasDaFase:
+    """Pistas e hitboxes de uma fase para todas as partidas do lote."""
+
+    def __init__(self, numero, n):
+        self.fases = _fases_na(numero)
+        self.layout = [list(xs) for xs in self.fases.linhas_das_plataformas]
+        self.motor = MotorPistas.da_fase(self.fases, lote=n)
+
+        desloc, larguras, alturas, topos = [], [], [], []
+        for pista, xs in zip(self.fases.pistas, self.layout):
+            dx, dy, largura, altura = pista.hitbox
+            for _ in xs:
+                desloc.append(dx)
+                larguras.append(largura)
+                alturas.append(altura)
+                topos.append(int(pista.y + dy))
+
+        # Hitbox por obstáculo: só o X muda a cada quadro
+        self.desloc = np.array(desloc, dtype=np.float64)
+        self.larguras = np.array(larguras, dtype=np.float64)
+        self.topos = np.array(topos, dtype=np.float64)
+        self.bases = self.topos + np.array(alturas, dtype=np.float64)
+
+    def reiniciar(self, indice, rng):
+        """Recoloca as pistas da partida `indice` no layout inicial da fase."""
+        xs = [x for linha in self.layout for x in linha]
+        if rng is not None:
+            xs = [x + rng.randint(-40, 40) for x in xs]
+        self.motor.xs[indice] = xs
+        # Mantém cada pista ordenada por X, como o motor espera
+        for i in range(self.motor.n_pistas):
+            a, b = self.motor.inicio[i], self.motor.inicio[i + 1]
+            self.motor.xs[indice, a:b].sort()
+
+    def colisoes(self, indices, rx, ry, rw, rh):
+        """Retorna um array bool: a raposa de cada partida em `indices` colidiu?
+
+        Usa a mesma regra de `pg.Rect.colliderect` (interseção estrita),
+        com o X dos obstáculos truncado para inteiro como no jogo.
+        """
+        esquerda = np.trunc(self.motor.xs[indices] + self.desloc)
+        sobrepoe = (
+            (rx[:, None] < esquerda + self.larguras)
+            & (esquerda < (rx + rw)[:, None])
+            & (ry[:, None] < self.bases)
+            & (self.topos < (ry + rh)[:, None])
+        )
+        return sobrepoe.any(axis=1)
+
+
+class LoteMundos:
+    """N partidas independentes avançadas juntas com operações vetorizadas.
+
+    Parâmetros:
+    - n: número de partidas
+    - sementes: lista opcional com uma semente por partida (None = layout
+      original, como em `MundoFazenda`)
+
+    Atributos principais (arrays de tamanho N):
+    - pos_raposa: posições (N, 2) da raposa
+    - vidas, fase, tick: estado de cada partida
+    - game_over, reached_ovos: flags de fim de partida
+    """
+
+    def __init__(self, n, sementes=None):
+        self.n = n
+        if sementes is None:
+            sementes = [None] * n
+        self.rngs = [random.Random(s) if s is not None else None for s in sementes]
+
+        self.pos_raposa = np.tile(np.array(POSICAO_INICIAL_RAPOSA, dtype=np.float64), (n, 1))
+        self.vidas = np.full(n, 3, dtype=np.int64)
+        self.fase = np.ones(n, dtype=np.int64)
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.reached_ovos = np.zeros(n, dtype=bool)
+
+        self.pistas = {1: _PistasDaFase(1, n), 2: _PistasDaFase(2, n)}
+        for i, rng in enumerate(self.rngs):
+            self.pistas[1].reiniciar(i, rng)
+
+        area = self.pistas[1].fases.area_fazenda
+        self.area_fazenda = (area.x, area.y, area.right, area.bottom)
+        area = self.pistas[2].fases.area_ovos
+        self.area_ovos = (area.x, area.y, area.right, area.bottom)
+
+    # -------------------------------------------------------------
+    def _rect_raposa(self):
+        """Retorna (x, y, largura, altura) da hitbox da raposa de cada partida."""
+        rx = np.trunc(self.pos_raposa[:, 0])
+        ry = np.trunc(self.pos_raposa[:, 1] + AJUSTE_Y_RAPOSA)
+        return rx, ry, float(TAMANHO_RAPOSA[0]), float(TAMANHO_RAPOSA[1])
+
+    @staticmethod
+    def _sobre_area(rx, ry, rw, rh, area):
+        x0, y0, x1, y1 = area
+        return (rx < x1) & (x0 < rx + rw) & (ry < y1) & (y0 < ry + rh)
+
+    # -------------------------------------------------------------
+    def step(self, acoes=None):
+        """Avança todas as partidas ativas em um quadro.
+
+        - `acoes`: None (todas paradas), um array de códigos de
+          `CODIGOS_ACAO` ou uma sequência de nomes/None por partida.
+
+        Retorna um array bool com as partidas que colidiram neste quadro.
+        """
+        if acoes is not None:
+            self.mover(acoes)
+        return self.avancar()
+
+    # -------------------------------------------------------------
+    def mover(self, acoes, indices=None):
+        """Desloca a raposa das partidas ativas, sem avançar o tick.
+
+        - `acoes`: códigos de `CODIGOS_ACAO` ou nomes/None; um por partida,
+          ou um por elemento de `indices`
+        - `indices`: partidas que recebem cada ação. Índices repetidos
+          acumulam, como vários movimentos de teclado no mesmo tick.
+        """
+        if not isinstance(acoes, np.ndarray):
+            acoes = np.array([CODIGOS_ACAO[a] for a in acoes], dtype=np.intp)
+        if indices is None:
+            ativas = ~self.game_over
+            self.pos_raposa[ativas] += DESLOCAMENTOS[acoes[ativas]]
+            return
+        ativas = ~self.game_over[indices]
+        np.add.at(self.pos_raposa, indices[ativas], DESLOCAMENTOS[acoes[ativas]])
+
+    # -------------------------------------------------------------
+    def avancar(self):
+        """Avança um tick sem mover a raposa (pistas, colisões, fases).
+
+        Retorna um array bool com as partidas que colidiram neste tick.
+        """
+        ativas = ~self.game_over
+
+        # --- Pistas (todas as partidas; as encerradas são ignoradas) ---
+        for pistas in self.pistas.values():
+            pistas.motor.atualizar()
+
+        # --- Colisão com obstáculos ---
+        rx, ry, rw, rh = self._rect_raposa()
+        colidiu = np.zeros(self.n, dtype=bool)
+        for numero, pistas in self.pistas.items():
+            indices = np.flatnonzero(ativas & (self.fase == numero))
+            if len(indices):
+                colidiu[indices] = pistas.colisoes(indices, rx[indices], ry[indices], rw, rh)
+
+        self.vidas[colidiu] -= 1
+        np.maximum(self.vidas, 0, out=self.vidas)
+        self.game_over |= colidiu & (self.vidas == 0)
+        self.pos_raposa[colidiu] = POSICAO_INICIAL_RAPOSA
+
+        # --- Áreas de chegada (com a posição já resetada) ---
+        vivas = ativas & ~self.game_over
+        rx, ry, rw, rh = self._rect_raposa()
+        # Só a fase 1 tem área de chegada; a da fase 2 (1x1) é desativada
+        chegou = vivas & (self.fase == 1) & self._sobre_area(rx, ry, rw, rh, self.area_fazenda)
+        for i in np.flatnonzero(chegou):
+            self.fase[i] = 2
+            self.pistas[2].reiniciar(i, self.rngs[i])
+        self.pos_raposa[chegou] = POSICAO_INICIAL_RAPOSA
+
+        ovos = vivas & (self.fase == 2) & ~chegou & self._sobre_area(rx, ry, rw, rh, self.area_ovos)
+        self.reached_ovos |= ovos
+        self.game_over |= ovos
+
+        self.tick[ativas] += 1
+        return colidiu
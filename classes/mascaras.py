@@ -0,0 +1,115 @@
+import hashlib
+
+import pygame as pg
+from classes.animacao import AnimacaoPistas
+from classes.enemies import ARQUIVOS_POR_TIPO, TAMANHOS_POR_TIPO
+from classes.player import ARQUIVOS_RAPOSA, TAMANHO_RAPOSA
+
+
+"""
+Máscaras de pixels para a colisão exata (narrow phase) da raposa.
+
+A colisão normal compara retângulos do tamanho dos sprites, então as
+bordas transparentes (a cobra tem 110x50, a ratazana 90x50) tiram vidas sem
+que os desenhos se toquem. Com um `MascarasColisao` em
+`MundoFazenda.mascaras`, um par cujo retângulo já colidiu (broad phase, o
+mesmo teste de sempre) só conta se algum pixel opaco da raposa encostar em
+um pixel opaco do obstáculo, no quadro de animação que está na tela.
+
+As máscaras são calculadas uma vez por sprite (`assets.mascara_de`) por
+`Inimigos` e `Raposa` ao carregar; `MascarasColisao.carregar()` monta o
+mesmo conjunto direto dos PNGs, sem janela, para refazer gravações.
+
+O quadro de animação de cada obstáculo sai das mesmas tabelas por tick da
+visão (`classes/animacao.py`), então a colisão exata continua
+determinística. Como ela muda o resultado das partidas, a gravação feita
+com máscaras leva uma assinatura própria
+(`classes/replay.py::assinatura_config`).
+"""
+
+
+_padrao = None
+
+
+class MascarasColisao:
+    """Máscaras dos quadros de cada tipo de obstáculo e das poses da raposa.
+
+    Atributos:
+    - por_tipo: {tipo: [Mask de cada quadro]} (chaves de `Inimigos.frames_por_tipo`)
+    - raposa: {ação: Mask} da pose mostrada após cada ação
+      ("up" = costas, "down" = frente, "left"/"right" = lados)
+    """
+
+    def __init__(self, por_tipo, raposa):
+        self.por_tipo = por_tipo
+        self.raposa = raposa
+        self._animacao = None
+        self._assinatura = None
+
+    # -------------------------------------------------------------
+    @classmethod
+    def de_sprites(cls, inimigos, raposa):
+        """Usa as máscaras já calculadas por `Inimigos` e `Raposa`."""
+        return cls(inimigos.mascaras_por_tipo, raposa.mascaras)
+
+    @classmethod
+    def carregar(cls):
+        """Monta as máscaras direto dos PNGs, sem janela (replay e verificação).
+
+        Os sprites são lidos e escalados como em `assets.carregar_imagem`,
+        sem a conversão para o formato do display (que não muda o alpha).
+        Frames ausentes são pulados, como em `Inimigos`.
+        """
+        def mascara(caminho, tamanho):
+            return pg.mask.from_surface(pg.transform.scale(pg.image.load(caminho), tamanho))
+
+        por_tipo = {}
+        for tipo, arquivos in ARQUIVOS_POR_TIPO.items():
+            por_tipo[tipo] = []
+            for caminho in arquivos:
+                try:
+                    por_tipo[tipo].append(mascara(caminho, TAMANHOS_POR_TIPO[tipo]))
+                except (pg.error, OSError):
+                    continue
+        frente, costas, esquerda, direita = (mascara(c, TAMANHO_RAPOSA) for c in ARQUIVOS_RAPOSA)
+        return cls(por_tipo, {"up": costas, "down": frente, "left": esquerda, "right": direita})
+
+    @classmethod
+    def padrao(cls):
+        """As máscaras de `carregar()`, montadas uma vez por processo."""
+        global _padrao
+        if _padrao is None:
+            _padrao = cls.carregar()
+        return _padrao
+
+    # -------------------------------------------------------------
+    def animacao(self, pistas):
+        """`AnimacaoPistas` das máscaras para os descritores `pistas` da fase."""
+        if self._animacao is None or self._animacao.pistas is not pistas:
+            self._animacao = AnimacaoPistas(pistas, self.por_tipo)
+        return self._animacao
+
+    def colide(self, acao, quadro, dx, dy):
+        """Algum pixel da raposa encosta em um pixel do obstáculo?
+
+        - acao: última ação da raposa (define a pose desenhada)
+        - quadro: máscara do obstáculo no tick (de `animacao(...).quadro`);
+          None (tipo sem frames) fica só com o teste de retângulos (True)
+        - dx, dy: canto do sprite do obstáculo relativo ao canto da raposa
+        """
+        if quadro is None:
+            return True
+        return self.raposa[acao].overlap(quadro, (dx, dy)) is not None
+
+    def assinatura(self):
+        """SHA-256 dos bits de todas as máscaras."""
+        if self._assinatura is None:
+            h = hashlib.sha256(b"animacao pelo tick desenhado")
+            grupos = sorted(self.por_tipo.items()) + [(acao, [m]) for acao, m in sorted(self.raposa.items())]
+            for chave, mascaras in grupos:
+                h.update(chave.encode())
+                for mascara in mascaras:
+                    h.update(repr(mascara.get_size()).encode())
+                    h.update(pg.image.tobytes(mascara.to_surface(), "RGB"))
+            self._assinatura = h.digest()
+        return self._assinatura
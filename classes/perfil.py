@@ -0,0 +1,209 @@
+import csv
+import json
+import time
+
+import numpy as np
+import pygame as pg
+from classes.assets import carregar_fonte
+
+
+"""
+Contadores de tempo por fase do quadro e overlay de desempenho.
+
+O `Perfilador` divide cada quadro em fases (eventos, pistas, colisões,
+desenho das plataformas, HUD, `display.update`, espera do relógio...).
+O código do jogo chama `marcar(nome)` ao fim de cada fase: o tempo desde a
+marca anterior é somado à fase daquele quadro — fases que rodam várias
+vezes por quadro (um tick de simulação por vez) acumulam. Cada marca custa
+uma chamada a `time.perf_counter` e uma soma em lista; as estatísticas
+(médias e percentis com NumPy) só são calculadas quando o overlay é
+redesenhado ou no fim, ao salvar.
+
+Os últimos `capacidade` quadros ficam em um buffer circular (fases x
+quadros). F3 mostra/esconde o overlay com médias e percentis das últimas
+`janela` amostras e o gráfico do tempo de cada quadro; `salvar` grava os
+quadros em CSV ou um resumo em JSON (ver "--perfil ARQUIVO" em main.py).
+"""
+
+
+# Fases do quadro, na ordem em que acontecem no loop de main.py
+FASES = (
+    "eventos",      # pygame.event.get + handle_event da cena
+    "pistas",       # MundoFazenda.atualizar_plataformas (todos os ticks)
+    "colisoes",     # MundoFazenda.checar_colisoes_e_reagir (todos os ticks)
+    "logica",       # resto do update da cena (animação, reações, sons)
+    "fundo",        # limpar_janela / restaurar do renderizador sujo
+    "sprites",      # obstáculos, raposa e corações (um único Surface.blits)
+    "hud",          # timer
+    "perfil",       # o próprio overlay
+    "desenho",      # resto do draw da cena (telas que não marcam fases)
+    "display",      # pg.display.update
+    "espera",       # clock.tick (limite de FPS)
+)
+
+# Cores das referências do gráfico (60 e 30 quadros/s)
+_COR_60 = (80, 200, 80)
+_COR_30 = (220, 180, 60)
+
+
+class Perfilador:
+    """Tempo gasto em cada fase dos últimos quadros.
+
+    Parâmetros:
+    - capacidade: quantos quadros guardar (para o gráfico e o arquivo)
+    - janela: quantos quadros recentes entram nas médias/percentis do overlay
+    - atualizar_a_cada: o painel do overlay é refeito a cada N quadros
+
+    Uso por quadro:
+        perfil.marcar("eventos")
+        ...
+        perfil.fim_quadro()   # marca a "espera" e começa o próximo quadro
+    """
+
+    def __init__(self, capacidade=3600, janela=120, atualizar_a_cada=15):
+        self.capacidade = capacidade
+        self.janela = janela
+        self.atualizar_a_cada = atualizar_a_cada
+        self.visivel = False
+
+        self._indices = {nome: i for i, nome in enumerate(FASES)}
+        self._amostras = np.zeros((len(FASES), capacidade))
+        self._atual = [0.0] * len(FASES)
+        self.quadros = 0  # total de quadros medidos na sessão
+        self._painel = None
+        self._ultimo = time.perf_counter()
+
+    # -------------------------------------------------------------
+    def reiniciar(self):
+        """Passa a medir a partir de agora (descarta o quadro em andamento)."""
+        self._atual = [0.0] * len(FASES)
+        self._ultimo = time.perf_counter()
+
+    def marcar(self, nome):
+        """Soma à fase `nome` o tempo desde a marca anterior."""
+        agora = time.perf_counter()
+        self._atual[self._indices[nome]] += agora - self._ultimo
+        self._ultimo = agora
+
+    def fim_quadro(self):
+        """Marca a espera, guarda o quadro no buffer e começa o próximo."""
+        self.marcar("espera")
+        self._amostras[:, self.quadros % self.capacidade] = self._atual
+        self._atual = [0.0] * len(FASES)
+        self.quadros += 1
+        if self.visivel and self.quadros % self.atualizar_a_cada == 0:
+            self._painel = None
+
+    def alternar(self):
+        """Mostra/esconde o overlay (tecla F3)."""
+        self.visivel = not self.visivel
+        self._painel = None
+
+    # -------------------------------------------------------------
+    def ultimos(self, n=None):
+        """Retorna as amostras (fases x quadros) dos `n` últimos quadros, em ms."""
+        n = min(n or self.capacidade, self.quadros, self.capacidade)
+        fim = self.quadros % self.capacidade
+        colunas = (np.arange(fim - n, fim)) % self.capacidade
+        return self._amostras[:, colunas] * 1000.0
+
+    def estatisticas(self, n=None):
+        """Resumo em ms por fase (e do quadro inteiro) dos `n` últimos quadros.
+
+        Retorna {nome: {"media", "p50", "p95", "p99", "max"}}, incluindo
+        "quadro" (soma de todas as fases) e "trabalho" (quadro sem a espera).
+        """
+        amostras = self.ultimos(n)
+        if amostras.shape[1] == 0:
+            return {}
+        quadro = amostras.sum(axis=0)
+        linhas = dict(zip(FASES, amostras))
+        linhas["quadro"] = quadro
+        linhas["trabalho"] = quadro - amostras[self._indices["espera"]]
+
+        resumo = {}
+        for nome, valores in linhas.items():
+            p50, p95, p99 = np.percentile(valores, (50, 95, 99))
+            resumo[nome] = {
+                "media": float(valores.mean()), "p50": float(p50),
+                "p95": float(p95), "p99": float(p99), "max": float(valores.max()),
+            }
+        return resumo
+
+    # -------------------------------------------------------------
+    def desenhar(self, superficie):
+        """Desenha o overlay à direita, abaixo do timer, se estiver visível."""
+        if not self.visivel:
+            return
+        if self._painel is None:
+            self._painel = self._montar_painel()
+        superficie.blit(self._painel, (superficie.get_width() - self._painel.get_width() - 10, 70))
+
+    def _montar_painel(self):
+        """Renderiza o painel: FPS, tabela média/p95/p99 por fase e gráfico."""
+        fonte = carregar_fonte(20)
+        branco = (255, 255, 255)
+        largura, altura_linha, altura_grafico = 300, 16, 70
+        resumo = self.estatisticas(self.janela)
+        nomes = [nome for nome in FASES if nome in resumo] + ["trabalho", "quadro"]
+
+        altura = 24 + altura_linha * (len(nomes) + 1) + altura_grafico + 10
+        painel = pg.Surface((largura, altura), pg.SRCALPHA)
+        painel.fill((0, 0, 0, 170))
+        if not resumo:
+            return painel
+
+        fps = 1000.0 / max(resumo["quadro"]["media"], 1e-6)
+        painel.blit(fonte.render(f"{fps:5.1f} FPS   (F3 esconde)", True, branco), (8, 6))
+        y = 24
+        # Fonte proporcional: nome à esquerda, números alinhados à direita
+        for nome, valores in [("fase (ms)", ("média", "p95", "p99"))] + [
+            (nome, [f"{resumo[nome][chave]:.2f}" for chave in ("media", "p95", "p99")])
+            for nome in nomes
+        ]:
+            painel.blit(fonte.render(nome, True, branco), (8, y))
+            for i, valor in enumerate(valores):
+                surf = fonte.render(valor, True, branco)
+                painel.blit(surf, surf.get_rect(topright=(170 + 60 * i, y)))
+            y += altura_linha
+
+        # Gráfico do tempo de cada quadro (ms); escala até 50 ms
+        topo, base = y + 4, y + 4 + altura_grafico
+        escala = altura_grafico / 50.0
+        for ms, cor in ((1000 / 60, _COR_60), (1000 / 30, _COR_30)):
+            linha_y = base - ms * escala
+            pg.draw.line(painel, cor, (8, linha_y), (largura - 8, linha_y))
+        quadros = self.ultimos(largura - 16).sum(axis=0)
+        pontos = [(8 + i, base - min(ms, 50.0) * escala) for i, ms in enumerate(quadros)]
+        if len(pontos) > 1:
+            pg.draw.lines(painel, branco, False, pontos)
+        pg.draw.rect(painel, (120, 120, 120), (8, topo, largura - 16, altura_grafico), 1)
+        return painel
+
+    # -------------------------------------------------------------
+    def salvar(self, caminho):
+        """Grava os quadros guardados em CSV (ms por fase) ou o resumo em JSON.
+
+        O formato vem da extensão: ".json" grava as estatísticas de todos os
+        quadros guardados e da última janela; qualquer outra grava CSV.
+        """
+        caminho = str(caminho)
+        if caminho.endswith(".json"):
+            dados = {
+                "quadros_medidos": self.quadros,
+                "quadros_guardados": min(self.quadros, self.capacidade),
+                "fases": list(FASES),
+                "todos": self.estatisticas(),
+                "janela": self.estatisticas(self.janela),
+            }
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+            return
+
+        amostras = self.ultimos()
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(("quadro",) + FASES + ("total",))
+            primeiro = self.quadros - amostras.shape[1]
+            for i, coluna in enumerate(amostras.T):
+                escritor.writerow([primeiro + i] + [f"{ms:.4f}" for ms in coluna] + [f"{coluna.sum():.4f}"])
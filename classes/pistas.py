@@ -0,0 +1,126 @@
+import numpy as np
+
+
+"""
+Motor vetorizado das pistas de obstáculos.
+
+Define a classe `MotorPistas`, que guarda as posições X de todos os
+obstáculos de todas as pistas em um único array NumPy contíguo, junto com
+arrays por pista de velocidade (já com sinal/direção), limite de saída da
+tela e posição de reentrada. A atualização de um quadro inteiro vira um
+punhado de operações vetorizadas, independente de quantas pistas ou
+obstáculos existam — o que permite fases de estresse bem mais densas.
+
+Dentro de cada pista as posições ficam ordenadas por X. Como todos os
+obstáculos de uma pista andam na mesma velocidade, a ordem só muda quando
+algum deles sai da tela e reaparece do outro lado; nesse caso (raro) a
+pista é reordenada. Isso permite que a colisão use busca binária.
+Nessa reordenação os obstáculos da pista só giram uma posição por
+obstáculo reposicionado; `rotacao` conta esses giros, o que permite à
+animação saber qual obstáculo ocupa cada posição (`classes/animacao.py`).
+"""
+
+
+class MotorPistas:
+    """Posições e movimento de todos os obstáculos em arrays NumPy.
+
+    Parâmetros:
+    - linhas: lista de listas com as posições X iniciais de cada pista
+    - velocidades: velocidade com sinal de cada pista (pixels por quadro;
+      positiva = direita, negativa = esquerda)
+    - limites: coordenada X a partir da qual o obstáculo saiu da tela
+    - reinicios: coordenada X onde o obstáculo reaparece ao sair
+    - lote: se informado, guarda `lote` cópias independentes das pistas
+      (uma por partida) e `xs` ganha uma dimensão inicial de tamanho `lote`
+
+    Atributos principais:
+    - xs: array float64 com o X de todos os obstáculos, pista após pista
+      (formato (n_obstaculos,) ou (lote, n_obstaculos))
+    - pista: índice da pista de cada obstáculo (mesmo tamanho de `xs`)
+    - inicio: offsets de cada pista em `xs` (pista i = xs[inicio[i]:inicio[i+1]])
+    - rotacao: quantas posições cada pista girou desde a criação
+      (formato (n_pistas,) ou (lote, n_pistas)); o obstáculo que está na
+      posição j da pista i é o de número (j - rotacao[i]) % tamanho
+    """
+
+    def __init__(self, linhas, velocidades, limites, reinicios, lote=None):
+        tamanhos = np.array([len(xs) for xs in linhas], dtype=np.intp)
+        self.inicio = np.zeros(len(linhas) + 1, dtype=np.intp)
+        np.cumsum(tamanhos, out=self.inicio[1:])
+
+        self.xs = np.array([x for xs in linhas for x in xs], dtype=np.float64)
+        if lote is not None:
+            self.xs = np.tile(self.xs, (lote, 1))
+        self.n_pistas = len(linhas)
+        self.pista = np.repeat(np.arange(len(linhas), dtype=np.intp), tamanhos)
+
+        # --- Parâmetros por pista ---
+        self.velocidades = np.asarray(velocidades, dtype=np.float64)
+        self.limites = np.asarray(limites, dtype=np.float64)
+        self.reinicios = np.asarray(reinicios, dtype=np.float64)
+        self.direcoes = np.sign(self.velocidades)
+
+        # --- Parâmetros expandidos por obstáculo ---
+        # Calculados uma vez para que `atualizar` não precise indexar por pista;
+        # com `lote` eles são aplicados a todas as partidas por broadcasting.
+        self._vel_obj = self.velocidades[self.pista]
+        self._dir_obj = self.direcoes[self.pista]
+        self._limite_obj = self.limites[self.pista]
+        self._reinicio_obj = self.reinicios[self.pista]
+        self._saiu = np.empty(self.xs.shape, dtype=bool)
+        self.rotacao = np.zeros(self.xs.shape[:-1] + (self.n_pistas,), dtype=np.intp)
+        self.ordenar()
+
+    # -------------------------------------------------------------
+    @classmethod
+    def da_fase(cls, fases, lote=None):
+        """Cria o motor a partir das pistas e dos descritores de um `Fases`.
+
+        Velocidade, limite e reentrada de cada pista vêm de `fases.pistas`
+        (ver `classes/levels.py::DescritorPista`).
+        """
+        return cls(
+            fases.linhas_das_plataformas,
+            [d.velocidade for d in fases.pistas],
+            [d.limite for d in fases.pistas],
+            [d.reinicio for d in fases.pistas],
+            lote,
+        )
+
+    # -------------------------------------------------------------
+    def atualizar(self):
+        """Avança todos os obstáculos um quadro e reposiciona os que saíram.
+
+        Um obstáculo saiu quando passou do limite no sentido do movimento:
+        (x - limite) * direção > 0.
+        """
+        xs = self.xs
+        xs += self._vel_obj
+        np.greater(np.multiply(np.subtract(xs, self._limite_obj), self._dir_obj), 0, out=self._saiu)
+        if self._saiu.any():
+            np.copyto(xs, self._reinicio_obj, where=self._saiu)
+            self.ordenar(self._saiu)
+
+    # -------------------------------------------------------------
+    def ordenar(self, mascara=None):
+        """Reordena por X as pistas (todas, ou só as marcadas em `mascara`).
+
+        Com `mascara` (obstáculos que acabaram de reaparecer do outro lado),
+        cada um deles gira a pista uma posição no sentido do movimento.
+        """
+        for i in range(self.n_pistas):
+            a, b = self.inicio[i], self.inicio[i + 1]
+            if mascara is None:
+                self.xs[..., a:b].sort(axis=-1)
+            elif mascara[..., a:b].any():
+                self.xs[..., a:b].sort(axis=-1)
+                self.rotacao[..., i] += mascara[..., a:b].sum(axis=-1) * int(self.direcoes[i])
+
+    # -------------------------------------------------------------
+    def linha(self, indice):
+        """Retorna uma view (sem cópia) das posições X da pista `indice`."""
+        return self.xs[..., self.inicio[indice]:self.inicio[indice + 1]]
+
+    def linhas(self):
+        """Retorna a lista de views de todas as pistas (formato de `Fases`)."""
+        return [self.linha(i) for i in range(self.n_pistas)]
@@ -0,0 +1,500 @@
+import base64
+import heapq
+import json
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import count
+from pathlib import Path
+
+
+"""
+Armazenamento dos scores em SQLite.
+
+Define a classe `Placar`, que guarda todos os scores (não só o top 10) em
+um banco SQLite com índice por tempo, consultas paginadas, melhor tempo
+por jogador e posição de um tempo no ranking. Cada `adicionar` é um único
+INSERT em transação — nada de reler e reescrever o arquivo inteiro.
+
+O banco usa journal WAL: vários processos (ex.: máquinas de um evento
+gravando no mesmo volume) podem ler enquanto um escreve, e escritas
+concorrentes esperam a vez (busy_timeout) em vez de se sobrescreverem.
+WAL precisa de memória compartilhada entre os processos; em sistemas de
+arquivos de rede que não a oferecem, use `Placar(caminho, wal=False)`
+(journal de rollback, também seguro para vários escritores).
+
+Na primeira abertura de um banco novo, os scores de um `scores.json`
+antigo (formato do ranking original) são importados.
+
+`PlacarAssincrono` tira o disco do caminho da interface: os scores novos
+entram na hora em um `IndiceRanking` em memória (de onde a tela de
+ranking lê) e são gravados no banco por uma thread escritora. Cada
+gravação é uma transação SQLite (atômica: ou entra inteira ou não entra);
+`fechar` espera a fila esvaziar antes de o processo sair.
+"""
+
+
+# Versão do esquema, guardada em PRAGMA user_version (0 = banco novo)
+VERSAO_ESQUEMA = 1
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id        INTEGER PRIMARY KEY,
+    name      TEXT    NOT NULL,
+    time      REAL    NOT NULL,
+    replay    BLOB,
+    criado_em REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_time ON scores (time, id);
+CREATE INDEX IF NOT EXISTS idx_scores_name_time ON scores (name, time);
+"""
+
+
+class Placar:
+    """Scores do jogo em um arquivo SQLite.
+
+    Parâmetros:
+    - caminho: arquivo do banco (criado se não existir)
+    - json_antigo: `scores.json` a importar quando o banco é criado
+    - wal: usa journal WAL (padrão); False para volumes sem memória compartilhada
+    - espera_ms: quanto esperar por um escritor concorrente antes de falhar
+
+    Os scores são devolvidos como dicionários {"name", "time"} (o mesmo
+    formato do antigo scores.json), ordenados do menor tempo para o maior.
+    """
+
+    def __init__(self, caminho, json_antigo=None, wal=True, espera_ms=5000):
+        self.caminho = Path(caminho)
+        # isolation_level=None: transações explícitas (BEGIN IMMEDIATE)
+        self.conexao = sqlite3.connect(str(self.caminho), timeout=espera_ms / 1000, isolation_level=None)
+        self.conexao.execute(f"PRAGMA busy_timeout = {int(espera_ms)}")
+        if wal:
+            self.conexao.execute("PRAGMA journal_mode = WAL")
+            # Com WAL, NORMAL mantém o banco consistente mesmo em queda de energia
+            self.conexao.execute("PRAGMA synchronous = NORMAL")
+        self._preparar(json_antigo)
+
+    # -------------------------------------------------------------
+    def _preparar(self, json_antigo):
+        """Cria o esquema e importa o JSON antigo, uma única vez por banco.
+
+        Feito dentro de BEGIN IMMEDIATE: se duas máquinas abrem o banco novo
+        ao mesmo tempo, só a primeira cria e importa.
+        """
+        if self.conexao.execute("PRAGMA user_version").fetchone()[0] >= VERSAO_ESQUEMA:
+            return
+        with self._transacao() as cur:
+            if cur.execute("PRAGMA user_version").fetchone()[0] >= VERSAO_ESQUEMA:
+                return
+            for comando in _ESQUEMA.split(";"):
+                if comando.strip():
+                    cur.execute(comando)
+            if json_antigo is not None:
+                self._importar_json(cur, Path(json_antigo))
+            cur.execute(f"PRAGMA user_version = {VERSAO_ESQUEMA}")
+
+    def _importar_json(self, cur, caminho):
+        """Copia os scores de um scores.json (lista de {"name","time"[,"replay"]})."""
+        if not caminho.exists():
+            return
+        try:
+            scores = json.loads(caminho.read_text(encoding="utf-8") or "[]")
+        except json.JSONDecodeError:
+            print(f"⚠️ {caminho} corrompido; nada importado")
+            return
+        linhas = []
+        for score in scores:
+            try:
+                replay = score.get("replay")
+                linhas.append((
+                    str(score["name"]),
+                    float(score["time"]),
+                    base64.b64decode(replay) if replay else None,
+                ))
+            except (KeyError, TypeError, ValueError):
+                continue
+        agora = time.time()
+        cur.executemany(
+            "INSERT INTO scores (name, time, replay, criado_em) VALUES (?, ?, ?, ?)",
+            [linha + (agora,) for linha in linhas],
+        )
+        print(f"📥 {len(linhas)} score(s) importados de {caminho}")
+
+    @contextmanager
+    def _transacao(self):
+        """`BEGIN IMMEDIATE` ... `COMMIT` (ou `ROLLBACK` em caso de erro)."""
+        cur = self.conexao.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            yield cur
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        else:
+            cur.execute("COMMIT")
+        finally:
+            cur.close()
+
+    # -------------------------------------------------------------
+    def adicionar(self, nome, tempo, replay=None):
+        """Insere um score e retorna o seu id.
+
+        `replay` são os bytes da gravação da partida (opcional).
+        """
+        with self._transacao() as cur:
+            cur.execute(
+                "INSERT INTO scores (name, time, replay, criado_em) VALUES (?, ?, ?, ?)",
+                (str(nome), float(tempo), replay, time.time()),
+            )
+            return cur.lastrowid
+
+    def top(self, limite=10, pagina=0):
+        """Retorna uma página do ranking geral (`limite` scores por página)."""
+        linhas = self.conexao.execute(
+            "SELECT name, time FROM scores ORDER BY time, id LIMIT ? OFFSET ?",
+            (limite, pagina * limite),
+        ).fetchall()
+        return [{"name": nome, "time": tempo} for nome, tempo in linhas]
+
+    def melhores_por_jogador(self, limite=10, pagina=0):
+        """Ranking com só o melhor tempo de cada jogador, paginado."""
+        linhas = self.conexao.execute(
+            "SELECT name, MIN(time) AS melhor FROM scores GROUP BY name "
+            "ORDER BY melhor, name LIMIT ? OFFSET ?",
+            (limite, pagina * limite),
+        ).fetchall()
+        return [{"name": nome, "time": tempo} for nome, tempo in linhas]
+
+    def melhor_do_jogador(self, nome):
+        """Melhor tempo do jogador `nome`, ou None se ele não tem scores."""
+        return self.conexao.execute(
+            "SELECT MIN(time) FROM scores WHERE name = ?", (str(nome),)
+        ).fetchone()[0]
+
+    def posicao(self, tempo):
+        """Posição (1 = primeiro) que um score com `tempo` ocupa no ranking geral."""
+        return self.conexao.execute(
+            "SELECT COUNT(*) FROM scores WHERE time < ?", (float(tempo),)
+        ).fetchone()[0] + 1
+
+    def total(self):
+        return self.conexao.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def com_replay(self, tamanho_bloco=4096):
+        """Gera blocos de (id, name, time, replay) dos scores que têm gravação.
+
+        Em blocos, para verificar dezenas de milhares de scores sem carregar
+        todas as gravações na memória de uma vez.
+        """
+        ultimo = 0
+        while True:
+            bloco = self.conexao.execute(
+                "SELECT id, name, time, replay FROM scores "
+                "WHERE replay IS NOT NULL AND id > ? ORDER BY id LIMIT ?",
+                (ultimo, tamanho_bloco),
+            ).fetchall()
+            if not bloco:
+                return
+            yield bloco
+            ultimo = bloco[-1][0]
+
+    def desde(self, ultimo_id):
+        """Itera (id, name, time) dos scores com id maior que `ultimo_id`, por id.
+
+        Com 0 percorre o banco inteiro sem montar uma lista (usado para
+        carregar o índice em memória e, depois, buscar só as novidades).
+        """
+        return self.conexao.execute(
+            "SELECT id, name, time FROM scores WHERE id > ? ORDER BY id", (ultimo_id,)
+        )
+
+    def fechar(self):
+        self.conexao.close()
+
+
+class IndiceRanking:
+    """Ranking em memória mantido incrementalmente, com memória limitada.
+
+    - `_tempos`: todos os tempos, ordenados, em um `array('d')` (8 bytes por
+      score) — a posição de qualquer tempo sai de uma busca binária
+    - `_top`: só os `k` melhores scores completos, como tuplas
+      (tempo, ordem de chegada, score) ordenadas
+
+    Inserir é uma busca binária + um insert em cada lista (sem reordenar
+    nada); `versao` muda a cada alteração, para quem guarda desenhos
+    derivados do ranking saber quando refazê-los.
+    """
+
+    def __init__(self, k=100):
+        self.k = k
+        self.versao = 0
+        self._tempos = array("d")
+        self._top = []
+        self._ordem = count()
+
+    @classmethod
+    def de_linhas(cls, linhas, k=100):
+        """Monta o índice de uma vez a partir de (name, time) em qualquer ordem."""
+        indice = cls(k)
+        ordem = indice._ordem
+        melhores = []
+        tempos = []
+        for nome, tempo in linhas:
+            tempos.append(tempo)
+            item = (-tempo, -next(ordem), {"name": nome, "time": tempo})
+            # Heap de máximo com os k melhores (tempos negados)
+            if len(melhores) < k:
+                heapq.heappush(melhores, item)
+            elif item > melhores[0]:
+                heapq.heapreplace(melhores, item)
+        tempos.sort()
+        indice._tempos = array("d", tempos)
+        indice._top = sorted((-t, -o, score) for t, o, score in melhores)
+        return indice
+
+    def inserir(self, score):
+        """Acrescenta um score {"name", "time"} ao ranking."""
+        tempo = score["time"]
+        insort(self._tempos, tempo)
+        if len(self._top) < self.k or tempo < self._top[-1][0]:
+            insort(self._top, (tempo, next(self._ordem), score))
+            if len(self._top) > self.k:
+                self._top.pop()
+        self.versao += 1
+
+    def top(self, limite=10):
+        """Os `limite` melhores scores (cópias), do menor tempo para o maior."""
+        return [dict(score) for _, _, score in self._top[:limite]]
+
+    def posicao(self, tempo):
+        """Posição (1 = primeiro) de um score com `tempo`, em O(log n)."""
+        return bisect_left(self._tempos, tempo) + 1
+
+    def __len__(self):
+        return len(self._tempos)
+
+
+class PlacarAssincrono:
+    """Placar com gravação em segundo plano e ranking em memória.
+
+    Parâmetros:
+    - caminho, json_antigo, wal: repassados ao `Placar` da thread escritora
+      (a conexão SQLite é aberta e usada só dentro dela)
+    - tamanho_memoria: quantos scores completos do topo ficam em memória
+    - tentativas: quantas vezes repetir uma gravação com o banco ocupado
+
+    `adicionar`, `top` e `posicao` nunca tocam o disco; só esperam (até
+    `espera_carga` segundos) pela primeira leitura do banco. A thread
+    acompanha o banco pelo maior id já lido: depois de cada gravação (ou de
+    `sincronizar`) busca apenas os scores novos, inclusive de outras máquinas.
+    """
+
+    def __init__(self, caminho, json_antigo=None, wal=True, tamanho_memoria=100, tentativas=5):
+        self.tamanho_memoria = tamanho_memoria
+        self.tentativas = tentativas
+        self.indice = IndiceRanking(tamanho_memoria)
+        self._fila = queue.Queue()
+        self._trava = threading.Lock()
+        self._carregado = threading.Event()
+        self._nao_gravados = []  # (score, replay) já no índice, ainda não no banco
+        self._ultimo_id = 0
+        self._thread = threading.Thread(
+            target=self._trabalhar, args=(caminho, json_antigo, wal), daemon=True
+        )
+        self._thread.start()
+
+    # -------------------------------------------------------------
+    def adicionar(self, nome, tempo, replay=None):
+        """Põe o score no ranking em memória na hora e na fila de gravação."""
+        score = {"name": str(nome), "time": float(tempo)}
+        with self._trava:
+            self._nao_gravados.append((score, replay))
+            self.indice.inserir(score)
+        self._fila.put(("score", score, replay))
+
+    def adicionar_conferido(self, nome, conferir, replay=None):
+        """Como `adicionar`, mas o tempo sai de `conferir()`, chamado na thread escritora.
+
+        Para conferências caras (refazer a partida da gravação) que não
+        podem travar o quadro. Retorna um `Future` com o tempo aceito, ou
+        None se `conferir()` recusou o score, que então fica fora do ranking.
+        """
+        futuro = Future()
+        self._fila.put(("conferir", str(nome), conferir, replay, futuro))
+        return futuro
+
+    def sincronizar(self):
+        """Pede à thread que traga os scores novos do banco (outras máquinas)."""
+        self._fila.put(("sincronizar",))
+
+    def top(self, limite=10, espera_carga=1.0):
+        """Retorna os `limite` primeiros scores do ranking em memória."""
+        self._carregado.wait(espera_carga)
+        with self._trava:
+            return self.indice.top(limite)
+
+    def posicao(self, tempo, espera_carga=1.0):
+        """Posição (1 = primeiro) que um score com `tempo` ocupa no ranking."""
+        self._carregado.wait(espera_carga)
+        with self._trava:
+            return self.indice.posicao(tempo)
+
+    def versao(self, espera_carga=1.0):
+        """Número que muda sempre que o ranking em memória muda."""
+        self._carregado.wait(espera_carga)
+        return self.indice.versao
+
+    def descarregar(self, timeout=None):
+        """Espera até todos os scores enfileirados estarem no banco.
+
+        Retorna False se o tempo `timeout` (segundos) acabar antes.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._fila.all_tasks_done:
+            while self._fila.unfinished_tasks:
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._fila.all_tasks_done.wait(restante)
+        return True
+
+    def fechar(self, timeout=10.0):
+        """Grava o que falta e encerra a thread escritora (chamar ao sair).
+
+        Scores que o banco recusou durante o jogo são tentados mais uma vez
+        antes de a thread fechar a conexão.
+        """
+        if self._thread.is_alive():
+            self._fila.put(None)
+            self._thread.join(timeout)
+
+    # -------------------------------------------------------------
+    def _carregar(self, placar):
+        """Monta o índice com o banco inteiro e troca o atual por ele.
+
+        Os scores locais ainda não gravados não estão no banco e são
+        reinseridos no índice novo.
+        """
+        ultimo = [0]
+
+        def nomes_e_tempos():
+            for id_, nome, tempo in placar.desde(0):
+                ultimo[0] = id_
+                yield nome, tempo
+
+        indice = IndiceRanking.de_linhas(nomes_e_tempos(), self.tamanho_memoria)
+        with self._trava:
+            for score, _ in self._nao_gravados:
+                indice.inserir(score)
+            indice.versao = self.indice.versao + 1
+            self.indice = indice
+            self._ultimo_id = ultimo[0]
+
+    def _buscar_novos(self, placar, proprio_id=None):
+        """Acrescenta ao índice os scores gravados depois do último id lido.
+
+        `proprio_id` é o score que esta thread acabou de gravar: ele já está
+        no índice desde `adicionar` e não é inserido de novo.
+        """
+        novos = [linha for linha in placar.desde(self._ultimo_id) if linha[0] != proprio_id]
+        with self._trava:
+            for id_, nome, tempo in novos:
+                self.indice.inserir({"name": nome, "time": tempo})
+        if novos:
+            self._ultimo_id = max(self._ultimo_id, novos[-1][0])
+        if proprio_id is not None:
+            self._ultimo_id = max(self._ultimo_id, proprio_id)
+
+    def _conferir(self, nome, conferir, replay, futuro):
+        """Roda `conferir()` e, se aceito, põe o score no ranking em memória.
+
+        Retorna o item de gravação ("score", score, replay), ou None se o
+        score foi recusado.
+        """
+        try:
+            tempo = conferir()
+        except Exception as e:
+            futuro.set_exception(e)
+            return None
+        if tempo is None:
+            futuro.set_result(None)
+            return None
+        score = {"name": nome, "time": float(tempo)}
+        with self._trava:
+            self._nao_gravados.append((score, replay))
+            self.indice.inserir(score)
+        futuro.set_result(score["time"])
+        return ("score", score, replay)
+
+    def _gravar(self, placar, score, replay):
+        """Grava um score, repetindo se o banco estiver ocupado; retorna o id ou None.
+
+        Gravado, o score sai de `_nao_gravados`; senão fica lá para a nova
+        tentativa do fechamento.
+        """
+        for tentativa in range(self.tentativas):
+            try:
+                id_ = placar.adicionar(score["name"], score["time"], replay)
+            except sqlite3.OperationalError as e:
+                # Banco ocupado/indisponível: espera um pouco e tenta de novo
+                print(f"⚠️ Falha ao gravar score (tentativa {tentativa + 1}): {e}")
+                time.sleep(0.2 * (tentativa + 1))
+                continue
+            with self._trava:
+                self._nao_gravados = [p for p in self._nao_gravados if p[0] is not score]
+            return id_
+        return None
+
+    def _regravar_pendentes(self, placar):
+        """Tenta de novo gravar os scores que ficaram em `_nao_gravados`."""
+        with self._trava:
+            pendentes = list(self._nao_gravados)
+        for score, replay in pendentes:
+            try:
+                self._gravar(placar, score, replay)
+            except sqlite3.Error as e:
+                print("❌ Score não gravado no banco:", score, e)
+
+    def _trabalhar(self, caminho, json_antigo, wal):
+        """Corpo da thread escritora: abre o banco, carrega o índice e atende a fila."""
+        placar = None
+        try:
+            placar = Placar(caminho, json_antigo, wal)
+            self._carregar(placar)
+        except sqlite3.Error as e:
+            print("❌ Banco de scores indisponível; scores ficam só na memória:", e)
+        finally:
+            self._carregado.set()
+
+        while True:
+            item = self._fila.get()
+            try:
+                if item is None:
+                    break
+                if item[0] == "conferir":
+                    item = self._conferir(*item[1:])
+                    if item is None:
+                        continue
+                if placar is None:
+                    continue
+                if item[0] == "sincronizar":
+                    self._buscar_novos(placar)
+                    continue
+                _, score, replay = item
+                id_ = self._gravar(placar, score, replay)
+                if id_ is not None:
+                    self._buscar_novos(placar, id_)
+            except sqlite3.Error as e:
+                # Qualquer outro erro do banco não derruba a thread: o score
+                # continua em `_nao_gravados` e é tentado de novo ao fechar
+                print("⚠️ Erro no banco de scores:", e)
+            finally:
+                self._fila.task_done()
+        if placar is not None:
+            self._regravar_pendentes(placar)
+            placar.fechar()
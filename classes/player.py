@@ -5,12 +5,35 @@ Define a classe Raposa que representa o jogador (a raposa).
 Responsabilidades:
 - carregar sprites (frente, costas, esquerda, direita)
 - manter posição, velocidade e ajustes visuais
-- fornecer métodos para desenhar e mover a raposa
+- fornecer métodos para desenhar, mover e orientar a raposa
 
 As imagens são carregadas da pasta imagens_pygame/ e escaladas para um
 tamanho fixo definido por TAMANHO_RAPOSA.
+
+A posição e o movimento da raposa pertencem à simulação
+(`classes/simulacao.py::MundoFazenda`); esta classe só guarda os sprites e
+desenha a raposa na posição compartilhada com o mundo.
 """
-import pygame as pg
+from classes.assets import carregar_imagem, mascara_de
+
+# Tamanho do sprite da raposa e parâmetros usados também pela simulação
+TAMANHO_RAPOSA = (50, 50)
+POSICAO_INICIAL_RAPOSA = (370, 760)
+VELOCIDADE_RAPOSA = 30
+AJUSTE_Y_RAPOSA = -35
+
+# Arquivos dos sprites da raposa (frente, costas, esquerda, direita)
+ARQUIVOS_RAPOSA = (
+    "imagens_pygame/frente.png",
+    "imagens_pygame/costas.png",
+    "imagens_pygame/LADO_E.png",
+    "imagens_pygame/LADO_D.png",
+)
+
+
+def imagens_raposa():
+    """Lista (caminho, tamanho, alpha) dos sprites da raposa, para pré-carga."""
+    return [(caminho, TAMANHO_RAPOSA, True) for caminho in ARQUIVOS_RAPOSA]
 
 class Raposa:
     """Representa a raposa controlada pelo jogador.
@@ -18,7 +41,11 @@ class Raposa:
     Atributos principais:
     - sprite_*: superfícies Pygame com as orientações da raposa
     - sprite_raposa_atual: sprite atualmente exibido
-    - pos_raposa: posição [x, y] da raposa na tela
+    - mascaras: {ação: pg.mask.Mask} da pose mostrada após cada ação
+    - pos_raposa: posição [x, y] da raposa na tela (a mesma lista do mundo
+      quando a raposa pertence a um `CruzamentoFazenda`)
+    - mundo: `MundoFazenda` dono da posição (ligado por `CruzamentoFazenda`),
+      ou None para uma raposa avulsa
     - velocidade: deslocamento em pixels por movimento (tecla)
     - tamanho_raposa: tamanho do sprite (largura, altura)
     - ajuste_y_raposa: correção vertical ao desenhar (offset visual)
@@ -26,52 +53,81 @@ class Raposa:
     def __init__(self):
         """Carrega sprites, escala-os e inicializa parâmetros de movimento."""
         # --- Sprites da raposa ---
-        TAMANHO_RAPOSA = (50, 50)
-        img_frente = pg.image.load("imagens_pygame/frente.png").convert_alpha()
-        self.sprite_frente = pg.transform.scale(img_frente, TAMANHO_RAPOSA)
-        img_costas = pg.image.load("imagens_pygame/costas.png").convert_alpha()
-        self.sprite_costas = pg.transform.scale(img_costas, TAMANHO_RAPOSA)
-        img_esquerda = pg.image.load("imagens_pygame/LADO_E.png").convert_alpha()
-        self.sprite_esquerda = pg.transform.scale(img_esquerda, TAMANHO_RAPOSA)
-        img_direita = pg.image.load("imagens_pygame/LADO_D.png").convert_alpha()
-        self.sprite_direita = pg.transform.scale(img_direita, TAMANHO_RAPOSA)
+        # (carregados via cache compartilhado; reinícios não relêem os PNGs)
+        frente, costas, esquerda, direita = ARQUIVOS_RAPOSA
+        self.sprite_frente = carregar_imagem(frente, TAMANHO_RAPOSA)
+        self.sprite_costas = carregar_imagem(costas, TAMANHO_RAPOSA)
+        self.sprite_esquerda = carregar_imagem(esquerda, TAMANHO_RAPOSA)
+        self.sprite_direita = carregar_imagem(direita, TAMANHO_RAPOSA)
         self.sprite_raposa_atual = self.sprite_frente
 
+        # Máscara de cada pose, pela ação que a mostra (ver `virar_raposa`),
+        # para a colisão exata opcional (`classes/mascaras.py`)
+        self.mascaras = {
+            "up": mascara_de(self.sprite_costas),
+            "down": mascara_de(self.sprite_frente),
+            "left": mascara_de(self.sprite_esquerda),
+            "right": mascara_de(self.sprite_direita),
+        }
+
         # --- Parâmetros ---
         # Posição inicial (x, y) e velocidade de movimento em pixels por tecla
-        self.pos_raposa = [370, 760]
-        self.velocidade = 30
+        self.pos_raposa = list(POSICAO_INICIAL_RAPOSA)
+        self.velocidade = VELOCIDADE_RAPOSA
         self.tamanho_raposa = self.sprite_frente.get_rect().size
         # Ajuste vertical para posicionar sprite corretamente na tela (offset)
-        self.ajuste_y_raposa = -35
+        self.ajuste_y_raposa = AJUSTE_Y_RAPOSA
+        self.mundo = None
 
     # -------------------------------------------------------------
+    def desenho_raposa(self):
+        """Retorna o par (sprite atual, destino) da raposa, para `Surface.blits`.
+
+        O destino já tem o ajuste vertical que alinha visualmente o sprite.
+        """
+        return (self.sprite_raposa_atual,
+                (self.pos_raposa[0], self.pos_raposa[1] + self.ajuste_y_raposa))
+
     def desenhar_raposa(self, janela):
         """Desenha o sprite atual da raposa na janela.
 
-        Aplica ajuste vertical ao blit para alinhar visualmente o sprite.
         Parâmetros:
         - janela: superfície Pygame onde desenhar
         """
-        janela.blit(self.sprite_raposa_atual,
-                     (self.pos_raposa[0], self.pos_raposa[1] + self.ajuste_y_raposa))
+        janela.blit(*self.desenho_raposa())
 
     # -------------------------------------------------------------
     def mover_raposa(self, tecla):
         """Move a raposa e atualiza o sprite conforme a direção.
 
+        Com um `mundo` ligado, o deslocamento é do `MundoFazenda` (que
+        também o grava para o replay); uma raposa avulsa desloca a própria
+        `pos_raposa`.
+        """
+        if self.mundo is not None:
+            self.mundo.mover_raposa(tecla)
+        elif tecla == "up":
+            self.pos_raposa[1] -= self.velocidade
+        elif tecla == "down":
+            self.pos_raposa[1] += self.velocidade
+        elif tecla == "left":
+            self.pos_raposa[0] -= self.velocidade
+        elif tecla == "right":
+            self.pos_raposa[0] += self.velocidade
+        self.virar_raposa(tecla)
+
+    def virar_raposa(self, tecla):
+        """Troca o sprite atual conforme a direção do movimento.
+
         Espera receber o nome da tecla como string ('up','down','left','right').
-        Cada movimento altera a posição e troca o sprite atual para a direção.
+        O deslocamento em si é feito por `MundoFazenda.mover_raposa`; aqui
+        apenas escolhemos a orientação desenhada.
         """
         if tecla == "up":
             self.sprite_raposa_atual = self.sprite_costas
-            self.pos_raposa[1] -= self.velocidade
         elif tecla == "down":
             self.sprite_raposa_atual = self.sprite_frente
-            self.pos_raposa[1] += self.velocidade
         elif tecla == "left":
             self.sprite_raposa_atual = self.sprite_esquerda
-            self.pos_raposa[0] -= self.velocidade
         elif tecla == "right":
             self.sprite_raposa_atual = self.sprite_direita
-            self.pos_raposa[0] += self.velocidade
@@ -0,0 +1,83 @@
+import threading
+import time
+
+
+"""
+Rastro (trace) do tempo de inicialização do jogo.
+
+`RastroInicio` anota quanto tempo levou cada etapa desde o início do
+processo até o primeiro quadro do menu (importar o Pygame, abrir a
+janela, montar o menu...) e as etapas adiadas para depois dele, inclusive
+as que rodam em threads de fundo (decodificar sons, pré-carregar imagens).
+Com "--rastro-inicio" em main.py o relatório é impresso no primeiro
+quadro e cada etapa adiada é impressa ao terminar.
+"""
+
+
+class RastroInicio:
+    """Duração de cada etapa da inicialização, em ordem.
+
+    Parâmetros:
+    - inicio: `time.perf_counter()` do começo do processo (antes dos imports)
+    - ativo: imprime o relatório e as etapas adiadas (senão só anota)
+
+    Uso:
+        rastro.etapa("display")           # tempo desde a etapa anterior
+        rastro.medir("placar", funcao)    # tempo de uma chamada
+        rastro.registrar("sons", segundos, fundo=True)  # de outra thread
+    """
+
+    def __init__(self, inicio=None, ativo=False):
+        self.inicio = inicio if inicio is not None else time.perf_counter()
+        self.ativo = ativo
+        self.etapas = []  # (nome, duração em s, instante desde o início, fundo)
+        self.impresso = False
+        self._ultimo = self.inicio
+        self._trava = threading.Lock()
+
+    # -------------------------------------------------------------
+    def etapa(self, nome):
+        """Anota a etapa `nome`: o tempo desde a etapa anterior da thread principal."""
+        agora = time.perf_counter()
+        self._anotar(nome, agora - self._ultimo, agora, False)
+        self._ultimo = agora
+
+    def medir(self, nome, funcao, *args):
+        """Chama `funcao(*args)`, anota a duração como etapa adiada e retorna o resultado."""
+        inicio = time.perf_counter()
+        resultado = funcao(*args)
+        agora = time.perf_counter()
+        self._anotar(nome, agora - inicio, agora, False)
+        return resultado
+
+    def registrar(self, nome, duracao, fundo=True):
+        """Anota uma etapa já medida (por exemplo, no fim de uma thread de fundo)."""
+        self._anotar(nome, duracao, time.perf_counter(), fundo)
+
+    def _anotar(self, nome, duracao, agora, fundo):
+        etapa = (nome, duracao, agora - self.inicio, fundo)
+        with self._trava:
+            self.etapas.append(etapa)
+            depois = self.impresso
+        if depois and self.ativo:
+            print(self._linha(etapa))
+
+    # -------------------------------------------------------------
+    @staticmethod
+    def _linha(etapa):
+        nome, duracao, instante, fundo = etapa
+        origem = " (fundo)" if fundo else ""
+        return f"  {nome + origem:<40}{duracao * 1000:8.1f} ms  @ {instante * 1000:7.1f} ms"
+
+    def relatorio(self):
+        """Texto com as etapas anotadas até agora."""
+        with self._trava:
+            etapas = list(self.etapas)
+        return "\n".join(["⏱️ Inicialização (duração / instante desde o início):"] + [self._linha(e) for e in etapas])
+
+    def imprimir(self):
+        """Imprime o relatório (se ativo); etapas anotadas depois saem uma a uma."""
+        if self.ativo:
+            print(self.relatorio())
+        with self._trava:
+            self.impresso = True
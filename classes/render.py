@@ -0,0 +1,91 @@
+import pygame as pg
+
+
+"""
+Renderização por retângulos sujos (dirty rects) para o loop de jogo.
+
+Em vez de copiar o fundo inteiro (950x880) e atualizar a tela toda a cada
+quadro, o `RenderizadorSujo` lembra onde cada sprite foi desenhado no
+quadro anterior, restaura só essas regiões do fundo e passa para
+`pg.display.update` apenas a lista de retângulos que mudaram.
+
+Os objetos de jogo desenham normalmente, com `janela.blit(...)` ou
+`janela.blits(...)`, sobre a `JanelaRastreada` do renderizador — ela
+repassa o desenho para a janela real e anota os retângulos afetados.
+"""
+
+
+class JanelaRastreada:
+    """Envolve a superfície da janela anotando o retângulo de cada `blit`.
+
+    Os demais atributos (get_width, get_height, fill, ...) são repassados
+    para a superfície real, então HUD e jogo a usam como se fosse a janela.
+    """
+
+    def __init__(self, superficie):
+        self.superficie = superficie
+        self.rects = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.superficie.blit(source, dest, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        # Os retângulos são sempre pedidos à superfície: o renderizador precisa deles
+        rects = self.superficie.blits(blit_sequence, 1)
+        self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def __getattr__(self, nome):
+        return getattr(self.superficie, nome)
+
+
+class RenderizadorSujo:
+    """Restaura e atualiza apenas as regiões da tela que mudaram.
+
+    Uso por quadro:
+    - `restaurar(fundo)` no lugar de `limpar_janela()`
+    - desenhar tudo em `renderizador.janela`
+    - `atualizar()` no lugar de `pg.display.update()`
+
+    Quando algo fora do renderizador sobrescreve a tela (telas de level,
+    troca de fundo), o próximo quadro é redesenhado por inteiro; chame
+    `invalidar()` para forçar isso explicitamente.
+    """
+
+    def __init__(self, superficie):
+        self.janela = JanelaRastreada(superficie)
+        self._rects_anteriores = []
+        self._fundo_anterior = None
+        self._tela_cheia = True
+
+    def invalidar(self):
+        """Força o próximo quadro a redesenhar e atualizar a tela inteira."""
+        self._tela_cheia = True
+
+    def restaurar(self, fundo):
+        """Apaga os sprites do quadro anterior copiando o fundo por baixo deles.
+
+        Se o fundo mudou desde o último quadro (ex.: fase 2) ou a tela foi
+        invalidada, copia o fundo inteiro.
+        """
+        superficie = self.janela.superficie
+        if fundo is not self._fundo_anterior:
+            self._fundo_anterior = fundo
+            self._tela_cheia = True
+        if self._tela_cheia:
+            superficie.blit(fundo, (0, 0))
+        else:
+            superficie.blits([(fundo, rect, rect) for rect in self._rects_anteriores], 0)
+        self.janela.rects = []
+
+    def atualizar(self):
+        """Envia para o display só os retângulos do quadro anterior e do atual."""
+        atuais = self.janela.rects
+        if self._tela_cheia:
+            pg.display.update()
+            self._tela_cheia = False
+        else:
+            pg.display.update(self._rects_anteriores + atuais)
+        self._rects_anteriores = atuais
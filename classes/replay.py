@@ -0,0 +1,262 @@
+import hashlib
+import json
+import struct
+
+import numpy as np
+from classes.levels import CONFIG_FASES
+from classes.lote import LoteMundos
+from classes.mascaras import MascarasColisao
+from classes.simulacao import ACOES, TICKS_POR_SEGUNDO, MundoFazenda
+
+
+"""
+Gravação e reprodução determinística de partidas.
+
+Uma partida é totalmente determinada pela semente do `MundoFazenda`, pela
+configuração das fases (`CONFIG_FASES`) e pela sequência de movimentos da
+raposa, cada um com o tick em que aconteceu. A classe `Gravacao` guarda
+exatamente isso em um formato binário compacto:
+
+    cabeçalho  "<4sBBq8sII": MAGICA, VERSAO, tem semente (0/1), semente,
+               assinatura da configuração das fases (8 bytes),
+               ticks totais da partida, quantidade de eventos
+    eventos    um varint (LEB128) por movimento com
+               (ticks desde o evento anterior << 2) | índice da ação em ACOES
+
+Movimentos próximos ocupam 1 byte; uma partida inteira cabe em poucas
+centenas de bytes. `reproduzir` refaz a partida sem janela, na velocidade
+máxima da CPU, ou dirige uma `CruzamentoFazenda` para assistir ao replay
+(ver `replay.py` na raiz do projeto).
+
+`verificar` e `verificar_lote` validam envios para o ranking: o tempo
+aceito é sempre o calculado pela própria simulação (ticks até os ovos),
+nunca o informado pelo cliente. `verificar_lote` refaz muitas gravações
+juntas em um `LoteMundos`, com todas as partidas em arrays NumPy.
+
+Partidas jogadas com a colisão exata por pixels (`classes/mascaras.py`)
+gravam a assinatura `assinatura_config(mascaras)`, que também resume as
+máscaras; elas são refeitas com `MascarasColisao.padrao()`, um mundo por
+vez (o `LoteMundos` só conhece a colisão de retângulos).
+"""
+
+
+MAGICA = b"RFOX"
+VERSAO = 1
+_CABECALHO = struct.Struct("<4sBBq8sII")
+
+
+def assinatura_config(mascaras=None):
+    """Resume `CONFIG_FASES` em 8 bytes (SHA-256 truncado).
+
+    Um replay gravado com outra configuração de fases não reproduziria a
+    mesma partida; a assinatura permite recusá-lo em vez de dar um
+    resultado errado. Com `mascaras` (um `MascarasColisao`), os bits das
+    máscaras entram no resumo: é a assinatura das partidas com colisão
+    por pixels.
+    """
+    texto = json.dumps(CONFIG_FASES, sort_keys=True, ensure_ascii=False)
+    h = hashlib.sha256(texto.encode("utf-8"))
+    if mascaras is not None:
+        h.update(mascaras.assinatura())
+    return h.digest()[:8]
+
+
+def _mascaras_da(gravacao):
+    """Retorna (válida, máscaras) para refazer a gravação.
+
+    Gravações com a assinatura das fases não usam máscaras (None); as com a
+    assinatura das máscaras padrão usam `MascarasColisao.padrao()`.
+    """
+    if gravacao.assinatura == assinatura_config():
+        return True, None
+    mascaras = MascarasColisao.padrao()
+    if gravacao.assinatura == assinatura_config(mascaras):
+        return True, mascaras
+    return False, None
+
+
+def _escrever_varint(saida, valor):
+    while valor >= 0x80:
+        saida.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    saida.append(valor)
+
+
+def _ler_varint(dados, pos):
+    valor = desloc = 0
+    while True:
+        if pos >= len(dados):
+            raise ValueError("gravação truncada")
+        byte = dados[pos]
+        pos += 1
+        valor |= (byte & 0x7F) << desloc
+        if byte < 0x80:
+            return valor, pos
+        desloc += 7
+
+
+class Gravacao:
+    """Semente, assinatura das fases e lista de (tick, ação) de uma partida.
+
+    Para gravar, atribua a instância a `MundoFazenda.gravador`: o mundo chama
+    `registrar` a cada movimento. Ao fim da partida chame `finalizar` com o
+    tick final do mundo antes de salvar.
+    """
+
+    def __init__(self, semente=None, assinatura=None):
+        self.semente = semente
+        self.assinatura = assinatura if assinatura is not None else assinatura_config()
+        self.ticks = 0
+        self.eventos = []
+
+    def registrar(self, tick, acao):
+        """Anota a ação `acao` (um valor de `ACOES`) no tick `tick`."""
+        self.eventos.append((tick, acao))
+
+    def finalizar(self, ticks):
+        """Registra a duração total da partida, em ticks."""
+        self.ticks = ticks
+
+    # -------------------------------------------------------------
+    def para_bytes(self):
+        """Serializa a gravação no formato binário descrito no módulo."""
+        saida = bytearray(_CABECALHO.pack(
+            MAGICA, VERSAO,
+            self.semente is not None, self.semente or 0,
+            self.assinatura, self.ticks, len(self.eventos),
+        ))
+        anterior = 0
+        for tick, acao in self.eventos:
+            _escrever_varint(saida, ((tick - anterior) << 2) | ACOES.index(acao))
+            anterior = tick
+        return bytes(saida)
+
+    @classmethod
+    def de_bytes(cls, dados):
+        """Lê uma gravação serializada por `para_bytes` (ValueError se inválida)."""
+        if len(dados) < _CABECALHO.size:
+            raise ValueError("gravação truncada")
+        magica, versao, tem_semente, semente, assinatura, ticks, n = _CABECALHO.unpack_from(dados)
+        if magica != MAGICA or versao != VERSAO:
+            raise ValueError("arquivo não é uma gravação do Running Fox (ou versão desconhecida)")
+
+        gravacao = cls(semente if tem_semente else None, assinatura)
+        gravacao.ticks = ticks
+        pos, tick = _CABECALHO.size, 0
+        for _ in range(n):
+            valor, pos = _ler_varint(dados, pos)
+            tick += valor >> 2
+            gravacao.eventos.append((tick, ACOES[valor & 3]))
+        return gravacao
+
+    def salvar(self, caminho):
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(self.para_bytes())
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, "rb") as arquivo:
+            return cls.de_bytes(arquivo.read())
+
+
+def reproduzir(gravacao, jogo=None, a_cada_tick=None):
+    """Refaz a partida gravada e retorna o mundo/jogo no estado final.
+
+    - jogo: objeto com `mover_raposa(acao)`, `avancar()` e `game_over`
+      (um `MundoFazenda` ou uma `CruzamentoFazenda`); por padrão um
+      `MundoFazenda` novo com a semente da gravação, sem janela.
+    - a_cada_tick: função opcional chamada com `jogo` após cada tick
+      (ex.: desenhar e esperar o relógio para assistir ao replay).
+
+    Os movimentos de um tick são aplicados antes de avançá-lo, na mesma
+    ordem do loop de `main.py`. Levanta ValueError se a gravação foi feita
+    com outra configuração de fases (ou outras máscaras de colisão).
+    """
+    valida, mascaras = _mascaras_da(gravacao)
+    if not valida:
+        raise ValueError("gravação feita com outra configuração de fases")
+    if jogo is None:
+        jogo = MundoFazenda(gravacao.semente)
+    getattr(jogo, "mundo", jogo).mascaras = mascaras
+
+    eventos = gravacao.eventos
+    i, n = 0, len(eventos)
+    for tick in range(gravacao.ticks):
+        while i < n and eventos[i][0] == tick:
+            jogo.mover_raposa(eventos[i][1])
+            i += 1
+        jogo.avancar()
+        if a_cada_tick is not None:
+            a_cada_tick(jogo)
+        if jogo.game_over:
+            break
+    return jogo
+
+
+def verificar(gravacao):
+    """Refaz a partida e retorna o tempo de vitória em segundos, ou None.
+
+    None significa envio recusado: gravação de outra configuração de fases
+    ou partida que não chega nos ovos dentro dos ticks gravados.
+    """
+    if not _mascaras_da(gravacao)[0]:
+        return None
+    mundo = reproduzir(gravacao)
+    if not mundo.reached_ovos:
+        return None
+    return mundo.tick / TICKS_POR_SEGUNDO
+
+
+def verificar_lote(gravacoes):
+    """Verifica várias gravações de uma vez; retorna uma lista como `verificar`.
+
+    Todas as partidas avançam juntas em um `LoteMundos` (mesma evolução de
+    `MundoFazenda`), tick a tick, até a maior duração gravada. Em cada tick
+    os movimentos de todas as partidas são aplicados com uma única chamada
+    a `LoteMundos.mover`; uma partida para de avançar ao terminar ou ao
+    atingir os seus próprios ticks gravados.
+
+    Gravações com colisão por pixels são refeitas uma a uma por `verificar`.
+    """
+    resultados = [None] * len(gravacoes)
+    assinatura = assinatura_config()
+    validas = [i for i, g in enumerate(gravacoes) if g.assinatura == assinatura]
+    for i, gravacao in enumerate(gravacoes):
+        if gravacao.assinatura != assinatura:
+            resultados[i] = verificar(gravacao)
+    if not validas:
+        return resultados
+
+    lote = LoteMundos(len(validas), [gravacoes[i].semente for i in validas])
+    limites = np.array([gravacoes[i].ticks for i in validas], dtype=np.int64)
+
+    # Todos os eventos ordenados por tick (ordem estável dentro de cada tick)
+    ticks_ev, partidas_ev, codigos_ev = [], [], []
+    for j, i in enumerate(validas):
+        for tick, acao in gravacoes[i].eventos:
+            ticks_ev.append(tick)
+            partidas_ev.append(j)
+            codigos_ev.append(ACOES.index(acao) + 1)  # códigos de CODIGOS_ACAO
+    ticks_ev = np.array(ticks_ev, dtype=np.int64)
+    ordem = np.argsort(ticks_ev, kind="stable")
+    ticks_ev = ticks_ev[ordem]
+    partidas_ev = np.array(partidas_ev, dtype=np.intp)[ordem]
+    codigos_ev = np.array(codigos_ev, dtype=np.intp)[ordem]
+
+    total = int(limites.max())
+    cortes = np.searchsorted(ticks_ev, np.arange(total + 1))
+    lote.game_over |= limites <= 0
+    for tick in range(total):
+        a, b = cortes[tick], cortes[tick + 1]
+        if a < b:
+            lote.mover(codigos_ev[a:b], partidas_ev[a:b])
+        lote.avancar()
+        # Partidas que chegaram ao fim da gravação congelam como encerradas
+        lote.game_over |= limites <= tick + 1
+        if lote.game_over.all():
+            break
+
+    for j, i in enumerate(validas):
+        if lote.reached_ovos[j]:
+            resultados[i] = int(lote.tick[j]) / TICKS_POR_SEGUNDO
+    return resultados
@@ -0,0 +1,310 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pygame as pg
+from classes.levels import Fases
+from classes.pistas import MotorPistas
+from classes.player import (
+    TAMANHO_RAPOSA,
+    POSICAO_INICIAL_RAPOSA,
+    VELOCIDADE_RAPOSA,
+    AJUSTE_Y_RAPOSA,
+)
+
+
+"""
+Núcleo de simulação headless do jogo - Cruzamento da Fazenda.
+
+Contém a classe `MundoFazenda`, que guarda apenas o estado lógico de uma
+partida (pistas de obstáculos, posição da raposa, vidas, fase e áreas de
+chegada vindas de `Fases`) e o avança um quadro por vez com `step(acao)`.
+
+Nada neste módulo abre janela, carrega imagens ou desenha: usamos de
+Pygame somente `pg.Rect`, que funciona sem display. A classe
+`CruzamentoFazenda` (classes/game.py) é uma visão fina sobre este mundo,
+o que permite rodar milhares de partidas por segundo em playtests
+automáticos sem o custo de decodificar sprites.
+"""
+
+
+# Ações aceitas por `step` / `mover_raposa` (mesmos nomes de `pg.key.name`)
+ACOES = ("up", "down", "left", "right")
+
+# Ticks de simulação por segundo de jogo (velocidades estão em px/tick)
+TICKS_POR_SEGUNDO = 60
+
+
+class MundoFazenda:
+    """Estado lógico de uma partida, sem nenhuma dependência de renderização.
+
+    Parâmetros:
+    - semente: se informada, desloca levemente as posições iniciais dos
+      obstáculos de forma reprodutível (útil para variar playtests). Com
+      `None` o layout é exatamente o definido em `Fases`.
+
+    Atributos principais:
+    - fases: instância de `Fases` com pistas, posições Y e áreas de chegada
+    - pos_raposa: posição [x, y] da raposa (lista alterada no lugar)
+    - vidas, game_over, reached_ovos: estado da partida
+    - tick: quantidade de passos simulados
+    - gravador: opcional; se definido (ex.: `classes/replay.py::Gravacao`),
+      recebe `registrar(tick, acao)` a cada movimento da raposa
+    - perfil: opcional; se definido (ex.: `classes/perfil.py::Perfilador`),
+      recebe `marcar("pistas")` e `marcar("colisoes")` a cada tick
+    - mascaras: opcional; com um `classes/mascaras.py::MascarasColisao`, a
+      colisão de retângulos só conta se os pixels dos sprites se tocarem
+    - direcao_raposa: última ação da raposa (pose usada pelas máscaras)
+    """
+
+    def __init__(self, semente=None):
+        self.fases = Fases()
+        self.semente = semente
+        self.rng = random.Random(semente)
+
+        # --- Raposa (somente dados) ---
+        self.pos_raposa = list(POSICAO_INICIAL_RAPOSA)
+        self.velocidade = VELOCIDADE_RAPOSA
+        self.tamanho_raposa = TAMANHO_RAPOSA
+        self.ajuste_y_raposa = AJUSTE_Y_RAPOSA
+
+        # --- parâmetros gerais ---
+        self.vidas = 3
+        self.game_over = False
+        self.reached_ovos = False
+        self.tick = 0
+        self.gravador = None
+        self.perfil = None
+        self.mascaras = None
+        self.direcao_raposa = "down"
+
+        self._variar_pistas()
+        self._montar_motor()
+
+    # -------------------------------------------------------------
+    def _variar_pistas(self):
+        """Aplica o deslocamento pseudoaleatório da semente nas pistas atuais."""
+        if self.semente is None:
+            return
+        for xs in self.fases.linhas_das_plataformas:
+            for i in range(len(xs)):
+                xs[i] += self.rng.randint(-40, 40)
+
+    # -------------------------------------------------------------
+    def _montar_motor(self):
+        """Cria o `MotorPistas` da fase atual.
+
+        `fases.linhas_das_plataformas` passa a ser uma lista de views do
+        array do motor, então quem lê as pistas (desenho, colisão) enxerga
+        as posições atualizadas sem cópias.
+        """
+        self.motor = MotorPistas.da_fase(self.fases)
+        self.fases.linhas_das_plataformas = self.motor.linhas()
+        self._montar_faixas()
+
+    # -------------------------------------------------------------
+    def _montar_faixas(self):
+        """Pré-calcula o índice de faixas verticais das pistas da fase.
+
+        Cada faixa é (topo, base, linha, dx, largura, altura) da hitbox dos
+        obstáculos daquela linha, tirada dos descritores de `fases.pistas`
+        e ordenada pelo topo. Com isso a colisão encontra por busca binária
+        só as linhas que cruzam a altura da raposa.
+        """
+        faixas = []
+        for linha, pista in enumerate(self.fases.pistas):
+            dx, dy, largura, altura = pista.hitbox
+            topo = int(pista.y + dy)
+            faixas.append((topo, topo + altura, linha, dx, largura, altura))
+        faixas.sort()
+        self._faixas = faixas
+        self._topos_faixas = [faixa[0] for faixa in faixas]
+        self._altura_max_faixa = max((faixa[5] for faixa in faixas), default=0)
+
+    # -------------------------------------------------------------
+    def rect_raposa(self):
+        """Retorna o `pg.Rect` de colisão da raposa (com o ajuste vertical)."""
+        return pg.Rect(
+            int(self.pos_raposa[0]),
+            int(self.pos_raposa[1] + self.ajuste_y_raposa),
+            int(self.tamanho_raposa[0]),
+            int(self.tamanho_raposa[1]),
+        )
+
+    # -------------------------------------------------------------
+    def mover_raposa(self, acao):
+        """Desloca a raposa conforme a ação ('up','down','left','right').
+
+        Ações desconhecidas são ignoradas, assim como no controle original
+        por teclado. Ações válidas são passadas ao `gravador`, se houver,
+        junto com o tick atual.
+        """
+        if acao in ACOES:
+            self.direcao_raposa = acao
+            if self.gravador is not None:
+                self.gravador.registrar(self.tick, acao)
+        if acao == "up":
+            self.pos_raposa[1] -= self.velocidade
+        elif acao == "down":
+            self.pos_raposa[1] += self.velocidade
+        elif acao == "left":
+            self.pos_raposa[0] -= self.velocidade
+        elif acao == "right":
+            self.pos_raposa[0] += self.velocidade
+
+    # -------------------------------------------------------------
+    def atualizar_plataformas(self):
+        """Atualiza as posições X das plataformas/inimigos móveis.
+
+        Todo o trabalho é vetorizado em `MotorPistas.atualizar` (velocidade,
+        direção e limites de cada linha estão em `classes/pistas.py`).
+        Quando uma plataforma sai da tela, ela é reposicionada no lado
+        oposto (efeito loop).
+        """
+        self.motor.atualizar()
+
+    # -------------------------------------------------------------
+    def raposa_colidiu_com_objeto(self):
+        """Verifica se a raposa colidiu com alguma plataforma/inimigo.
+
+        - Constrói um Rect da raposa usando posição e ajuste vertical.
+        - Seleciona pelo índice de faixas (`_montar_faixas`) apenas as
+          linhas cuja hitbox cruza a altura da raposa.
+        - Em cada linha, as posições X estão ordenadas; uma busca binária
+          limita o teste aos obstáculos próximos da raposa (com 1 px de
+          folga por causa do truncamento para int).
+        - Se houver interseção (`colliderect`) retorna True, caso contrário False.
+          Com `mascaras`, a interseção dos retângulos ainda precisa passar
+          pelo teste de pixels (`_pixels_colidem`); sem elas o custo é o
+          mesmo de antes.
+        """
+        raposa_rect = self.rect_raposa()
+        rx, ry, rw, rh = raposa_rect
+        mascaras = self.mascaras
+        inicio = bisect_right(self._topos_faixas, ry - self._altura_max_faixa)
+        fim = bisect_left(self._topos_faixas, ry + rh)
+        for topo, base, linha, dx, largura, altura in self._faixas[inicio:fim]:
+            if base <= ry:
+                continue
+            xs = self.motor.linha(linha)
+            a, b = xs.searchsorted((rx - dx - largura - 1, rx - dx + rw + 1))
+            for j, x in enumerate(xs[a:b], a):
+                plat_rect = pg.Rect(int(x + dx), topo, largura, altura)
+                if raposa_rect.colliderect(plat_rect):
+                    if mascaras is None or self._pixels_colidem(linha, j, x, rx, ry):
+                        return True
+        return False
+
+    def _pixels_colidem(self, linha, j, x, rx, ry):
+        """Narrow phase: as máscaras da raposa e do obstáculo `j` da pista se tocam?
+
+        Os sprites ficam onde a visão os desenha: o obstáculo no
+        `deslocamento_sprite` da pista e a raposa no canto do seu rect. A
+        colisão roda dentro de `avancar`, antes do contador andar, e a visão
+        desenha estas posições com o tick já contado: daí o `self.tick + 1`.
+        """
+        pista = self.fases.pistas[linha]
+        n = len(self.motor.linha(linha))
+        quadro = self.mascaras.animacao(self.fases.pistas).quadro(
+            linha, self.tick + 1, j, n, self.motor.rotacao[linha]
+        )
+        sx, sy = pista.deslocamento_sprite
+        return self.mascaras.colide(
+            self.direcao_raposa, quadro, int(x + sx) - rx, int(pista.y + sy) - ry
+        )
+
+    # -------------------------------------------------------------
+    def resetar_posicao_raposa(self, colisao=False):
+        """Reseta a posição da raposa para o ponto inicial (virada de frente).
+
+        Se `colisao` for True, decrementa vidas e checa game over. A lista
+        `pos_raposa` é alterada no lugar para que visões que a compartilham
+        (ex.: `Raposa`) continuem sincronizadas.
+        """
+        if colisao:
+            self.vidas -= 1
+            if self.vidas < 0:
+                self.vidas = 0
+            if self.vidas == 0:
+                self.game_over = True
+        self.pos_raposa[:] = POSICAO_INICIAL_RAPOSA
+        self.direcao_raposa = "down"
+
+    # -------------------------------------------------------------
+    def checar_colisoes_e_reagir(self):
+        """Verifica colisões e reage: transfere para próxima fase ou finaliza jogo.
+
+        Retorna um dicionário de eventos do passo, usado pela visão para
+        tocar sons, trocar o fundo etc.:
+        - "colidiu": a raposa bateu em um obstáculo e perdeu uma vida
+        - "mudou_fase": a raposa chegou na `area_fazenda`
+        - "chegou_ovos": a raposa atingiu a `area_ovos` (vitória)
+        """
+        eventos = {"colidiu": False, "mudou_fase": False, "chegou_ovos": False}
+        if self.game_over:
+            return eventos
+
+        if self.raposa_colidiu_com_objeto():
+            self.resetar_posicao_raposa(colisao=True)
+            eventos["colidiu"] = True
+
+        raposa_rect = self.rect_raposa()
+
+        # Checa se chegou na fazenda (área de chegada) e avança de fase
+        # (area_fazenda.width > 1: na fase 2 ela fica desativada, como area_ovos na 1)
+        if self.fases.area_fazenda.width > 1 and raposa_rect.colliderect(self.fases.area_fazenda):
+            self.fases.proxima_fase()
+            self._variar_pistas()
+            self._montar_motor()
+            self.resetar_posicao_raposa()
+            eventos["mudou_fase"] = True
+            if getattr(self.fases, "game_over", False):
+                self.game_over = True
+
+        # Checa área dos ovos (condição adicional: area_ovos.width > 1 evita áreas vazias)
+        if self.fases.area_ovos and self.fases.area_ovos.width > 1 and raposa_rect.colliderect(self.fases.area_ovos):
+            if not self.reached_ovos:
+                self.reached_ovos = True
+                self.game_over = True
+                eventos["chegou_ovos"] = True
+
+        return eventos
+
+    # -------------------------------------------------------------
+    def step(self, acao=None):
+        """Avança a simulação em um quadro.
+
+        - `acao`: None (parado) ou um dos valores de `ACOES`.
+        - Move a raposa, atualiza as pistas e verifica colisões, na mesma
+          ordem que o loop de `main.py` usava.
+
+        Retorna o dicionário de eventos de `checar_colisoes_e_reagir`
+        acrescido de "fim" (True quando a partida terminou).
+        """
+        if self.game_over:
+            return {"colidiu": False, "mudou_fase": False, "chegou_ovos": False, "fim": True}
+
+        if acao is not None:
+            self.mover_raposa(acao)
+        return self.avancar()
+
+    # -------------------------------------------------------------
+    def avancar(self):
+        """Avança um tick sem mover a raposa (pistas, colisões e contador).
+
+        Usado pelo loop de jogo, onde os movimentos chegam por teclado a
+        qualquer momento (zero ou vários por tick), e pelo replay.
+        Retorna os eventos do tick, como `step`.
+        """
+        if self.game_over:
+            return {"colidiu": False, "mudou_fase": False, "chegou_ovos": False, "fim": True}
+
+        perfil = self.perfil
+        self.atualizar_plataformas()
+        if perfil is not None:
+            perfil.marcar("pistas")
+        eventos = self.checar_colisoes_e_reagir()
+        if perfil is not None:
+            perfil.marcar("colisoes")
+        self.tick += 1
+        eventos["fim"] = self.game_over
+        return eventos
@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pygame as pg
+from classes.cache_sons import carregar_som
+
+
+"""
+Gerenciador de áudio: efeitos por categoria, sem bloquear o loop do jogo.
+
+Cada efeito pertence a uma categoria com um grupo próprio de canais
+reservados do mixer (`pg.mixer.set_reserved`), então um som repetido à
+exaustão (o passo da raposa a cada tecla) nunca ocupa os canais dos sons
+importantes (troca de fase, game over). Quando todos os canais da
+categoria estão tocando, o mais antigo é interrompido para o novo som
+(voice stealing); disparos do mesmo efeito mais próximos que o intervalo
+mínimo da categoria são descartados.
+
+`carregar` decodifica um efeito (ou o lê já decodificado do cache de
+`classes/cache_sons.py`) e pode rodar em uma thread de fundo:
+`tocar` só consulta o que já ficou pronto e ignora os demais, sem nunca
+esperar pela decodificação. A música continua em streaming por
+`pg.mixer.music`.
+"""
+
+
+class GerenciadorAudio:
+    """Efeitos sonoros por categoria, com canais reservados e música de fundo.
+
+    Parâmetros:
+    - categorias: {categoria: (canais, intervalo mínimo entre disparos do
+      mesmo efeito, em segundos)}
+    - canais: total de canais do mixer (os que sobram ficam para `Sound.play`)
+
+    Uso:
+        audio.abrir("sons/trilha.mp3")                    # thread principal
+        audio.carregar("som_start", "sons/start.mp3", 0.8, "eventos")  # qualquer thread
+        audio.tocar("som_start")                          # não bloqueia
+    """
+
+    def __init__(self, categorias, canais=16):
+        self.categorias = categorias
+        self.canais = canais
+        self.aberto = False
+        self.musica_carregada = False
+
+        self._sons = {}  # nome -> (Sound, categoria)
+        self._grupos = {}  # categoria -> [Channel]
+        self._inicio = {}  # Channel -> instante em que o som atual começou
+        self._ultimo_disparo = {}  # nome -> instante do último disparo aceito
+        self._trava = threading.Lock()
+
+    # -------------------------------------------------------------
+    def abrir(self, trilha=None, volume_musica=0.5):
+        """Abre o mixer, reserva os canais de cada categoria e toca a trilha em loop."""
+        pg.mixer.init()
+        pg.mixer.set_num_channels(self.canais)
+        proximo = 0
+        for categoria, (quantidade, _) in self.categorias.items():
+            self._grupos[categoria] = [pg.mixer.Channel(proximo + i) for i in range(quantidade)]
+            proximo += quantidade
+        pg.mixer.set_reserved(proximo)
+        self.aberto = True
+
+        if trilha:
+            pg.mixer.music.load(trilha)
+            pg.mixer.music.set_volume(volume_musica)
+            self.musica_carregada = True
+            self.tocar_musica()
+
+    def carregar(self, nome, caminho, volume, categoria):
+        """Decodifica o efeito `nome`; pode ser chamado de uma thread de fundo.
+
+        Usa a cópia PCM em cache de `caminho`, se houver; o efeito passa a
+        tocar assim que o `Sound` fica pronto.
+        """
+        som = carregar_som(caminho)
+        som.set_volume(volume)
+        with self._trava:
+            self._sons[nome] = (som, categoria)
+
+    def pronto(self, nome):
+        """O efeito `nome` já foi decodificado?"""
+        return nome in self._sons
+
+    # -------------------------------------------------------------
+    def tocar(self, nome):
+        """Toca o efeito `nome` em um canal da sua categoria; nunca bloqueia.
+
+        Retorna o `Channel` usado, ou None se o efeito ainda não carregou ou
+        o disparo veio cedo demais depois do anterior.
+        """
+        entrada = self._sons.get(nome)
+        if entrada is None or not self.aberto:
+            return None
+        som, categoria = entrada
+        _, intervalo = self.categorias[categoria]
+
+        agora = time.perf_counter()
+        if agora - self._ultimo_disparo.get(nome, float("-inf")) < intervalo:
+            return None
+        self._ultimo_disparo[nome] = agora
+
+        canal = self._canal_livre(categoria)
+        canal.play(som)
+        self._inicio[canal] = agora
+        return canal
+
+    def _canal_livre(self, categoria):
+        """Um canal parado da categoria ou, se todos tocam, o que começou antes."""
+        grupo = self._grupos[categoria]
+        for canal in grupo:
+            if not canal.get_busy():
+                return canal
+        return min(grupo, key=lambda canal: self._inicio.get(canal, 0.0))
+
+    # -------------------------------------------------------------
+    def tocar_musica(self):
+        """Recomeça a trilha em loop, se foi carregada."""
+        if self.musica_carregada:
+            pg.mixer.music.play(-1)
+
+    def parar_musica(self):
+        if self.musica_carregada:
+            pg.mixer.music.stop()
@@ -0,0 +1,69 @@
+import pygame as pg
+
+
+"""
+Passo fixo de simulação (fixed timestep) desacoplado da taxa de desenho.
+
+As velocidades das pistas estão em pixels por tick e a dificuldade foi
+ajustada para 60 ticks por segundo. A classe `PassoFixo` acumula o tempo
+real decorrido e informa quantos ticks de simulação rodar a cada quadro,
+de modo que o jogo anda na mesma velocidade a 30, 60 ou 144 quadros por
+segundo. A sobra do acumulador (`alfa`, entre 0 e 1) diz quanto do próximo
+tick já passou e é usada para interpolar as posições desenhadas.
+"""
+
+
+class PassoFixo:
+    """Acumulador de tempo real convertido em ticks de simulação.
+
+    Parâmetros:
+    - taxa: ticks de simulação por segundo
+    - max_passos: limite de ticks por quadro; em uma travada longa o jogo
+      desacelera em vez de tentar recuperar tudo de uma vez (espiral da morte)
+
+    Uso por quadro:
+        for _ in range(passo.avancar()):
+            ...  # um tick de simulação
+        desenhar(passo.alfa)
+    """
+
+    def __init__(self, taxa=60, max_passos=5):
+        self.taxa = taxa
+        self.passo_ms = 1000.0 / taxa
+        self.max_passos = max_passos
+        self.acumulado = 0.0
+        self.alfa = 0.0
+        self._ultimo = None
+
+    def reiniciar(self):
+        """Zera o acumulador e passa a medir a partir de agora.
+
+        Chamar depois de telas bloqueantes (instruções, troca de level), para
+        que o tempo parado nelas não vire ticks de simulação.
+        """
+        self.acumulado = 0.0
+        self.alfa = 0.0
+        self._ultimo = pg.time.get_ticks()
+
+    def avancar(self, agora=None):
+        """Acumula o tempo desde a última chamada e retorna quantos ticks rodar.
+
+        `agora` (ms) permite alimentar o relógio manualmente; por padrão usa
+        `pg.time.get_ticks()`. Atualiza `alfa` com a fração do tick seguinte.
+        """
+        if agora is None:
+            agora = pg.time.get_ticks()
+        if self._ultimo is None:
+            self._ultimo = agora
+        self.acumulado += agora - self._ultimo
+        self._ultimo = agora
+
+        passos = int(self.acumulado // self.passo_ms)
+        if passos > self.max_passos:
+            # Descarta o atraso excedente em vez de acumulá-lo
+            passos = self.max_passos
+            self.acumulado = 0.0
+        else:
+            self.acumulado -= passos * self.passo_ms
+        self.alfa = self.acumulado / self.passo_ms
+        return passos
@@ -1,218 +1,392 @@
 """
 Script principal do jogo Running Fox.
 
-Gerencia o loop principal, estados do jogo (menu, jogo, tela de fim),
-transições de estado, atualização de lógica, desenho de sprites e áudio.
+Monta as telas (cenas) e roda um único loop de quadros: cada quadro
+repassa os eventos à cena do topo da pilha do GameStateManager, avança a
+sua lógica (`update`) e a desenha (`draw`). O fluxo do jogo é
+menu -> instruções -> level 1 -> jogo (level 2 empilhado por cima na
+troca de fase) -> vitória/derrota -> nome -> ranking -> menu.
+
+A inicialização faz só o necessário para o primeiro quadro do menu (vídeo,
+fontes e as imagens do menu). Áudio, banco de scores, pré-carga de imagens
+e os módulos de gameplay/ranking são etapas adiadas, rodadas uma por
+quadro depois que o menu já está na tela. "--rastro-inicio" imprime o
+tempo de cada etapa (ver classes/rastro.py).
 """
 
-import pygame
-import sys
-from screens import GameStateManager, Start, End, Level, mostrar_instrucao, mostrar_tela_level, mostrar_end_screen
-from classes.game import CruzamentoFazenda
-from classes.hud import HUD
-import ranking
-from audio import init_audio
+import time
 
-# Inicializa Pygame
-pygame.init()
+INICIO = time.perf_counter()
+
+import argparse
+import pygame
+import threading
+from screens import BaseScreen, GameStateManager, ImageScreen, Start
+from classes import assets
+from classes.tempo import PassoFixo
+from classes.simulacao import TICKS_POR_SEGUNDO
+from classes.perfil import Perfilador
+from classes.rastro import RastroInicio
 
 # Constantes de tela
 SCREENWIDTH, SCREENHEIGHT = 950, 880
 FPS = 60
 
-# --- Inicializa áudio ---
-# Carrega efeitos sonoros e música (fpath = ".")
-audio = init_audio(".")
 
-# --- Estados e inicialização ---
-# STATE controla qual tela/lógica está ativa (menu, jogo, end)
-STATE = "menu"
+def _fps(valor):
+    """Tipo do argparse para --fps: inteiro >= 0."""
+    try:
+        fps = int(valor)
+    except ValueError:
+        fps = -1
+    if fps < 0:
+        raise argparse.ArgumentTypeError(f"esperado um inteiro >= 0, recebido {valor!r}")
+    return fps
+
+
+parser = argparse.ArgumentParser(description="Running Fox")
+# A simulação roda sempre a TICKS_POR_SEGUNDO ticks/s (velocidades em px/tick);
+# o gameplay é desenhado até FPS_JOGO quadros/s, interpolando entre ticks.
+# "--fps N" muda o limite (ex.: 144); "--fps 0" desenha sem limite.
+parser.add_argument("--fps", type=_fps, default=FPS, metavar="N",
+                    help=f"limite de quadros/s do gameplay (padrão {FPS}; 0 = sem limite)")
+# Toda partida é gravada em memória (semente + movimentos por tick);
+# "--gravar ARQUIVO" salva a gravação ao fim de cada partida (ver replay.py)
+parser.add_argument("--gravar", metavar="ARQUIVO",
+                    help="salva a gravação de cada partida em ARQUIVO")
+# Renderização por retângulos sujos no gameplay.
+# Útil em hardware fraco, onde copiar a tela inteira domina o tempo do quadro.
+parser.add_argument("--render-sujo", action="store_true",
+                    help="redesenha só os retângulos que mudaram")
+# Tempo de cada fase do quadro (F3 mostra/esconde o overlay a qualquer
+# momento). "--perfil ARQUIVO" já abre com o overlay visível e, ao sair,
+# salva os últimos quadros em CSV (ou o resumo em JSON, se ARQUIVO.json).
+parser.add_argument("--perfil", metavar="ARQUIVO",
+                    help="mostra o overlay de tempos e salva os quadros em ARQUIVO (.csv ou .json)")
+# Colisão exata por pixels. O teste de retângulos continua filtrando os
+# pares; as máscaras só decidem os que se tocaram. As partidas gravam a
+# assinatura das máscaras (ver replay.py).
+parser.add_argument("--colisao-pixel", action="store_true",
+                    help="colisão exata pelos pixels dos sprites")
+parser.add_argument("--rastro-inicio", action="store_true",
+                    help="imprime o tempo de cada etapa da inicialização")
+args = parser.parse_args()
+
+FPS_JOGO = args.fps
+ARQUIVO_GRAVACAO = args.gravar
+RENDER_SUJO = args.render_sujo
+ARQUIVO_PERFIL = args.perfil
+COLISAO_PIXEL = args.colisao_pixel
+
+rastro = RastroInicio(INICIO, ativo=args.rastro_inicio)
+rastro.etapa("imports (pygame, numpy, menu)")
+
+# Inicializa só vídeo e fontes; o mixer é aberto pela etapa adiada de áudio
+pygame.display.init()
+pygame.font.init()
+rastro.etapa("pygame (vídeo e fontes)")
+
+# --- Áudio ---
+# `GerenciadorAudio` criado pela etapa adiada de áudio (classes/som.py);
+# até lá, e para efeitos ainda não decodificados, os sons são pulados.
+audio = None
+
+# --- Inicialização ---
 clock = pygame.time.Clock()
 screen = pygame.display.set_mode((SCREENWIDTH, SCREENHEIGHT))
 pygame.display.set_caption("Running Fox Game")
+rastro.etapa("janela")
 
-# Gerenciador de estado e menus
+# Gerenciador de estado e pilha de telas; o menu fica sempre na base
 gsm = GameStateManager("start")
 menu_start = Start(screen, gsm)
-menu_end = End(screen, gsm)
-menu_level = Level(screen, gsm)
+gsm.push(menu_start)
+rastro.etapa("tela inicial (imagens do menu)")
+
+if RENDER_SUJO:
+    from classes.render import RenderizadorSujo
+    renderizador = RenderizadorSujo(screen)
+else:
+    renderizador = None
+passo = PassoFixo(TICKS_POR_SEGUNDO)
+perfil = Perfilador()
+perfil.visivel = ARQUIVO_PERFIL is not None
+
+
+def novo_jogo():
+    """Cria uma nova partida (já gravando os movimentos) e seu HUD.
+
+    Com o modo de retângulos sujos, jogo e HUD desenham na janela
+    rastreada do renderizador; com a colisão por pixels, o mundo recebe as
+    máscaras já calculadas pelos sprites da partida.
+    """
+    from classes.game import CruzamentoFazenda
+    from classes.hud import HUD
+    from classes.mascaras import MascarasColisao
+    from classes.replay import Gravacao, assinatura_config
+
+    novo = CruzamentoFazenda()
+    if COLISAO_PIXEL:
+        novo.mundo.mascaras = MascarasColisao.de_sprites(novo.inimigos, novo.raposa)
+    novo.mundo.gravador = Gravacao(novo.mundo.semente, assinatura_config(novo.mundo.mascaras))
+    novo.mundo.perfil = perfil
+    if renderizador:
+        novo.janela = renderizador.janela
+        renderizador.invalidar()
+    return novo, HUD(novo.janela, novo)
+
+
+def tocar(nome):
+    """Toca o efeito sonoro `nome`, se o áudio já abriu (nunca bloqueia)."""
+    if audio:
+        audio.tocar(nome)
+
+
+class GameScreen(BaseScreen):
+    """Cena do gameplay: input, ticks fixos da simulação e desenho.
+
+    A cada quadro roda quantos ticks de `PassoFixo` couberem no tempo real
+    e desenha interpolando entre ticks (até FPS_JOGO quadros/s). Ao trocar
+    de fase empilha a tela do level 2; ao terminar a partida chama
+    `fim_de_partida`.
+    """
+    fps = FPS_JOGO
+
+    def __init__(self, display, gsm):
+        super().__init__(display, gsm, None)
+        self.jogo, self.hud = novo_jogo()
+        passo.reiniciar()
+
+    def on_resume(self):
+        # O tempo parado sob outra tela não conta para a simulação
+        passo.reiniciar()
+        if renderizador:
+            renderizador.invalidar()
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        tecla = pygame.key.name(event.key)
+        self.jogo.mover_raposa(tecla)
+
+        # Toca som ao mover
+        if tecla == "up":
+            tocar("som_movimento")
+        # ESC: vai para o fim da partida
+        if tecla == "escape":
+            fim_de_partida(self.jogo, tocar_som=False)
+        # R: reinicia a fase
+        elif tecla == "r":
+            self.jogo, self.hud = novo_jogo()
+            passo.reiniciar()
+
+    def update(self, dt):
+        # Quantos ticks fixos couberem no tempo real
+        jogo = self.jogo
+        for _ in range(passo.avancar()):
+            eventos = jogo.avancar()
+            perfil.marcar("logica")
+            if jogo.vidas <= 0 or jogo.game_over:
+                fim_de_partida(jogo)
+                return
+            # Transição para a fase 2: tela do level por cima do jogo
+            if eventos["mudou_fase"]:
+                tocar("som_troca_fase")
+                self.gsm.push(ImageScreen(self.display, self.gsm, "imagens_pygame/level_2.png", 2000))
+                return
+
+    def draw(self):
+        jogo = self.jogo
+        # Renderiza jogo (só as regiões sujas, se o modo estiver ativo)
+        if renderizador:
+            renderizador.restaurar(jogo.fundo_imagem)
+        else:
+            jogo.limpar_janela()
+        perfil.marcar("fundo")
+        # Obstáculos, raposa e corações em uma única chamada a blits
+        sprites = jogo.desenho_plataformas(passo.alfa)
+        sprites.append(jogo.raposa.desenho_raposa())
+        jogo.janela.blits(self.hud.desenho_vidas(sprites), 0)
+        perfil.marcar("sprites")
+        # Cronômetro: tempo de simulação (o mesmo conferido pelo ranking)
+        self.hud.desenhar_timer(jogo.mundo.tick // TICKS_POR_SEGUNDO)
+        perfil.marcar("hud")
+
+        if renderizador:
+            # O overlay entra nos retângulos rastreados (é apagado no próximo quadro)
+            perfil.desenhar(jogo.janela)
+            perfil.marcar("perfil")
+            renderizador.atualizar()
+            perfil.marcar("display")
+            return True
+        return False
+
+
+def iniciar_partida():
+    """Menu -> instruções (20 s ou ESPAÇO) -> level 1 (2 s) -> jogo."""
+    tocar("som_start")
+
+    def mostrar_level():
+        gsm.replace(ImageScreen(screen, gsm, "imagens_pygame/level_1.png", 2000, comecar_jogo))
 
-# Instâncias principais do jogo
-jogo = CruzamentoFazenda()
-hud = HUD(jogo.janela, jogo)
+    def comecar_jogo():
+        gsm.replace(GameScreen(screen, gsm))
 
-# --- Timer ---
-# tempo_inicio: marca quando o jogo começou (para o cronômetro do HUD)
-# end_sequence_handled: flag para evitar executar a sequência de fim múltiplas vezes
-tempo_inicio = None
-end_sequence_handled = False
+    gsm.push(ImageScreen(screen, gsm, "imagens_pygame/instru.png", 20000, mostrar_level))
+
+
+def fim_de_partida(jogo, tocar_som=True):
+    """Fecha a gravação e troca o jogo pela tela de vitória/derrota."""
+    import ranking
+
+    if audio:
+        audio.parar_musica()
+    if tocar_som:
+        tocar("som_game_over")
+
+    # Fecha a gravação da partida (e salva, se pedido)
+    jogo.mundo.gravador.finalizar(jogo.mundo.tick)
+    if ARQUIVO_GRAVACAO:
+        jogo.mundo.gravador.salvar(ARQUIVO_GRAVACAO)
+
+    is_win = getattr(jogo, "reached_ovos", False)
+
+    def depois_da_imagem():
+        if is_win:
+            # Venceu: pede o nome e salva o score
+            gsm.replace(ranking.NameInputScreen(screen, gsm, salvar_score, prompt="Parabéns! Digite seu nome:"))
+        else:
+            # Perdeu: apenas mostra o ranking, sem salvar
+            gsm.replace(ranking.RankingScreen(screen, gsm, voltar_ao_menu))
+
+    def salvar_score(player_name):
+        # O tempo salvo é o da simulação (ticks), conferido pela gravação em
+        # segundo plano; o ranking destaca o jogador quando ela termina
+        tempo = jogo.mundo.tick / TICKS_POR_SEGUNDO
+        tempo_verificado = ranking.submit_score(player_name, tempo, jogo.mundo.gravador)
+        gsm.replace(ranking.RankingScreen(screen, gsm, voltar_ao_menu, player_name, tempo_verificado))
+
+    end_img_path = "imagens_pygame/win.png" if is_win else "imagens_pygame/game_over.png"
+    gsm.replace(ImageScreen(screen, gsm, end_img_path, 2500, depois_da_imagem, aviso=False))
+
+
+def voltar_ao_menu():
+    """Ranking -> menu inicial, com a música de volta."""
+    gsm.pop_to_root()
+    gsm.set_state("start")
+    if audio:
+        audio.tocar_musica()
+
+
+# Start muda o estado para 'level' (botão ou ESPAÇO): começa a partida
+gsm.on_state("level", iniciar_partida)
+
+# --- Etapas adiadas ---
+# Rodam uma por quadro a partir do primeiro quadro do menu.
+# Telas de instrução/level/fim/ranking, o fundo da fase 2 e os sprites da
+# partida são decodificados em uma thread enquanto o menu anima; assim não
+# há travadas ao exibi-los (principalmente ao começar a partida e na troca
+# de fase durante o jogo).
+IMAGENS_PRECARREGADAS = [
+    ("imagens_pygame/instru.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/level_1.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/fundo_fazenda.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/level_2.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/fundo_fazenda_2.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/win.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/game_over.png", (SCREENWIDTH, SCREENHEIGHT), False),
+    ("imagens_pygame/ranking.png", (SCREENWIDTH, SCREENHEIGHT), False),
+]
+
+
+def em_segundo_plano(nome, funcao, *args):
+    """Roda `funcao(*args)` em uma thread de fundo, anotando a duração no rastro."""
+    def trabalho():
+        inicio = time.perf_counter()
+        funcao(*args)
+        rastro.registrar(nome, time.perf_counter() - inicio)
+    threading.Thread(target=trabalho, daemon=True).start()
+
+
+def iniciar_audio():
+    """Abre o mixer e toca a música; os efeitos são decodificados em uma thread."""
+    global audio
+    from audio import init_audio, carregar_efeitos
+
+    audio = init_audio(".", efeitos=False)
+    em_segundo_plano("efeitos sonoros", carregar_efeitos, audio, ".")
+
+
+def iniciar_placar():
+    """Abre o banco de scores e lê o topo do ranking em segundo plano."""
+    import ranking
+    ranking.placar()
+
+
+def iniciar_precarga():
+    """Decodifica em segundo plano as telas e os sprites da partida."""
+    from classes.enemies import imagens_inimigos
+    from classes.player import imagens_raposa
+
+    thread = assets.precarregar(IMAGENS_PRECARREGADAS + imagens_inimigos() + imagens_raposa())
+    if thread:
+        em_segundo_plano("pré-carga de imagens", thread.join)
+
+
+def carregar_partida():
+    """Importa os módulos da partida e do ranking e abre o banco de scores."""
+    import classes.game
+    import classes.hud
+    import classes.replay
+    iniciar_placar()
+
+
+# Importar o ranking e os módulos da partida e abrir o banco levam dezenas
+# de ms: vão para uma thread, sem segurar quadros do menu.
+ADIADAS = [
+    ("áudio (mixer e música)", iniciar_audio),
+    ("pré-carga de imagens", iniciar_precarga),
+    ("placar e módulos (thread)", em_segundo_plano, "placar e módulos da partida", carregar_partida),
+]
 
 # --- Loop principal ---
-# Processa eventos e atualiza o estado do jogo continuamente
-while True:
+# Único loop do jogo: eventos, lógica e desenho da cena do topo
+dt = 0
+primeiro_quadro = True
+perfil.reiniciar()
+while gsm.running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-        # --- Estado: MENU ---
-        # Tela inicial; permite transição para "jogo" quando jogador pressiona start
-        if STATE == "menu":
-            menu_start.handle_event(event)
-            if gsm.get_state() == "level":
-                # Toca som de início
-                if audio["som_start"]:
-                    audio["som_start"].play()
-
-                # Mostra telas de instrução e nível antes de iniciar
-                tempo_inicio = pygame.time.get_ticks()
-                mostrar_instrucao(screen, clock, "imagens_pygame/instru.png", 20000)
-                mostrar_tela_level(screen, clock, "imagens_pygame/level_1.png", 2000)
-                tempo_inicio = pygame.time.get_ticks()
-                STATE = "jogo"
-                end_sequence_handled = False
-
-        # --- Estado: END (Tela de Fim) ---
-        # Mostra resultado (vitória/derrota) e ranking; permite voltar ao menu
-        elif STATE == "end":
-            menu_end.handle_event(event)
-            if gsm.get_state() == "start":
-                # Reinicia o jogo quando volta ao menu
-                jogo = CruzamentoFazenda()
-                hud = HUD(jogo.janela, jogo)
-                tempo_inicio = None
-                STATE = "menu"
-                if audio["musica_loaded"]:
-                    pygame.mixer.music.play(-1)
-                end_sequence_handled = False
-
-        # --- Estado: JOGO ---
-        # Loop de gameplay; processa input do jogador
-        elif STATE == "jogo":
-            if event.type == pygame.KEYDOWN:
-                tecla = pygame.key.name(event.key)
-                jogo.raposa.mover_raposa(tecla)
-
-                # Toca som ao mover
-                if tecla == "up" and audio["som_movimento"]:
-                    audio["som_movimento"].play()
-
-                # ESC: vai para tela de fim
-                if tecla == "escape":
-                    STATE = "end"
-                # R: reinicia a fase
-                if tecla == "r":
-                    jogo = CruzamentoFazenda()
-                    hud = HUD(jogo.janela, jogo)
-                    tempo_inicio = pygame.time.get_ticks()
-
-    # --- Atualização de telas ---
-    # Renderiza a tela apropriada baseada no estado atual
-    
-    if STATE == "menu":
-        # Desenha menu inicial
-        menu_start.run()
-
-    elif STATE == "jogo":
-        # Atualiza lógica de jogo
-        jogo.relogio.tick(FPS)
-        jogo.atualizar_plataformas()
-        jogo.checar_colisoes_e_reagir()
-        
-        # Renderiza jogo
-        jogo.limpar_janela()
-        jogo.desenhar_plataformas()
-        jogo.raposa.desenhar_raposa(jogo.janela)
-        hud.desenhar_vidas()
-
-        # Desenha cronômetro
-        if tempo_inicio is not None:
-            tempo_decorrido = (pygame.time.get_ticks() - tempo_inicio) // 1000
-            hud.desenhar_timer(tempo_decorrido)
-
-        # Checa se perdeu ou venceu e vai para tela de fim
-        if jogo.vidas <= 0 or jogo.game_over:
-            pygame.mixer.music.stop()
-            if audio["som_game_over"]:
-                canal = pygame.mixer.find_channel()
-                if canal:
-                    canal.play(audio["som_game_over"])
-                else:
-                    audio["som_game_over"].play()
-            STATE = "end"
-
-        # Transição para fase 2 se completou fase 1
-        if jogo.fases.fase == 2 and not hasattr(jogo, "level2_shown"):
-            if audio["som_troca_fase"]:
-                audio["som_troca_fase"].play()
-            mostrar_tela_level(screen, clock, "imagens_pygame/level_2.png", 2000)
-            jogo.level2_shown = True
-
-    elif STATE == "end":
-        # Tela de fim: mostra vitória/derrota e ranking
-        if not end_sequence_handled:
-            # Define qual imagem de fim exibir (vitória ou derrota)
-            is_win = getattr(jogo, "reached_ovos", False)
-            end_img_path = "imagens_pygame/win.png" if is_win else "imagens_pygame/game_over.png"
-            mostrar_end_screen(screen, end_img_path)
-
-            # Calcula tempo decorrido
-            if tempo_inicio is not None:
-                elapsed_seconds = (pygame.time.get_ticks() - tempo_inicio) / 1000.0
-            else:
-                elapsed_seconds = 0.0
-
-            # Se venceu: pede nome e salva score
-            if is_win:
-                player_name = ranking.text_input_screen(
-                    screen,
-                    prompt="Parabéns! Digite seu nome:",
-                    bg_path="imagens_pygame/ranking.png"
-                )
-                if not player_name:
-                    player_name = "Player"
-
-                ranking.add_score(player_name, elapsed_seconds)
-                result = ranking.show_ranking_screen(
-                    screen,
-                    player_name=player_name,
-                    player_time=elapsed_seconds,
-                    bg_path="imagens_pygame/ranking.png"
-                )
-                # Se escolher restart, volta ao menu
-                if result == 'restart':
-                    jogo = CruzamentoFazenda()
-                    hud = HUD(jogo.janela, jogo)
-                    tempo_inicio = None
-                    STATE = "menu"
-                    if audio["musica_loaded"]:
-                        pygame.mixer.music.play(-1)
-                    end_sequence_handled = False
-                    continue
-            else:
-                # Se perdeu: apenas mostra ranking sem salvar
-                result = ranking.show_ranking_screen(
-                    screen,
-                    player_name=None,
-                    player_time=None,
-                    bg_path="imagens_pygame/ranking.png"
-                )
-                # Se escolher restart, volta ao menu
-                if result == 'restart':
-                    jogo = CruzamentoFazenda()
-                    hud = HUD(jogo.janela, jogo)
-                    tempo_inicio = None
-                    STATE = "menu"
-                    if audio["musica_loaded"]:
-                        pygame.mixer.music.play(-1)
-                    end_sequence_handled = False
-                    continue
-
-            end_sequence_handled = True
-
-        # Desenha menu de fim
-        menu_end.run()
-
-    # Atualiza display e tick do relógio
-    pygame.display.update()
-    clock.tick(FPS)
\ No newline at end of file
+            gsm.quit()
+            break
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            perfil.alternar()
+            continue
+        gsm.handle_event(event)
+    perfil.marcar("eventos")
+
+    gsm.update(dt)
+    perfil.marcar("logica")
+
+    # Cenas que já enviaram os retângulos sujos ao display retornam True
+    if gsm.running and not gsm.draw():
+        perfil.marcar("desenho")
+        perfil.desenhar(screen)
+        perfil.marcar("perfil")
+        pygame.display.update()
+        perfil.marcar("display")
+    # Limite de quadros da cena do topo (no gameplay é FPS_JOGO)
+    if primeiro_quadro:
+        rastro.etapa("primeiro quadro")
+        rastro.imprimir()
+        primeiro_quadro = False
+    elif ADIADAS:
+        rastro.medir(*ADIADAS.pop(0))
+    dt = clock.tick(gsm.fps())
+    perfil.fim_quadro()
+
+pygame.quit()
+
+if ARQUIVO_PERFIL:
+    perfil.salvar(ARQUIVO_PERFIL)
+    print(f"⏱️ Perfil de {perfil.quadros} quadros salvo em {ARQUIVO_PERFIL}")
@@ -1,143 +1,244 @@
+from concurrent.futures import Future
 from pathlib import Path
-import json
+import atexit
 import pygame
+from classes.assets import carregar_fonte
+from classes.placar import Placar, PlacarAssincrono
+from classes.replay import Gravacao, verificar, verificar_lote
+from screens import BaseScreen
 
 
 # CÓDIGO GERADO PELO CHAT GPT
 
-# Arquivo para salvar scores (Path)
+# Banco dos scores (SQLite, ver classes/placar.py) e o JSON do formato
+# antigo, importado automaticamente na criação do banco
+SCORES_DB = Path("scores.db")
 SCORES_FILE = Path("scores.json")
 
-def ensure_scores_file():
-    """Garante que o arquivo exista (cria vazio se não existir)."""
-    if not SCORES_FILE.exists():
-        SCORES_FILE.write_text("[]", encoding="utf-8")  # inicializa com lista vazia
-
-def load_scores():
-    """Carrega scores do arquivo JSON. Se arquivo vazio/inválido, retorna []"""
-    ensure_scores_file()
-    try:
-        text = SCORES_FILE.read_text(encoding="utf-8").strip()
-        if not text:
-            return []
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Se estiver corrompido, reescreve como lista vazia e retorna []
-        SCORES_FILE.write_text("[]", encoding="utf-8")
-        return []
-
-def save_scores(scores):
-    """Salva scores no arquivo JSON, limitado a 10 entradas."""
-    # Garantir que seja lista e ordenar
-    if not isinstance(scores, list):
-        scores = list(scores)
-    scores.sort(key=lambda x: x.get("time", float("inf")))  # Ordena por tempo (menor primeiro)
-    scores = scores[:10]  # Limite a top 10
-    SCORES_FILE.write_text(json.dumps(scores, ensure_ascii=False, indent=4), encoding="utf-8")
-
-def add_score(name, time):
-    """Adiciona um score (name: str, time: float)."""
-    scores = load_scores()
-    try:
-        time_val = float(time)
-    except (ValueError, TypeError):
-        time_val = 0.0
-    scores.append({"name": str(name), "time": time_val})
-    save_scores(scores)
-
-# --- As funções de interface visual (mantive seu código, só troquei a leitura de imagem se quiser) ---
-
-def text_input_screen(screen, prompt="Digite seu nome:", bg_path="imagens_pygame/ranking.png"):
-    SCREENWIDTH, SCREENHEIGHT = screen.get_width(), screen.get_height()
-    font = pygame.font.SysFont(None, 48)
-    input_font = pygame.font.SysFont(None, 36)
-    hint_font = pygame.font.SysFont(None, 28)
-    text = ""
-    clock = pygame.time.Clock()
-    running = True
-
-    # Carrega fundo — se o caminho for relativo, é recomendado usar Path(__file__).parent / 'imagens...' no main
-    bg = pygame.image.load(bg_path).convert()
-    bg = pygame.transform.scale(bg, (SCREENWIDTH, SCREENHEIGHT))
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN and text.strip():
-                    return text.strip()
-                elif event.key == pygame.K_BACKSPACE:
-                    text = text[:-1]
-                else:
-                    if len(text) < 20:
-                        text += event.unicode
-
-        screen.blit(bg, (0, 0))
-        prompt_surf = font.render(prompt, True, (255, 255, 255))
-        prompt_rect = prompt_surf.get_rect(center=(SCREENWIDTH // 2, 200))
-        screen.blit(prompt_surf, prompt_rect)
-
-        text_surf = input_font.render(text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=(SCREENWIDTH // 2, 300))
-        screen.blit(text_surf, text_rect)
-
-        hint_surf = hint_font.render("Aperte ENTER para ver ranking", True, (255, 255, 255))
-        hint_rect = hint_surf.get_rect(center=(SCREENWIDTH // 2, 780))
-        screen.blit(hint_surf, hint_rect)
-
-        pygame.display.flip()
-        clock.tick(30)
-
-    return ""
-
-def show_ranking_screen(screen, player_name=None, player_time=None, bg_path="imagens_pygame/ranking.png"):
-    SCREENWIDTH, SCREENHEIGHT = screen.get_width(), screen.get_height()
-    font_normal = pygame.font.SysFont(None, 36)
-    font_player = pygame.font.SysFont(None, 50)
-    font_title = pygame.font.SysFont(None, 75)
-    clock = pygame.time.Clock()
-    scores = load_scores()
-    running = True
-
-    bg = pygame.image.load(bg_path).convert()
-    bg = pygame.transform.scale(bg, (SCREENWIDTH, SCREENHEIGHT))
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    return 'restart'
-                elif event.key == pygame.K_q:
-                    pygame.quit()
-                    exit()
-
-        screen.blit(bg, (0, 0))
-
-        title = font_title.render("RANKING", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(SCREENWIDTH // 2, 70))
-        screen.blit(title, title_rect)
-
-        y = 200
-        for i, score in enumerate(scores[:10], 1):
-            minutos = int(score["time"] // 60)
-            segundos = int(score["time"] % 60)
-            text = f"{i}. {score['name']} - {minutos:02}:{segundos:02}"
-            is_player = player_name and score["name"] == player_name and score["time"] == player_time
-            surf = font_player.render(text, True, (255, 255, 255)) if is_player else font_normal.render(text, True, (255, 255, 255))
-            rect = surf.get_rect(center=(SCREENWIDTH // 2, y))
-            screen.blit(surf, rect)
-            y += 50 if is_player else 40
-
-        instructions = font_normal.render("Pressione R para reiniciar ou Q para sair", True, (255, 255, 255))
-        instr_rect = instructions.get_rect(center=(SCREENWIDTH // 2, 780))
-        screen.blit(instructions, instr_rect)
-
-        pygame.display.flip()
-        clock.tick(30)
-
-    return None
+# Quantos scores do topo ficam em memória para a tela de ranking
+TOP_MEMORIA = 100
+
+_placar = None
+_leitor = None
+
+def placar():
+    """Retorna o `PlacarAssincrono` do processo, criando-o na primeira chamada.
+
+    A thread escritora abre o banco e lê o topo do ranking em segundo plano;
+    ao sair do programa, os scores pendentes são gravados (atexit).
+    """
+    global _placar
+    if _placar is None:
+        _placar = PlacarAssincrono(SCORES_DB, json_antigo=SCORES_FILE, tamanho_memoria=TOP_MEMORIA)
+        atexit.register(flush_scores)
+    return _placar
+
+def leitor():
+    """Retorna um `Placar` síncrono (consultas fora do topo em memória, verificação)."""
+    global _leitor
+    if _leitor is None:
+        _leitor = Placar(SCORES_DB, json_antigo=SCORES_FILE)
+    return _leitor
+
+def flush_scores(timeout=10.0):
+    """Grava os scores pendentes e encerra a thread escritora."""
+    if _placar is not None:
+        _placar.fechar(timeout)
+
+def load_scores(limit=10, page=0):
+    """Retorna uma página do ranking (padrão: top 10) como [{"name", "time"}].
+
+    Páginas dentro do topo em memória não acessam o disco.
+    """
+    if (page + 1) * limit <= TOP_MEMORIA:
+        return placar().top((page + 1) * limit)[page * limit:]
+    return leitor().top(limit, page)
+
+def rank_of(time):
+    """Posição (1 = primeiro) que um score com `time` ocupa no ranking, em O(log n)."""
+    return placar().posicao(time)
+
+def add_score(name, time, gravacao=None):
+    """Adiciona um score (name: str, time: float) e retorna o tempo salvo.
+
+    Com `gravacao` (a `Gravacao` da partida ou seus bytes), o `time`
+    informado é ignorado: a partida é refeita e só o tempo calculado pela
+    simulação é aceito, salvo junto com a gravação para novas verificações.
+    Gravação inválida ou sem vitória -> score recusado (retorna None).
+
+    Espera a conferência terminar; telas do jogo usam `submit_score`.
+    """
+    return submit_score(name, time, gravacao).result()
+
+def submit_score(name, time, gravacao=None):
+    """Como `add_score`, sem esperar: retorna um `Future` com o tempo salvo (ou None).
+
+    A partida da gravação é refeita na thread escritora do placar (com as
+    máscaras de pixels, se a gravação pedir), longe do loop de quadros.
+    """
+    if gravacao is None:
+        try:
+            time_val = float(time)
+        except (ValueError, TypeError):
+            time_val = 0.0
+        # Entra na hora no ranking em memória; o disco fica com a thread escritora
+        placar().adicionar(name, time_val)
+        futuro = Future()
+        futuro.set_result(time_val)
+        return futuro
+
+    if isinstance(gravacao, (bytes, bytearray)):
+        gravacao = Gravacao.de_bytes(gravacao)
+
+    def conferir():
+        time_val = verificar(gravacao)
+        if time_val is None:
+            print(f"⚠️ Score de {name} recusado: a gravação não confirma a vitória")
+        return time_val
+
+    return placar().adicionar_conferido(name, conferir, gravacao.para_bytes())
+
+def verify_scores():
+    """Refaz em lote as gravações dos scores e retorna os que não conferem.
+
+    Scores sem gravação (antigos) são ignorados. Um score não confere se a
+    gravação é inválida, não vence, ou dá um tempo diferente do salvo.
+    Retorna uma lista de {"id", "name", "time"}.
+    """
+    recusados = []
+    # Confere o que já está no banco, inclusive scores ainda na fila de gravação
+    placar().descarregar()
+    for bloco in leitor().com_replay():
+        gravacoes = []
+        for id_, nome, tempo, replay in bloco:
+            try:
+                gravacoes.append(Gravacao.de_bytes(replay))
+            except ValueError:
+                recusados.append({"id": id_, "name": nome, "time": tempo})
+                gravacoes.append(None)
+        tempos = iter(verificar_lote([g for g in gravacoes if g is not None]))
+        for (id_, nome, tempo, _), g in zip(bloco, gravacoes):
+            if g is not None and next(tempos) != tempo:
+                recusados.append({"id": id_, "name": nome, "time": tempo})
+    return recusados
+
+# --- Telas (cenas) de nome e ranking, desenhadas pelo loop único de main.py ---
+
+class NameInputScreen(BaseScreen):
+    """Cena de digitação do nome do jogador (após vencer).
+
+    ENTER com um nome não vazio chama `ao_confirmar(nome)`; o nome só é
+    renderizado de novo quando muda.
+    """
+    def __init__(self, display, gsm, ao_confirmar, prompt="Digite seu nome:", bg_path="imagens_pygame/ranking.png"):
+        super().__init__(display, gsm, bg_path)
+        largura = display.get_width()
+        self.ao_confirmar = ao_confirmar
+        self.text = ""
+        self.input_font = carregar_fonte(36)
+        self.prompt = carregar_fonte(48).render(prompt, True, (255, 255, 255))
+        self.prompt_rect = self.prompt.get_rect(center=(largura // 2, 200))
+        self.hint = carregar_fonte(28).render("Aperte ENTER para ver ranking", True, (255, 255, 255))
+        self.hint_rect = self.hint.get_rect(center=(largura // 2, 780))
+        self._renderizar_texto()
+
+    def _renderizar_texto(self):
+        self.text_surf = self.input_font.render(self.text, True, (255, 255, 255))
+        self.text_rect = self.text_surf.get_rect(center=(self.display.get_width() // 2, 300))
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_RETURN:
+            if self.text.strip():
+                self.ao_confirmar(self.text.strip())
+            return
+        if event.key == pygame.K_BACKSPACE:
+            self.text = self.text[:-1]
+        elif len(self.text) < 20:
+            self.text += event.unicode
+        self._renderizar_texto()
+
+    def run(self):
+        self.display.blit(self.bg, (0, 0))
+        self.display.blit(self.prompt, self.prompt_rect)
+        self.display.blit(self.text_surf, self.text_rect)
+        self.display.blit(self.hint, self.hint_rect)
+
+# Linhas do ranking já renderizadas: (chave, [(surface, rect), ...]).
+# A chave inclui a versão do ranking em memória; só é refeita quando ele muda.
+_linhas_cache = (None, [])
+
+def _linhas_ranking(largura, player_name, player_time):
+    """Retorna as superfícies/posições das linhas do top 10, via cache."""
+    global _linhas_cache
+    chave = (placar().versao(), largura, player_name, player_time)
+    if _linhas_cache[0] == chave:
+        return _linhas_cache[1]
+
+    font_normal = carregar_fonte(36)
+    font_player = carregar_fonte(50)
+    linhas = []
+    y = 200
+    for i, score in enumerate(load_scores(10), 1):
+        minutos = int(score["time"] // 60)
+        segundos = int(score["time"] % 60)
+        text = f"{i}. {score['name']} - {minutos:02}:{segundos:02}"
+        is_player = player_name and score["name"] == player_name and score["time"] == player_time
+        surf = font_player.render(text, True, (255, 255, 255)) if is_player else font_normal.render(text, True, (255, 255, 255))
+        linhas.append((surf, surf.get_rect(center=(largura // 2, y))))
+        y += 50 if is_player else 40
+
+    # Posição do jogador no ranking completo (pode estar fora do top 10)
+    if player_time is not None:
+        surf = font_normal.render(f"Sua posição: {rank_of(player_time)}º de {len(placar().indice)}", True, (255, 255, 255))
+        linhas.append((surf, surf.get_rect(center=(largura // 2, y + 30))))
+
+    _linhas_cache = (chave, linhas)
+    return linhas
+
+class RankingScreen(BaseScreen):
+    """Cena do ranking: top 10, posição do jogador e R/Q.
+
+    R chama `ao_reiniciar()` (voltar ao menu); Q encerra o jogo.
+    `player_time` pode ser o `Future` de `submit_score`: o destaque e a
+    posição do jogador aparecem quando a conferência termina.
+    """
+    def __init__(self, display, gsm, ao_reiniciar, player_name=None, player_time=None, bg_path="imagens_pygame/ranking.png"):
+        super().__init__(display, gsm, bg_path)
+        largura = display.get_width()
+        self.ao_reiniciar = ao_reiniciar
+        self.player_name = player_name
+        self.player_time = player_time
+        self._conferencia = None
+        if isinstance(player_time, Future):
+            self.player_time = None
+            self._conferencia = player_time
+
+        # Traz scores novos de outras máquinas (em segundo plano)
+        placar().sincronizar()
+
+        self.title = carregar_fonte(75).render("RANKING", True, (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(largura // 2, 70))
+        self.instructions = carregar_fonte(36).render("Pressione R para reiniciar ou Q para sair", True, (255, 255, 255))
+        self.instr_rect = self.instructions.get_rect(center=(largura // 2, 780))
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                self.ao_reiniciar()
+            elif event.key == pygame.K_q:
+                self.gsm.quit()
+
+    def run(self):
+        if self._conferencia is not None and self._conferencia.done():
+            try:
+                self.player_time = self._conferencia.result()
+            except Exception as e:
+                print("⚠️ Falha ao conferir o score:", e)
+            self._conferencia = None
+        self.display.blit(self.bg, (0, 0))
+        self.display.blit(self.title, self.title_rect)
+        for surf, rect in _linhas_ranking(self.display.get_width(), self.player_name, self.player_time):
+            self.display.blit(surf, rect)
+        self.display.blit(self.instructions, self.instr_rect)
@@ -0,0 +1,102 @@
+"""
+Reproduz uma partida gravada do Running Fox.
+
+Sem opções, refaz a partida sem janela na velocidade máxima e mostra o
+resultado (fase, vidas, vitória e tempo de jogo em ticks/segundos). Com
+--render abre a janela e exibe o replay em tempo real (60 ticks/s).
+
+Com --verificar, refaz em lote várias gravações e mostra o tempo aceito
+de cada uma (ou RECUSADA), como faz o ranking; sem arquivos, verifica
+os scores salvos no banco (scores.db).
+
+As gravações são geradas com "python main.py --gravar ARQUIVO".
+
+Uso: python replay.py ARQUIVO [--render]
+     python replay.py --verificar [ARQUIVO ...]
+"""
+import argparse
+import sys
+import time
+
+import pygame
+
+from classes.replay import Gravacao, reproduzir, verificar_lote
+from classes.simulacao import TICKS_POR_SEGUNDO
+
+
+def assistir(gravacao):
+    """Desenha o replay em uma janela, tick a tick, a 60 quadros/s."""
+    from classes.game import CruzamentoFazenda
+    from classes.hud import HUD
+
+    pygame.init()
+    jogo = CruzamentoFazenda(gravacao.semente)
+    hud = HUD(jogo.janela, jogo)
+    relogio = pygame.time.Clock()
+
+    def desenhar(jogo):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        jogo.limpar_janela()
+        jogo.desenhar_plataformas()
+        jogo.raposa.desenhar_raposa(jogo.janela)
+        hud.desenhar_vidas()
+        hud.desenhar_timer(jogo.mundo.tick // TICKS_POR_SEGUNDO)
+        pygame.display.update()
+        relogio.tick(TICKS_POR_SEGUNDO)
+
+    return reproduzir(gravacao, jogo, desenhar).mundo
+
+
+def verificar_arquivos(caminhos):
+    """Verifica em lote as gravações (ou os scores salvos, se não houver)."""
+    inicio = time.perf_counter()
+    if not caminhos:
+        import ranking
+        recusados = ranking.verify_scores()
+        for score in recusados:
+            print(f"❌ {score['name']} - {score['time']}: não confere com a gravação")
+        print(f"{len(recusados)} score(s) não conferem")
+    else:
+        tempos = verificar_lote([Gravacao.carregar(c) for c in caminhos])
+        for caminho, tempo in zip(caminhos, tempos):
+            print(f"{caminho}: {'RECUSADA' if tempo is None else f'{tempo:.3f} s'}")
+    print(f"Verificado em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    return 0
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("arquivos", nargs="*", metavar="ARQUIVO", help="gravações (.rfox)")
+    parser.add_argument("--render", action="store_true", help="exibe o replay em uma janela")
+    parser.add_argument("--verificar", action="store_true",
+                        help="verifica em lote os arquivos (ou os scores do banco)")
+    args = parser.parse_args(argv)
+    if args.verificar:
+        if args.render:
+            parser.error("--render não combina com --verificar")
+        return verificar_arquivos(args.arquivos)
+    if len(args.arquivos) != 1:
+        parser.error("informe um ARQUIVO de gravação (ou use --verificar)")
+    gravacao = Gravacao.carregar(args.arquivos[0])
+
+    inicio = time.perf_counter()
+    if args.render:
+        mundo = assistir(gravacao)
+    else:
+        mundo = reproduzir(gravacao)
+    duracao = time.perf_counter() - inicio
+
+    print(f"Semente: {gravacao.semente}  movimentos: {len(gravacao.eventos)}")
+    print(f"Fase: {mundo.fases.fase}  vidas: {mundo.vidas}  venceu: {mundo.reached_ovos}")
+    print(f"Tempo de jogo: {mundo.tick} ticks ({mundo.tick / TICKS_POR_SEGUNDO:.2f} s)")
+    print(f"Simulado em {duracao * 1000:.1f} ms ({mundo.tick / max(duracao, 1e-9):.0f} ticks/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))